@@ -0,0 +1,216 @@
+"""Throughput and scaling benchmark of the registered evolutionary algorithms.
+
+Every algorithm is swept over num_dims and population sizes. For each configuration,
+the script measures the compile time of `run`, the steady-state number of generations
+per second, the size of the algorithm state and the peak memory of the compiled `run`,
+and appends one JSON line to the output file.
+
+BBOB problems store d x d rotation matrices, so above --max_bbob_dims the benchmark
+falls back to a separable sphere problem with O(d) memory. Configurations whose
+algorithm state exceeds --max_state_bytes are recorded as skipped instead of run, so
+O(d^2) state blowups are visible without running out of memory.
+
+Usage:
+    python benchmarks/benchmark_algorithms.py --algorithms CMA_ES Sep_CMA_ES \
+        --num_dims 10 1000 100000 --population_sizes 16 256
+"""
+
+import argparse
+import json
+import platform
+import time
+import traceback
+from functools import partial
+
+import jax
+import jax.numpy as jnp
+from evosax.algorithms import algorithms
+from evosax.algorithms.population_based import population_based_algorithms
+from evosax.problems import BBOBProblem, Problem
+from evosax.problems.problem import State
+
+
+class SphereProblem(Problem):
+    """Separable sphere problem with O(d) memory for large num_dims."""
+
+    def __init__(self, num_dims: int):
+        """Initialize sphere problem."""
+        self._num_dims = num_dims
+
+    @partial(jax.jit, static_argnames=("self",))
+    def eval(self, key: jax.Array, solutions: jax.Array, state: State):
+        """Evaluate a batch of solutions."""
+        fitness = jnp.sum(solutions**2, axis=-1)
+        return fitness, state.replace(counter=state.counter + 1), {}
+
+    @partial(jax.jit, static_argnames=("self",))
+    def sample(self, key: jax.Array) -> jax.Array:
+        """Sample a solution in the search space."""
+        return jax.random.uniform(key, (self._num_dims,), minval=-5.0, maxval=5.0)
+
+
+def make_problem(num_dims: int, max_bbob_dims: int) -> Problem:
+    """Return BBOB sphere problem, or a separable sphere problem for large num_dims."""
+    if num_dims <= max_bbob_dims:
+        return BBOBProblem(fn_name="sphere", num_dims=num_dims, seed=0)
+    return SphereProblem(num_dims)
+
+
+def make_algorithm(name: str, population_size: int, solution, problem):
+    """Instantiate algorithm and return it with the arguments of its init."""
+    AlgorithmClass = algorithms[name]
+    if name == "RandomSearch":
+        return AlgorithmClass(
+            population_size=population_size,
+            solution=solution,
+            sampling_fn=problem.sample,
+        )
+    if name in ["SV_CMA_ES", "SV_Open_ES"]:
+        return AlgorithmClass(
+            population_size=population_size // 2,
+            num_populations=2,
+            solution=solution,
+        )
+    return AlgorithmClass(population_size=population_size, solution=solution)
+
+
+def make_init_args(name: str, algo, key: jax.Array, problem, problem_state) -> tuple:
+    """Return the arguments of `algo.init` between key and params."""
+    if name in population_based_algorithms:
+        population = jax.vmap(problem.sample)(
+            jax.random.split(key, algo.population_size)
+        )
+        fitness, _, _ = problem.eval(key, population, problem_state)
+        return population, fitness
+    if name in ["SV_CMA_ES", "SV_Open_ES"]:
+        return (jax.vmap(problem.sample)(jax.random.split(key, 2)),)
+    return (problem.sample(key),)
+
+
+def tree_bytes(tree) -> int:
+    """Return the number of bytes of the leaves of a PyTree of shapes."""
+    return sum(x.size * x.dtype.itemsize for x in jax.tree.leaves(tree))
+
+
+def peak_memory(compiled) -> int | None:
+    """Return the peak device memory of the compiled executable, or None.
+
+    Computed from the memory analysis of the executable rather than the device memory
+    stats, which are a high-water mark of the whole process across configurations.
+    """
+    analysis = compiled.memory_analysis()
+    if analysis is None:
+        return None
+    return (
+        analysis.argument_size_in_bytes
+        + analysis.output_size_in_bytes
+        + analysis.temp_size_in_bytes
+        - analysis.alias_size_in_bytes
+    )
+
+
+def benchmark(
+    name: str,
+    num_dims: int,
+    population_size: int,
+    num_generations: int,
+    num_repeats: int,
+    max_state_bytes: int,
+    max_bbob_dims: int,
+) -> dict:
+    """Benchmark one configuration and return its record."""
+    key = jax.random.key(0)
+    problem = make_problem(num_dims, max_bbob_dims)
+    solution = problem.sample(key)
+    algo = make_algorithm(name, population_size, solution, problem)
+    params = algo.default_params
+
+    problem_state = problem.init(key)
+    init_args = make_init_args(name, algo, key, problem, problem_state)
+
+    record = {
+        "problem": type(problem).__name__,
+        "state_bytes": tree_bytes(jax.eval_shape(algo.init, key, *init_args, params)),
+    }
+    if record["state_bytes"] > max_state_bytes:
+        return record | {"status": "skipped"}
+
+    state = algo.init(key, *init_args, params)
+
+    start = time.perf_counter()
+    compiled = (
+        type(algo)
+        .run.lower(algo, key, state, params, problem, problem_state, num_generations)
+        .compile()
+    )
+    record["compile_time"] = time.perf_counter() - start
+
+    # Warm up, then time the steady state
+    jax.block_until_ready(compiled(key, state, params, problem_state))
+    times = []
+    for _ in range(num_repeats):
+        key, subkey = jax.random.split(key)
+        start = time.perf_counter()
+        jax.block_until_ready(compiled(subkey, state, params, problem_state))
+        times.append(time.perf_counter() - start)
+
+    return record | {
+        "status": "ok",
+        "generations_per_second": num_generations / min(times),
+        "peak_memory_bytes": peak_memory(compiled),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--algorithms", nargs="+", default=list(algorithms))
+    parser.add_argument(
+        "--num_dims", nargs="+", type=int, default=[10, 100, 1_000, 10_000, 1_000_000]
+    )
+    parser.add_argument("--population_sizes", nargs="+", type=int, default=[16, 256])
+    parser.add_argument("--num_generations", type=int, default=100)
+    parser.add_argument("--num_repeats", type=int, default=3)
+    parser.add_argument("--max_state_bytes", type=int, default=2**30)
+    parser.add_argument("--max_bbob_dims", type=int, default=1_000)
+    parser.add_argument("--output", default="benchmark_results.jsonl")
+    args = parser.parse_args()
+
+    environment = {
+        "backend": jax.default_backend(),
+        "device": jax.devices()[0].device_kind,
+        "jax_version": jax.__version__,
+        "python_version": platform.python_version(),
+    }
+
+    with open(args.output, "a") as f:
+        for name in args.algorithms:
+            for num_dims in args.num_dims:
+                for population_size in args.population_sizes:
+                    config = {
+                        "algorithm": name,
+                        "num_dims": num_dims,
+                        "population_size": population_size,
+                        "num_generations": args.num_generations,
+                    }
+                    try:
+                        result = benchmark(
+                            name,
+                            num_dims,
+                            population_size,
+                            args.num_generations,
+                            args.num_repeats,
+                            args.max_state_bytes,
+                            args.max_bbob_dims,
+                        )
+                    except Exception as e:
+                        traceback.print_exc()
+                        result = {"status": "error", "error": repr(e)}
+
+                    record = config | result | environment
+                    print(json.dumps(record))
+                    f.write(json.dumps(record) + "\n")
+                    f.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -15,47 +15,104 @@ organized into two main categories:
 
 # ruff: noqa: F401
 
-# Distribution-based algorithms
+from typing import TYPE_CHECKING
+
+from evosax.core.lazy import lazy_getattr
+
 from .distribution_based import distribution_based_algorithms
-from .distribution_based.ars import ARS
-from .distribution_based.asebo import ASEBO
-from .distribution_based.cma_es import CMA_ES
-from .distribution_based.cr_fm_nes import CR_FM_NES
-from .distribution_based.discovered_es import DiscoveredES
-from .distribution_based.esmc import ESMC
-from .distribution_based.evotf_es import EvoTF_ES
-from .distribution_based.gradientless_descent import GradientlessDescent
-from .distribution_based.guided_es import GuidedES
-from .distribution_based.hill_climbing import HillClimbing
-from .distribution_based.iamalgam_full import iAMaLGaM_Full
-from .distribution_based.iamalgam_univariate import iAMaLGaM_Univariate
-from .distribution_based.learned_es import LearnedES
-from .distribution_based.lm_ma_es import LM_MA_ES
-from .distribution_based.ma_es import MA_ES
-from .distribution_based.noise_reuse_es import NoiseReuseES
-from .distribution_based.open_es import Open_ES
-from .distribution_based.persistent_es import PersistentES
-from .distribution_based.pgpe import PGPE
-from .distribution_based.random_search import RandomSearch
-from .distribution_based.rm_es import Rm_ES
-from .distribution_based.sep_cma_es import Sep_CMA_ES
-from .distribution_based.simple_es import SimpleES
-from .distribution_based.simulated_annealing import SimulatedAnnealing
-from .distribution_based.snes import SNES
-from .distribution_based.sv.sv_cma_es import SV_CMA_ES
-from .distribution_based.sv.sv_open_es import SV_Open_ES
-from .distribution_based.xnes import xNES
-
-# Population-based algorithms
 from .population_based import population_based_algorithms
-from .population_based.differential_evolution import DifferentialEvolution
-from .population_based.diffusion_evolution import DiffusionEvolution
-from .population_based.gesmr_ga import GESMR_GA
-from .population_based.learned_ga import LearnedGA
-from .population_based.mr15_ga import MR15_GA
-from .population_based.pso import PSO
-from .population_based.samr_ga import SAMR_GA
-from .population_based.simple_ga import SimpleGA
+
+if TYPE_CHECKING:
+    from .batched import BatchedAlgorithm
+    from .distribution_based.ars import ARS
+    from .distribution_based.asebo import ASEBO
+    from .distribution_based.block_cma_es import Block_CMA_ES
+    from .distribution_based.cholesky_cma_es import Cholesky_CMA_ES
+    from .distribution_based.cma_es import CMA_ES
+    from .distribution_based.cr_fm_nes import CR_FM_NES
+    from .distribution_based.discovered_es import DiscoveredES
+    from .distribution_based.esmc import ESMC
+    from .distribution_based.evotf_es import EvoTF_ES
+    from .distribution_based.gradientless_descent import GradientlessDescent
+    from .distribution_based.guided_es import GuidedES
+    from .distribution_based.hill_climbing import HillClimbing
+    from .distribution_based.iamalgam_full import iAMaLGaM_Full
+    from .distribution_based.iamalgam_univariate import iAMaLGaM_Univariate
+    from .distribution_based.learned_es import LearnedES
+    from .distribution_based.lm_ma_es import LM_MA_ES
+    from .distribution_based.ma_es import MA_ES
+    from .distribution_based.noise_reuse_es import NoiseReuseES
+    from .distribution_based.open_es import Open_ES
+    from .distribution_based.persistent_es import PersistentES
+    from .distribution_based.pgpe import PGPE
+    from .distribution_based.random_search import RandomSearch
+    from .distribution_based.rm_es import Rm_ES
+    from .distribution_based.sep_cma_es import Sep_CMA_ES
+    from .distribution_based.simple_es import SimpleES
+    from .distribution_based.simulated_annealing import SimulatedAnnealing
+    from .distribution_based.snes import SNES
+    from .distribution_based.sv.sv_cma_es import SV_CMA_ES
+    from .distribution_based.sv.sv_open_es import SV_Open_ES
+    from .distribution_based.vkd_cma_es import VkD_CMA_ES
+    from .distribution_based.xnes import xNES
+    from .population_based.differential_evolution import DifferentialEvolution
+    from .population_based.diffusion_evolution import DiffusionEvolution
+    from .population_based.gesmr_ga import GESMR_GA
+    from .population_based.learned_ga import LearnedGA
+    from .population_based.mr15_ga import MR15_GA
+    from .population_based.pso import PSO
+    from .population_based.samr_ga import SAMR_GA
+    from .population_based.simple_ga import SimpleGA
+    from .restart import RestartAlgorithm
+    from .steady_state import SteadyStateAlgorithm
+
+__getattr__, __dir__ = lazy_getattr(
+    __name__,
+    {
+        "BatchedAlgorithm": ".batched",
+        "ARS": ".distribution_based.ars",
+        "ASEBO": ".distribution_based.asebo",
+        "Block_CMA_ES": ".distribution_based.block_cma_es",
+        "Cholesky_CMA_ES": ".distribution_based.cholesky_cma_es",
+        "CMA_ES": ".distribution_based.cma_es",
+        "CR_FM_NES": ".distribution_based.cr_fm_nes",
+        "DiscoveredES": ".distribution_based.discovered_es",
+        "ESMC": ".distribution_based.esmc",
+        "EvoTF_ES": ".distribution_based.evotf_es",
+        "GradientlessDescent": ".distribution_based.gradientless_descent",
+        "GuidedES": ".distribution_based.guided_es",
+        "HillClimbing": ".distribution_based.hill_climbing",
+        "iAMaLGaM_Full": ".distribution_based.iamalgam_full",
+        "iAMaLGaM_Univariate": ".distribution_based.iamalgam_univariate",
+        "LearnedES": ".distribution_based.learned_es",
+        "LM_MA_ES": ".distribution_based.lm_ma_es",
+        "MA_ES": ".distribution_based.ma_es",
+        "NoiseReuseES": ".distribution_based.noise_reuse_es",
+        "Open_ES": ".distribution_based.open_es",
+        "PersistentES": ".distribution_based.persistent_es",
+        "PGPE": ".distribution_based.pgpe",
+        "RandomSearch": ".distribution_based.random_search",
+        "Rm_ES": ".distribution_based.rm_es",
+        "Sep_CMA_ES": ".distribution_based.sep_cma_es",
+        "SimpleES": ".distribution_based.simple_es",
+        "SimulatedAnnealing": ".distribution_based.simulated_annealing",
+        "SNES": ".distribution_based.snes",
+        "SV_CMA_ES": ".distribution_based.sv.sv_cma_es",
+        "SV_Open_ES": ".distribution_based.sv.sv_open_es",
+        "VkD_CMA_ES": ".distribution_based.vkd_cma_es",
+        "xNES": ".distribution_based.xnes",
+        "DifferentialEvolution": ".population_based.differential_evolution",
+        "DiffusionEvolution": ".population_based.diffusion_evolution",
+        "GESMR_GA": ".population_based.gesmr_ga",
+        "LearnedGA": ".population_based.learned_ga",
+        "MR15_GA": ".population_based.mr15_ga",
+        "PSO": ".population_based.pso",
+        "SAMR_GA": ".population_based.samr_ga",
+        "SimpleGA": ".population_based.simple_ga",
+        "RestartAlgorithm": ".restart",
+        "SteadyStateAlgorithm": ".steady_state",
+    },
+)
 
 # Combine algorithms from both categories
 algorithms = distribution_based_algorithms | population_based_algorithms
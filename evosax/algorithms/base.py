@@ -1,5 +1,6 @@
 """Base module for evolutionary algorithms."""
 
+import copy
 from collections.abc import Callable
 from functools import partial
 
@@ -8,12 +9,21 @@ import jax.numpy as jnp
 from flax import struct
 from jax import flatten_util
 
+from evosax.core.cost import cost_report
 from evosax.core.fitness_shaping import identity_fitness_shaping_fn
+from evosax.core.ordering import (
+    FitnessOrder,
+    accepts_order,
+    call_with_order,
+    fitness_order,
+)
+from evosax.core.sharding import shard_population
 from evosax.types import (
     Fitness,
     Metrics,
     Params as BaseParams,
     Population,
+    PyTree,
     Solution,
     State as BaseState,
 )
@@ -24,11 +34,19 @@ class State(BaseState):
     best_solution: Solution
     best_fitness: float
     generation_counter: int
+    # Elite archive of the top-k distinct solutions, None if archive_size is 0
+    archive_solution: jax.Array | None = struct.field(default=None, kw_only=True)
+    archive_fitness: jax.Array | None = struct.field(default=None, kw_only=True)
+    # Rolling history of the best and median fitness of the last generations, None if
+    # fitness_history_size is 0
+    best_fitness_history: jax.Array | None = struct.field(default=None, kw_only=True)
+    median_fitness_history: jax.Array | None = struct.field(default=None, kw_only=True)
 
 
 @struct.dataclass
 class Params(BaseParams):
-    pass
+    # Number of active members, None to use all population_size members
+    active_population_size: int | None = struct.field(default=None, kw_only=True)
 
 
 def metrics_fn(
@@ -37,19 +55,65 @@ def metrics_fn(
     fitness: Fitness,
     state: State,
     params: Params,
+    order: FitnessOrder | None = None,
 ) -> Metrics:
     """Compute metrics for distribution-based algorithm."""
-    best_idx_in_generation = jnp.argmin(fitness)
+    best_idx_in_generation = jnp.nanargmin(fitness) if order is None else order.best_idx
     return {
         "generation_counter": state.generation_counter,
         "best_fitness_in_generation": fitness[best_idx_in_generation],
-        "best_solution_in_generation": population[best_idx_in_generation],
+        "best_solution_in_generation": get_member(population, best_idx_in_generation),
         "best_fitness": state.best_fitness,
         "best_solution": state.best_solution,
         "best_solution_norm": jnp.linalg.norm(state.best_solution),
     }
 
 
+def configure_metrics_fn(
+    metrics_fn: Callable, level: str = "full", every: int = 1
+) -> Callable:
+    """Restrict any metrics function to a level and compute it every N generations.
+
+    Args:
+        metrics_fn: Metrics function to wrap.
+        level: One of "none" (no metrics), "scalars" (only scalar metrics) or "full"
+            (all metrics).
+        every: Compute metrics on every N-th call to tell, i.e. when
+            generation_counter + 1 is a multiple of N. Other generations return
+            zero-filled metrics of the same structure.
+
+    Returns:
+        Wrapped metrics function.
+
+    """
+    assert level in ("none", "scalars", "full"), f"Unknown metrics level {level}."
+    assert every > 0, "every must be greater than 0"
+
+    def wrapped_metrics_fn(key, population, fitness, state, params, order=None):
+        if level == "none":
+            return {}
+
+        def compute_metrics():
+            metrics = call_with_order(
+                metrics_fn, key, population, fitness, state, params, order=order
+            )
+            if level == "scalars":
+                metrics = {k: v for k, v in metrics.items() if jnp.ndim(v) == 0}
+            return metrics
+
+        if every == 1:
+            return compute_metrics()
+
+        metrics_shape = jax.eval_shape(compute_metrics)
+        return jax.lax.cond(
+            (state.generation_counter + 1) % every == 0,
+            compute_metrics,
+            lambda: jax.tree.map(lambda x: jnp.zeros(x.shape, x.dtype), metrics_shape),
+        )
+
+    return wrapped_metrics_fn
+
+
 class EvolutionaryAlgorithm:
     """Base class for evolutionary algorithms."""
 
@@ -59,8 +123,19 @@ class EvolutionaryAlgorithm:
         solution: Solution,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        *,
+        population_dtype: jnp.dtype | None = None,
+        state_dtype: jnp.dtype | dict | None = None,
+        population_sharding: jax.sharding.Sharding | None = None,
+        archive_size: int = 0,
+        fitness_history_size: int = 0,
     ):
-        """Initialize base class for evolutionary algorithm."""
+        """Initialize base class for evolutionary algorithm.
+
+        Keyword-only arguments are shared by all algorithms, which forward them to this
+        class. They are fixed at construction, as jit caches the compiled methods per
+        instance, so changing them on an instance would not recompile.
+        """
         assert population_size > 0, "Population size must be greater than 0"
 
         self.population_size = population_size
@@ -77,6 +152,28 @@ class EvolutionaryAlgorithm:
         # Default elite ratio
         self.elite_ratio = 1.0
 
+        # Precision policy, None keeps the dtype of the solution
+        self.population_dtype = population_dtype  # Population returned by ask
+        # Floating-point state, a dtype for all leaves or a dict from state field
+        # names to dtypes, e.g. {"mean": jnp.float32, "C": jnp.float64}
+        self.state_dtype = state_dtype
+
+        # Sharding of the population axis, None to keep the population on one device
+        self.population_sharding = population_sharding
+
+        # Size of the elite archive of top-k distinct solutions, 0 to disable
+        self.archive_size = archive_size
+
+        # Number of generations in the rolling fitness history, 0 to disable
+        self.fitness_history_size = fitness_history_size
+
+        # Whether the update supports masked members, see get_masked_params
+        self.supports_masking = True
+
+        # State fields of shape (..., num_dims, num_dims), e.g. covariance matrices,
+        # reported by cost_report
+        self.quadratic_state_fields = ()
+
         # Maximum num_dims that prevents overflow of num_dims**2 in int32
         self.max_num_dims_sq = jnp.minimum(
             self.num_dims, jnp.floor(jnp.sqrt(jnp.iinfo(jnp.int32).max))
@@ -100,7 +197,9 @@ class EvolutionaryAlgorithm:
     ) -> State:
         """Initialize evolutionary algorithm."""
         state = self._init(key, params)
-        return state
+        state = self._init_archive(state)
+        state = self._init_fitness_history(state)
+        return self._cast_state(state)
 
     @partial(jax.jit, static_argnames=("self",))
     def ask(
@@ -111,12 +210,16 @@ class EvolutionaryAlgorithm:
     ) -> tuple[Population, State]:
         """Ask evolutionary algorithm for new candidate solutions to evaluate."""
         # Generate population
-        population, state = self._ask(key, state, params)
+        with jax.named_scope("ask"):
+            population, state = self._ask(key, state, params)
+            population = self._shard_population(population)
 
         # Unravel population
-        population = jax.vmap(self._unravel_solution)(population)
+        with jax.named_scope("unravel"):
+            population = jax.vmap(self._unravel_solution)(population)
+            population = self._shard_population(population)
 
-        return population, state
+        return self._cast_population(population), self._cast_state(state)
 
     @partial(jax.jit, static_argnames=("self",))
     def tell(
@@ -129,25 +232,413 @@ class EvolutionaryAlgorithm:
     ) -> tuple[State, Metrics]:
         """Tell evolutionary algorithm fitness for state update."""
         # Ravel population
-        population = jax.vmap(self._ravel_solution)(population)
+        with jax.named_scope("ravel"):
+            population, fitness = self._shard_population((population, fitness))
+            population = jax.vmap(self._ravel_solution)(population)
+            population = self._upcast_population(population)
+            population = self._shard_population(population)
+
+        # Sort fitness once for all stages, masked members are ranked last
+        with jax.named_scope("order"):
+            fitness = self._mask_fitness(fitness, params)
+            order = fitness_order(fitness, params.active_population_size)
 
         # Update best solution and fitness
         best_solution, best_fitness = update_best_solution_and_fitness(
-            population, fitness, state.best_solution, state.best_fitness
+            population,
+            fitness,
+            state.best_solution,
+            state.best_fitness,
+            order.best_idx,
+            self.population_sharding is not None,
         )
         state = state.replace(best_solution=best_solution, best_fitness=best_fitness)
+        state = self._update_archive(population, fitness, state, order)
+        state = self._update_fitness_history(fitness, state, order)
 
         # Compute metrics
-        metrics = self.metrics_fn(key, population, fitness, state, params)
+        with jax.named_scope("metrics"):
+            metrics = call_with_order(
+                self.metrics_fn, key, population, fitness, state, params, order=order
+            )
 
         # Shape fitness
-        fitness = self.fitness_shaping_fn(population, fitness, state, params)
+        with jax.named_scope("shape"):
+            fitness = call_with_order(
+                self.fitness_shaping_fn, population, fitness, state, params, order=order
+            )
+            fitness = self._mask_shaped_fitness(fitness, params)
 
         # Update state
-        state = self._tell(key, population, fitness, state, params)
+        with jax.named_scope("tell"):
+            state = self._call_tell(key, population, fitness, state, params, order)
         state = state.replace(generation_counter=state.generation_counter + 1)
 
-        return state, metrics
+        return self._cast_state(state), metrics
+
+    @partial(jax.jit, static_argnames=("self",), donate_argnames=("state",))
+    def donated_ask(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+    ) -> tuple[Population, State]:
+        """Ask evolutionary algorithm, reusing the buffers of the input state.
+
+        The input state is donated and must not be used after this call.
+        """
+        return self.ask(key, state, params)
+
+    @partial(jax.jit, static_argnames=("self",), donate_argnames=("state",))
+    def donated_tell(
+        self,
+        key: jax.Array,
+        population: Population,
+        fitness: Fitness,
+        state: State,
+        params: Params,
+    ) -> tuple[State, Metrics]:
+        """Tell evolutionary algorithm, reusing the buffers of the input state.
+
+        The input state is donated and must not be used after this call.
+        """
+        return self.tell(key, population, fitness, state, params)
+
+    @partial(
+        jax.jit,
+        static_argnames=(
+            "self",
+            "problem",
+            "num_generations",
+            "stack_metrics",
+            "metrics_every",
+        ),
+    )
+    def run(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+        problem,
+        problem_state,
+        num_generations: int,
+        stack_metrics: bool = True,
+        metrics_every: int = 1,
+    ) -> tuple[State, PyTree, Metrics]:
+        """Run the ask-eval-tell loop for a number of generations in one program.
+
+        Args:
+            key: JAX PRNG key.
+            state: Initial state of the evolutionary algorithm.
+            params: Params of the evolutionary algorithm.
+            problem: Problem instance with an `eval(key, population, state)` method.
+            problem_state: Initial state of the problem.
+            num_generations: Number of generations to run.
+            stack_metrics: If True, return metrics stacked over generations.
+                Otherwise, return only the metrics of the last generation.
+            metrics_every: Only stack the metrics of every N-th generation. Must
+                divide num_generations.
+
+        Returns:
+            tuple: containing the final state, the final problem state and metrics.
+
+        """
+        assert num_generations % metrics_every == 0, (
+            "metrics_every must divide num_generations."
+        )
+
+        def step(carry, key):
+            state, problem_state, _ = carry
+            carry = self._step(key, state, params, problem, problem_state)
+            return carry, None
+
+        def step_block(carry, keys):
+            carry, _ = jax.lax.scan(step, carry, keys)
+            return carry, carry[2] if stack_metrics else None
+
+        metrics = self._init_metrics(key, state, params, problem, problem_state)
+
+        keys = jax.random.split(key, (num_generations // metrics_every, metrics_every))
+        (state, problem_state, metrics), stacked_metrics = jax.lax.scan(
+            step_block, (state, problem_state, metrics), keys
+        )
+
+        if stack_metrics:
+            metrics = stacked_metrics
+        return state, problem_state, metrics
+
+    @partial(
+        jax.jit,
+        static_argnames=("self", "problem", "num_generations", "termination_fn"),
+    )
+    def run_until(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+        problem,
+        problem_state,
+        num_generations: int,
+        termination_fn: Callable,
+    ) -> tuple[State, PyTree, Metrics]:
+        """Run the ask-eval-tell loop until termination or a number of generations.
+
+        Args:
+            key: JAX PRNG key.
+            state: Initial state of the evolutionary algorithm.
+            params: Params of the evolutionary algorithm.
+            problem: Problem instance with an `eval(key, population, state)` method.
+            problem_state: Initial state of the problem.
+            num_generations: Maximum number of generations to run.
+            termination_fn: Function `(population, fitness, state, params) -> bool`
+                evaluated after each generation. The loop stops once it returns True.
+
+        Returns:
+            tuple: containing the final state, the final problem state and the
+                metrics of the last generation.
+
+        """
+
+        def cond_fn(carry):
+            _, state, _, _, generation, done = carry
+            return jnp.logical_and(~done, generation < num_generations)
+
+        def body_fn(carry):
+            key, state, problem_state, _, generation, _ = carry
+            key, subkey = jax.random.split(key)
+            state, problem_state, metrics, population, fitness = self._step(
+                subkey, state, params, problem, problem_state, return_population=True
+            )
+            done = termination_fn(population, fitness, state, params)
+            return key, state, problem_state, metrics, generation + 1, done
+
+        metrics = self._init_metrics(key, state, params, problem, problem_state)
+        _, state, problem_state, metrics, _, _ = jax.lax.while_loop(
+            cond_fn,
+            body_fn,
+            (key, state, problem_state, metrics, 0, jnp.array(False)),
+        )
+        return state, problem_state, metrics
+
+    def cost_report(self, params: Params | None = None) -> dict:
+        """Report state size and compiled cost of ask and tell without running them.
+
+        Warns if the state has O(num_dims^2) leaves, see `evosax.core.cost`.
+        """
+        if params is None:
+            params = self.default_params
+        return cost_report(self, self._init_args_shape(), params)
+
+    def _init_args_shape(self) -> tuple:
+        """Return shapes of the arguments of init between key and params."""
+        raise NotImplementedError
+
+    def _step(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+        problem,
+        problem_state,
+        return_population: bool = False,
+    ):
+        """Run a single ask-eval-tell generation."""
+        key_ask, key_eval, key_tell = jax.random.split(key, 3)
+        population, state = self.ask(key_ask, state, params)
+        with jax.named_scope("eval"):
+            fitness, problem_state, _ = problem.eval(
+                key_eval, population, problem_state
+            )
+        state, metrics = self.tell(key_tell, population, fitness, state, params)
+        if return_population:
+            return state, problem_state, metrics, population, fitness
+        return state, problem_state, metrics
+
+    def _init_metrics(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+        problem,
+        problem_state,
+    ) -> Metrics:
+        """Return zero-filled metrics with the structure produced by a generation."""
+        _, _, metrics = jax.eval_shape(
+            partial(self._step, problem=problem),
+            key,
+            state,
+            params,
+            problem_state=problem_state,
+        )
+        return jax.tree.map(lambda x: jnp.zeros(x.shape, x.dtype), metrics)
+
+    def get_masked_params(self, active_population_size: int) -> Params:
+        """Return default params that only use the first active_population_size members.
+
+        Params that depend on the population size, e.g. recombination weights, are
+        computed for active_population_size and padded with zeros to the shapes for
+        population_size. Params of all sizes have the same shapes, so the population
+        size changes at runtime without recompilation.
+        """
+        assert self.supports_masking, (
+            f"{type(self).__name__} does not support active_population_size."
+        )
+        assert 0 < active_population_size <= self.population_size, (
+            "active_population_size must be in [1, population_size]."
+        )
+        algorithm = copy.copy(self)
+        algorithm.population_size = active_population_size
+
+        def pad(x, x_max):
+            x = jnp.asarray(x)
+            if x.shape == jnp.shape(x_max):
+                return x
+            return jnp.pad(
+                x, [(0, n_max - n) for n, n_max in zip(x.shape, jnp.shape(x_max))]
+            )
+
+        params = jax.tree.map(pad, algorithm.default_params, self.default_params)
+        return params.replace(active_population_size=active_population_size)
+
+    def get_active_mask(self, params: Params) -> jax.Array:
+        """Return mask of the members that are active, i.e. need to be evaluated."""
+        if params.active_population_size is None:
+            return jnp.ones(self.population_size, dtype=bool)
+        return jnp.arange(self.population_size) < params.active_population_size
+
+    def get_archive(self, state: State) -> tuple[Population, Fitness]:
+        """Return unravelled archive solutions and their fitness, best first."""
+        return jax.vmap(self._unravel_solution)(
+            state.archive_solution
+        ), state.archive_fitness
+
+    def _init_archive(self, state: State) -> State:
+        """Initialize empty elite archive if archive_size is set."""
+        if self.archive_size == 0:
+            return state
+        return state.replace(
+            archive_solution=jnp.full(
+                (self.archive_size, self.num_dims), jnp.nan, self.solution_flat.dtype
+            ),
+            archive_fitness=jnp.full((self.archive_size,), jnp.inf),
+        )
+
+    def _update_archive(
+        self,
+        population: jax.Array,
+        fitness: Fitness,
+        state: State,
+        order: FitnessOrder | None = None,
+    ) -> State:
+        """Merge ravelled population into elite archive if archive_size is set."""
+        if self.archive_size == 0:
+            return state
+        archive_solution, archive_fitness = update_archive(
+            population,
+            fitness,
+            state.archive_solution,
+            state.archive_fitness,
+            None if order is None else order.argsort,
+        )
+        return state.replace(
+            archive_solution=archive_solution, archive_fitness=archive_fitness
+        )
+
+    def _init_fitness_history(self, state: State) -> State:
+        """Initialize empty fitness history if fitness_history_size is set."""
+        if self.fitness_history_size == 0:
+            return state
+        history = jnp.full((self.fitness_history_size,), jnp.nan)
+        return state.replace(
+            best_fitness_history=history, median_fitness_history=history
+        )
+
+    def _update_fitness_history(
+        self, fitness: Fitness, state: State, order: FitnessOrder | None = None
+    ) -> State:
+        """Write best and median fitness to the history if fitness_history_size is set.
+
+        The history is a ring buffer, the entry of generation g is at index
+        g % fitness_history_size.
+        """
+        if self.fitness_history_size == 0:
+            return state
+        if order is None:
+            order = fitness_order(fitness)
+        idx = state.generation_counter % self.fitness_history_size
+        median_idx = order.argsort[(order.num_active - 1) // 2]
+        return state.replace(
+            best_fitness_history=state.best_fitness_history.at[idx].set(
+                fitness[order.best_idx]
+            ),
+            median_fitness_history=state.median_fitness_history.at[idx].set(
+                fitness[median_idx]
+            ),
+        )
+
+    def _mask_fitness(self, fitness: Fitness, params: Params) -> Fitness:
+        """Set fitness of inactive members to NaN if active_population_size is set."""
+        if params.active_population_size is None:
+            return fitness
+        return jnp.where(self.get_active_mask(params), fitness, jnp.nan)
+
+    def _mask_shaped_fitness(self, fitness: Fitness, params: Params) -> Fitness:
+        """Set shaped fitness of inactive members to 0, so they do not enter updates."""
+        if params.active_population_size is None:
+            return fitness
+        return jnp.where(self.get_active_mask(params), fitness, 0.0)
+
+    def _get_population_size(self, params: Params) -> int | jax.Array:
+        """Return number of active members of the population."""
+        if params.active_population_size is None:
+            return self.population_size
+        return params.active_population_size
+
+    def _get_num_elites(self, params: Params) -> int | jax.Array:
+        """Return number of elites among the active members of the population."""
+        if params.active_population_size is None:
+            return self.num_elites
+        return jnp.maximum(
+            1, jnp.floor(self.elite_ratio * params.active_population_size)
+        ).astype(jnp.int32)
+
+    def _cast_population(self, population: Population) -> Population:
+        """Cast unravelled population to the population dtype of the policy."""
+        if self.population_dtype is None:
+            return population
+        return cast_floating(population, self.population_dtype)
+
+    def _upcast_population(self, population: jax.Array) -> jax.Array:
+        """Cast ravelled population to the dtype used for state updates.
+
+        The update uses the population passed to tell, i.e. the members whose fitness
+        was evaluated, in the dtype of the state.
+        """
+        if self.population_dtype is None and self.state_dtype is None:
+            return population
+        dtype = self.state_dtype
+        if dtype is None or isinstance(dtype, dict):
+            dtype = self.solution_flat.dtype
+        return population.astype(dtype)
+
+    def _shard_population(self, population: PyTree) -> PyTree:
+        """Shard the population axis according to the sharding of the policy."""
+        if self.population_sharding is None:
+            return population
+        return shard_population(population, self.population_sharding)
+
+    def _cast_state(self, state: State) -> State:
+        """Cast floating-point state to the state dtype of the policy."""
+        if self.state_dtype is None:
+            return state
+        if isinstance(self.state_dtype, dict):
+            return state.replace(
+                **{
+                    name: cast_floating(getattr(state, name), dtype)
+                    for name, dtype in self.state_dtype.items()
+                }
+            )
+        return cast_floating(state, self.state_dtype)
 
     def _init(self, key: jax.Array, params: Params) -> State:
         raise NotImplementedError
@@ -170,6 +661,20 @@ class EvolutionaryAlgorithm:
     ) -> State:
         raise NotImplementedError
 
+    def _call_tell(
+        self,
+        key: jax.Array,
+        population: Population,
+        fitness: Fitness,
+        state: State,
+        params: Params,
+        order: FitnessOrder,
+    ) -> State:
+        """Call _tell, passing the fitness order if fitness shaping preserves it."""
+        if accepts_order(self.fitness_shaping_fn) and accepts_order(self._tell):
+            return self._tell(key, population, fitness, state, params, order=order)
+        return self._tell(key, population, fitness, state, params)
+
 
 def get_ravel_fn(solution: Solution):
     """Return functions to flatten and reconstruct a PyTree solution."""
@@ -183,8 +688,45 @@ def get_ravel_fn(solution: Solution):
     return ravel_solution, unravel_solution
 
 
+def get_leaf_slices(solution: Solution) -> list[slice]:
+    """Return the slice of each leaf of a PyTree solution in the ravelled solution."""
+    slices, start = [], 0
+    for leaf in jax.tree.leaves(solution):
+        slices.append(slice(start, start + jnp.size(leaf)))
+        start += jnp.size(leaf)
+    return slices
+
+
+def cast_floating(tree: PyTree, dtype) -> PyTree:
+    """Cast the floating-point leaves of a PyTree to dtype."""
+
+    def cast(x):
+        x = jnp.asarray(x)
+        return x.astype(dtype) if jnp.issubdtype(x.dtype, jnp.floating) else x
+
+    return jax.tree.map(cast, tree)
+
+
+def get_member(population: jax.Array, idx: int, sharded: bool = False) -> jax.Array:
+    """Return population member idx.
+
+    If the population is sharded, selecting with a mask and reducing over the
+    population axis keeps the population sharded and only reduces a single solution
+    across devices, whereas indexing gathers the whole population.
+    """
+    if not sharded:
+        return population[idx]
+    mask = jnp.arange(population.shape[0]) == idx
+    return jnp.sum(jnp.where(mask[:, None], population, 0.0), axis=0)
+
+
 def update_best_solution_and_fitness(
-    population, fitness, best_solution_so_far, best_fitness_so_far
+    population,
+    fitness,
+    best_solution_so_far,
+    best_fitness_so_far,
+    best_idx=None,
+    sharded=False,
 ):
     """Update best solution and fitness so far.
 
@@ -193,13 +735,15 @@ def update_best_solution_and_fitness(
         fitness: Array of fitness values
         best_solution_so_far: Best solution found before this generation
         best_fitness_so_far: Best fitness value found before this generation
+        best_idx: Index of the best solution in population, if already known
+        sharded: Whether the population axis is sharded across devices
 
     Returns:
         tuple: containing the best solution and fitness seen so far.
 
     """
-    idx = jnp.argmin(fitness)
-    best_solution_in_population = population[idx]
+    idx = jnp.nanargmin(fitness) if best_idx is None else best_idx
+    best_solution_in_population = get_member(population, idx, sharded)
     best_fitness_in_population = fitness[idx]
 
     condition = best_fitness_in_population < best_fitness_so_far
@@ -214,3 +758,46 @@ def update_best_solution_and_fitness(
         best_fitness_so_far,
     )
     return best_solution_so_far, best_fitness_so_far
+
+
+def update_archive(
+    population, fitness, archive_solution, archive_fitness, argsort=None
+):
+    """Merge population into an archive of the top-k distinct solutions.
+
+    The top-k of the population are selected with `lax.top_k` and merged with the
+    archive, so that only k solutions are gathered from the population. Duplicates are
+    detected from random projections of the solutions, keeping the archived copy.
+
+    Args:
+        population: Array of solutions
+        fitness: Array of fitness values, NaN fitness is ignored
+        archive_solution: Archived solutions, sorted by fitness
+        archive_fitness: Fitness of the archived solutions
+        argsort: Indices sorting fitness, if already known
+
+    Returns:
+        tuple: containing the updated archive solutions and fitness, best first.
+
+    """
+    archive_size = archive_fitness.shape[0]
+    fitness = jnp.where(jnp.isnan(fitness), jnp.inf, fitness)
+
+    # Select top-k of population
+    if argsort is None:
+        _, idx = jax.lax.top_k(-fitness, min(archive_size, fitness.shape[0]))
+    else:
+        idx = argsort[:archive_size]
+    solution = jnp.concatenate([archive_solution, population[idx]])
+    fitness = jnp.concatenate([archive_fitness, fitness[idx]])
+
+    # Remove duplicates, keeping the first occurrence
+    projection = jax.random.normal(jax.random.key(0), (solution.shape[1], 2))
+    sketch = solution @ projection.astype(solution.dtype)
+    same = jnp.all(sketch[:, None] == sketch[None, :], axis=-1)
+    duplicate = jnp.any(jnp.tril(same, k=-1), axis=1)
+    fitness = jnp.where(duplicate, jnp.inf, fitness)
+
+    # Select top-k of archive and population
+    _, idx = jax.lax.top_k(-fitness, archive_size)
+    return solution[idx], fitness[idx]
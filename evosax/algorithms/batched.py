@@ -0,0 +1,129 @@
+"""Batched wrapper to run many instances of an evolutionary algorithm at once."""
+
+from functools import partial
+
+import jax
+import jax.numpy as jnp
+
+from evosax.types import Fitness, Metrics, Population, PyTree
+
+from .base import EvolutionaryAlgorithm, Params, State
+
+
+class BatchedAlgorithm:
+    """Run independent instances of an evolutionary algorithm in one program.
+
+    State, params, population and fitness carry a leading instance axis of size
+    num_instances. Each instance uses its own key, split from the key passed to
+    init, ask and tell.
+    """
+
+    def __init__(self, algorithm: EvolutionaryAlgorithm, num_instances: int):
+        """Initialize batched evolutionary algorithm."""
+        assert num_instances > 0, "Number of instances must be greater than 0"
+
+        self.algorithm = algorithm
+        self.num_instances = num_instances
+
+    @property
+    def default_params(self) -> Params:
+        """Return default params stacked over instances."""
+        return self.stack_params(self.algorithm.default_params)
+
+    def stack(self, tree: PyTree) -> PyTree:
+        """Broadcast a PyTree shared by all instances along a new instance axis."""
+        return jax.tree.map(
+            lambda x: jnp.broadcast_to(
+                jnp.asarray(x), (self.num_instances,) + jnp.shape(x)
+            ),
+            tree,
+        )
+
+    def stack_params(self, params: Params | None = None, **kwargs) -> Params:
+        """Return params stacked over instances.
+
+        Args:
+            params: Params shared by all instances, defaults to the default params.
+            **kwargs: Params fields with one value per instance along the first axis.
+
+        Returns:
+            Params with a leading instance axis.
+
+        """
+        if params is None:
+            params = self.algorithm.default_params
+        params = self.stack(params)
+
+        for name, value in kwargs.items():
+            value = jnp.asarray(value)
+            assert value.shape[:1] == (self.num_instances,), (
+                f"{name} must have leading dimension {self.num_instances}."
+            )
+            leaf = getattr(params, name)
+            params = params.replace(
+                **{name: jnp.broadcast_to(value, leaf.shape).astype(leaf.dtype)}
+            )
+        return params
+
+    @partial(jax.jit, static_argnames=("self",))
+    def init(self, key: jax.Array, *args) -> State:
+        """Initialize all instances, the arguments are those of `algorithm.init`."""
+        keys = jax.random.split(key, self.num_instances)
+        return jax.vmap(self.algorithm.init)(keys, *args)
+
+    @partial(jax.jit, static_argnames=("self",))
+    def ask(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+    ) -> tuple[Population, State]:
+        """Ask all instances for new candidate solutions to evaluate."""
+        keys = jax.random.split(key, self.num_instances)
+        return jax.vmap(self.algorithm.ask)(keys, state, params)
+
+    @partial(jax.jit, static_argnames=("self",))
+    def tell(
+        self,
+        key: jax.Array,
+        population: Population,
+        fitness: Fitness,
+        state: State,
+        params: Params,
+    ) -> tuple[State, Metrics]:
+        """Tell all instances fitness for state update."""
+        keys = jax.random.split(key, self.num_instances)
+        return jax.vmap(self.algorithm.tell)(keys, population, fitness, state, params)
+
+    @partial(
+        jax.jit,
+        static_argnames=(
+            "self",
+            "problem",
+            "num_generations",
+            "stack_metrics",
+            "metrics_every",
+        ),
+    )
+    def run(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+        problem,
+        problem_state,
+        num_generations: int,
+        stack_metrics: bool = True,
+        metrics_every: int = 1,
+    ) -> tuple[State, PyTree, Metrics]:
+        """Run all instances for a number of generations, see `algorithm.run`."""
+        keys = jax.random.split(key, self.num_instances)
+        return jax.vmap(
+            partial(
+                self.algorithm.run,
+                problem=problem,
+                num_generations=num_generations,
+                stack_metrics=stack_metrics,
+                metrics_every=metrics_every,
+            )
+        )(keys, state, params, problem_state=problem_state)
@@ -1,63 +1,116 @@
 """Distribution-based algorithms module."""
 
-from .ars import ARS
-from .asebo import ASEBO
-from .cma_es import CMA_ES
-from .cr_fm_nes import CR_FM_NES
-from .discovered_es import DiscoveredES
-from .esmc import ESMC
-from .evotf_es import EvoTF_ES
-from .gradientless_descent import GradientlessDescent
-from .guided_es import GuidedES
-from .hill_climbing import HillClimbing
-from .iamalgam_full import iAMaLGaM_Full
-from .iamalgam_univariate import iAMaLGaM_Univariate
-from .learned_es import LearnedES
-from .lm_ma_es import LM_MA_ES
-from .ma_es import MA_ES
-from .noise_reuse_es import NoiseReuseES
-from .open_es import Open_ES
-from .persistent_es import PersistentES
-from .pgpe import PGPE
-from .random_search import RandomSearch
-from .rm_es import Rm_ES
-from .sep_cma_es import Sep_CMA_ES
-from .simple_es import SimpleES
-from .simulated_annealing import SimulatedAnnealing
-from .snes import SNES
-from .sv.sv_cma_es import SV_CMA_ES
-from .sv.sv_open_es import SV_Open_ES
-from .xnes import xNES
+# ruff: noqa: F401
 
-distribution_based_algorithms = {
-    "ARS": ARS,
-    "ASEBO": ASEBO,
-    "CMA_ES": CMA_ES,
-    "CR_FM_NES": CR_FM_NES,
-    "DES": DiscoveredES,
-    "ESMC": ESMC,
-    "EvoTF_ES": EvoTF_ES,
-    "GradientlessDescent": GradientlessDescent,
-    "GuidedES": GuidedES,
-    "HillClimbing": HillClimbing,
-    "iAMaLGaM_Full": iAMaLGaM_Full,
-    "iAMaLGaM_Univariate": iAMaLGaM_Univariate,
-    "LES": LearnedES,
-    "LM_MA_ES": LM_MA_ES,
-    "MA_ES": MA_ES,
-    "NoiseReuseES": NoiseReuseES,
-    "Open_ES": Open_ES,
-    "PersistentES": PersistentES,
-    "PGPE": PGPE,
-    "RandomSearch": RandomSearch,
-    "Rm_ES": Rm_ES,
-    "Sep_CMA_ES": Sep_CMA_ES,
-    "SimulatedAnnealing": SimulatedAnnealing,
-    "SimpleES": SimpleES,
-    "SNES": SNES,
-    "SV_CMA_ES": SV_CMA_ES,
-    "SV_Open_ES": SV_Open_ES,
-    "xNES": xNES,
-}
+from typing import TYPE_CHECKING
+
+from evosax.core.lazy import LazyRegistry, lazy_getattr
+
+if TYPE_CHECKING:
+    from .ars import ARS
+    from .asebo import ASEBO
+    from .block_cma_es import Block_CMA_ES
+    from .cholesky_cma_es import Cholesky_CMA_ES
+    from .cma_es import CMA_ES
+    from .cr_fm_nes import CR_FM_NES
+    from .discovered_es import DiscoveredES
+    from .esmc import ESMC
+    from .evotf_es import EvoTF_ES
+    from .gradientless_descent import GradientlessDescent
+    from .guided_es import GuidedES
+    from .hill_climbing import HillClimbing
+    from .iamalgam_full import iAMaLGaM_Full
+    from .iamalgam_univariate import iAMaLGaM_Univariate
+    from .learned_es import LearnedES
+    from .lm_ma_es import LM_MA_ES
+    from .ma_es import MA_ES
+    from .noise_reuse_es import NoiseReuseES
+    from .open_es import Open_ES
+    from .persistent_es import PersistentES
+    from .pgpe import PGPE
+    from .random_search import RandomSearch
+    from .rm_es import Rm_ES
+    from .sep_cma_es import Sep_CMA_ES
+    from .simple_es import SimpleES
+    from .simulated_annealing import SimulatedAnnealing
+    from .snes import SNES
+    from .sv.sv_cma_es import SV_CMA_ES
+    from .sv.sv_open_es import SV_Open_ES
+    from .vkd_cma_es import VkD_CMA_ES
+    from .xnes import xNES
+
+__getattr__, __dir__ = lazy_getattr(
+    __name__,
+    {
+        "ARS": ".ars",
+        "ASEBO": ".asebo",
+        "Block_CMA_ES": ".block_cma_es",
+        "Cholesky_CMA_ES": ".cholesky_cma_es",
+        "CMA_ES": ".cma_es",
+        "CR_FM_NES": ".cr_fm_nes",
+        "DiscoveredES": ".discovered_es",
+        "ESMC": ".esmc",
+        "EvoTF_ES": ".evotf_es",
+        "GradientlessDescent": ".gradientless_descent",
+        "GuidedES": ".guided_es",
+        "HillClimbing": ".hill_climbing",
+        "iAMaLGaM_Full": ".iamalgam_full",
+        "iAMaLGaM_Univariate": ".iamalgam_univariate",
+        "LearnedES": ".learned_es",
+        "LM_MA_ES": ".lm_ma_es",
+        "MA_ES": ".ma_es",
+        "NoiseReuseES": ".noise_reuse_es",
+        "Open_ES": ".open_es",
+        "PersistentES": ".persistent_es",
+        "PGPE": ".pgpe",
+        "RandomSearch": ".random_search",
+        "Rm_ES": ".rm_es",
+        "Sep_CMA_ES": ".sep_cma_es",
+        "SimpleES": ".simple_es",
+        "SimulatedAnnealing": ".simulated_annealing",
+        "SNES": ".snes",
+        "SV_CMA_ES": ".sv.sv_cma_es",
+        "SV_Open_ES": ".sv.sv_open_es",
+        "VkD_CMA_ES": ".vkd_cma_es",
+        "xNES": ".xnes",
+    },
+)
+
+distribution_based_algorithms = LazyRegistry(
+    __name__,
+    {
+        "ARS": "ARS",
+        "ASEBO": "ASEBO",
+        "Block_CMA_ES": "Block_CMA_ES",
+        "Cholesky_CMA_ES": "Cholesky_CMA_ES",
+        "CMA_ES": "CMA_ES",
+        "CR_FM_NES": "CR_FM_NES",
+        "DES": "DiscoveredES",
+        "ESMC": "ESMC",
+        "EvoTF_ES": "EvoTF_ES",
+        "GradientlessDescent": "GradientlessDescent",
+        "GuidedES": "GuidedES",
+        "HillClimbing": "HillClimbing",
+        "iAMaLGaM_Full": "iAMaLGaM_Full",
+        "iAMaLGaM_Univariate": "iAMaLGaM_Univariate",
+        "LES": "LearnedES",
+        "LM_MA_ES": "LM_MA_ES",
+        "MA_ES": "MA_ES",
+        "NoiseReuseES": "NoiseReuseES",
+        "Open_ES": "Open_ES",
+        "PersistentES": "PersistentES",
+        "PGPE": "PGPE",
+        "RandomSearch": "RandomSearch",
+        "Rm_ES": "Rm_ES",
+        "Sep_CMA_ES": "Sep_CMA_ES",
+        "SimulatedAnnealing": "SimulatedAnnealing",
+        "SimpleES": "SimpleES",
+        "SNES": "SNES",
+        "SV_CMA_ES": "SV_CMA_ES",
+        "SV_Open_ES": "SV_Open_ES",
+        "VkD_CMA_ES": "VkD_CMA_ES",
+        "xNES": "xNES",
+    },
+)
 
 __all__ = list(distribution_based_algorithms.keys())
@@ -44,10 +44,16 @@ class ARS(DistributionBasedAlgorithm):
         std_schedule: Callable = optax.constant_schedule(1.0),
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize ARS."""
         assert population_size % 2 == 0, "Population size must be even."
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        # Masked members would enter the elite selection over antithetic halves
+        self.supports_masking = False
 
         self.elite_ratio = 0.5
 
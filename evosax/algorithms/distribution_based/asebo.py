@@ -53,15 +53,22 @@ class ASEBO(DistributionBasedAlgorithm):
         std_schedule: Callable = optax.constant_schedule(1.0),
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize ASEBO."""
         assert population_size % 2 == 0, "Population size must be even."
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        # Masked members would enter the update over antithetic halves
+        self.supports_masking = False
 
         assert subspace_dims <= self.num_dims, (
             "Subspace dims must be smaller than optimization dims."
         )
         self.subspace_dims = subspace_dims
+        self.quadratic_state_fields = ("UUT", "UUT_ort")
 
         # Optimizer
         self.optimizer = optimizer
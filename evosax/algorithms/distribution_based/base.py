@@ -7,20 +7,24 @@ import jax
 import jax.numpy as jnp
 from flax import struct
 
-from evosax.core.fitness_shaping import identity_fitness_shaping_fn
-from evosax.types import Fitness, Metrics, Population, Solution
+from evosax.core.fitness_shaping import identity_fitness_shaping_fn, uses_population
+from evosax.core.ordering import FitnessOrder, call_with_order, fitness_order
+from evosax.types import Fitness, Metrics, Population, PyTree, Solution
 
 from ..base import (
     EvolutionaryAlgorithm,
     Params as BaseParams,
     State as BaseState,
     metrics_fn as base_metrics_fn,
+    update_best_solution_and_fitness,
 )
 
 
 @struct.dataclass
 class State(BaseState):
     mean: Solution
+    # Step size at init, used by termination criteria, None if the state has no std
+    std_init: jax.Array | None = struct.field(default=None, kw_only=True)
 
 
 @struct.dataclass
@@ -34,9 +38,10 @@ def metrics_fn(
     fitness: Fitness,
     state: State,
     params: Params,
+    order: FitnessOrder | None = None,
 ) -> Metrics:
     """Compute metrics for distribution-based algorithm."""
-    metrics = base_metrics_fn(key, population, fitness, state, params)
+    metrics = base_metrics_fn(key, population, fitness, state, params, order)
     return metrics | {
         "mean": state.mean,
         "mean_norm": jnp.linalg.norm(state.mean, axis=-1),
@@ -52,9 +57,15 @@ class DistributionBasedAlgorithm(EvolutionaryAlgorithm):
         solution: Solution,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize base class for distribution-based algorithm."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        # Chunk size for seed-regenerated perturbations, None for standard sampling
+        self.noise_chunk_size = None
 
     @partial(jax.jit, static_argnames=("self",))
     def init(
@@ -66,9 +77,173 @@ class DistributionBasedAlgorithm(EvolutionaryAlgorithm):
         """Initialize distribution-based algorithm."""
         state = self._init(key, params)
         state = state.replace(mean=self._ravel_solution(mean))
-        return state
+        state = self._init_std(state)
+        state = self._init_archive(state)
+        state = self._init_fitness_history(state)
+        return self._cast_state(state)
+
+    def _init_std(self, state: State) -> State:
+        """Store the step size at init if the state has one."""
+        if not hasattr(state, "std"):
+            return state
+        return state.replace(std_init=state.std)
+
+    @partial(jax.jit, static_argnames=("self",))
+    def tell_from_key(
+        self,
+        key: jax.Array,
+        key_ask: jax.Array,
+        fitness: Fitness,
+        state: State,
+        params: Params,
+    ) -> tuple[State, Metrics]:
+        """Tell fitness, regenerating the perturbations from the ask key.
+
+        Instead of the full population, only the key passed to `ask` is required. The
+        perturbations are regenerated in chunks of `noise_chunk_size` members, so the
+        memory of the update is independent of the population size. `metrics_fn` and the
+        elite archive only receive the best member of the generation, and
+        `fitness_shaping_fn` receives no population, so it must not depend on it.
+        """
+        assert self.noise_chunk_size is not None, (
+            "tell_from_key requires noise_chunk_size to be set."
+        )
+        assert not uses_population(self.fitness_shaping_fn), (
+            "tell_from_key does not support fitness shaping that depends on the "
+            "population, e.g. add_weight_decay, use tell instead."
+        )
+
+        # Sort fitness once for all stages, masked members are ranked last
+        fitness = self._mask_fitness(fitness, params)
+        order = fitness_order(fitness, params.active_population_size)
+
+        # Regenerate best member of the generation
+        best_idx = order.best_idx[None]
+        z = self._sample_noise(key_ask, best_idx)
+        population = state.mean + state.std * z
+        fitness_best = fitness[best_idx]
+
+        # Update best solution and fitness
+        best_solution, best_fitness = update_best_solution_and_fitness(
+            population, fitness_best, state.best_solution, state.best_fitness
+        )
+        state = state.replace(best_solution=best_solution, best_fitness=best_fitness)
+        state = self._update_archive(population, fitness_best, state)
+        state = self._update_fitness_history(fitness, state, order)
+
+        # Compute metrics
+        metrics = self.metrics_fn(key, population, fitness_best, state, params)
+
+        # Shape fitness
+        fitness = call_with_order(
+            self.fitness_shaping_fn, None, fitness, state, params, order=order
+        )
+        fitness = self._mask_shaped_fitness(fitness, params)
+
+        # Accumulate sufficient statistics chunk by chunk
+        weights = self._noise_weights(fitness, state, params)
+        num_chunks = -(-self.population_size // self.noise_chunk_size)
+        active = self.get_active_mask(params)
+
+        def accumulate_stats(stats, chunk_idx):
+            idx = chunk_idx * self.noise_chunk_size + jnp.arange(self.noise_chunk_size)
+            mask = (idx < self.population_size) & active[
+                jnp.minimum(idx, self.population_size - 1)
+            ]
+            z = self._sample_noise(key_ask, idx)
+            weights_chunk = jax.tree.map(
+                lambda w: jnp.where(mask, w[jnp.minimum(idx, w.shape[0] - 1)], 0.0),
+                weights,
+            )
+            stats_chunk = self._noise_stats(z, weights_chunk, state, params)
+            return jax.tree.map(jnp.add, stats, stats_chunk), None
+
+        stats = jax.tree.map(
+            lambda x: jnp.zeros(x.shape, x.dtype),
+            jax.eval_shape(
+                self._noise_stats,
+                jnp.zeros((self.noise_chunk_size, self.num_dims)),
+                jax.tree.map(lambda w: w[: self.noise_chunk_size], weights),
+                state,
+                params,
+            ),
+        )
+        stats, _ = jax.lax.scan(accumulate_stats, stats, jnp.arange(num_chunks))
+
+        # Update state
+        state = self._noise_update(stats, state, params)
+        state = state.replace(generation_counter=state.generation_counter + 1)
+
+        return self._cast_state(state), metrics
+
+    def get_active_mask(self, params: Params) -> jax.Array:
+        """Return mask of the members that are active, keeping antithetic pairs."""
+        num_noise, offset, use_antithetic = self._noise_layout
+        if params.active_population_size is None or not use_antithetic:
+            return super().get_active_mask(params)
+        idx = jnp.arange(self.population_size)
+        num_pairs = (params.active_population_size - offset) // 2
+        return (idx < offset) | ((idx - offset) % num_noise < num_pairs)
+
+    @property
+    def _noise_layout(self) -> tuple[int, int, bool]:
+        """Return number of noise vectors, offset and antithetic sampling flag."""
+        return self.population_size, 0, False
+
+    def _sample_noise(self, key: jax.Array, idx: jax.Array) -> jax.Array:
+        """Return the standard normal perturbations of population members idx."""
+        num_noise, offset, use_antithetic = self._noise_layout
+        return jax.vmap(
+            partial(
+                sample_member_noise,
+                num_dims=self.num_dims,
+                num_noise=num_noise,
+                offset=offset,
+                use_antithetic=use_antithetic,
+            ),
+            in_axes=(None, 0),
+        )(key, idx)
+
+    def _noise_weights(self, fitness: Fitness, state: State, params: Params) -> PyTree:
+        """Return per-member weights of the sufficient statistics."""
+        return fitness
+
+    def _noise_stats(
+        self, z: jax.Array, weights: PyTree, state: State, params: Params
+    ) -> PyTree:
+        """Return sufficient statistics, additive over population members."""
+        raise NotImplementedError
+
+    def _noise_update(self, stats: PyTree, state: State, params: Params) -> State:
+        """Update state from sufficient statistics."""
+        raise NotImplementedError
 
     def get_mean(self, state: State) -> Solution:
         """Return unravelled mean."""
         mean = self._unravel_solution(state.mean)
         return mean
+
+    def _init_args_shape(self) -> tuple:
+        return (jax.eval_shape(lambda: self.solution),)
+
+
+def sample_member_noise(
+    key: jax.Array,
+    idx: jax.Array,
+    num_dims: int,
+    num_noise: int,
+    offset: int = 0,
+    use_antithetic: bool = False,
+) -> jax.Array:
+    """Regenerate the perturbation of population member idx from key.
+
+    Members before offset are unperturbed. With antithetic sampling, member
+    offset + num_noise + i is the mirror of member offset + i.
+    """
+    noise_idx = idx - offset
+    sign = 1.0
+    if use_antithetic:
+        sign = jnp.where(noise_idx < num_noise, 1.0, -1.0)
+        noise_idx = noise_idx % num_noise
+    z = jax.random.normal(jax.random.fold_in(key, noise_idx), (num_dims,))
+    return jnp.where(idx >= offset, sign * z, 0.0)
@@ -0,0 +1,285 @@
+"""Block-diagonal CMA-ES for PyTree solutions.
+
+CMA-ES with one covariance block per leaf of the solution, or per group of leaves, and
+a shared mean, evolution paths and step size. Blocks of the same size are stacked and
+eigendecomposed in one batch, so memory is the sum of O(d_i^2) over blocks instead of
+O(num_dims^2), e.g. one block per layer of a neural network.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+from flax import struct
+
+from evosax.core.fitness_shaping import weights_fitness_shaping_fn
+from evosax.types import Fitness, Population, PyTree, Solution
+
+from ..base import get_leaf_slices
+from .base import State as BaseState, metrics_fn
+from .cma_es import CMA_ES, Params as BaseParams, eigen_decomposition
+
+
+@struct.dataclass
+class State(BaseState):
+    mean: jax.Array
+    std: float
+    p_std: jax.Array
+    p_c: jax.Array
+    # Stacked blocks of the covariance matrix, one array per block size
+    C: tuple[jax.Array, ...]
+    B: tuple[jax.Array, ...]
+    D: tuple[jax.Array, ...]
+
+
+@struct.dataclass
+class Params(BaseParams):
+    c_1_block: tuple[float, ...]
+    c_mu_block: tuple[float, ...]
+
+
+class Block_CMA_ES(CMA_ES):
+    """Block-diagonal Covariance Matrix Adaptation Evolution Strategy."""
+
+    def __init__(
+        self,
+        population_size: int,
+        solution: Solution,
+        groups: PyTree | None = None,
+        fitness_shaping_fn: Callable = weights_fitness_shaping_fn,
+        metrics_fn: Callable = metrics_fn,
+        **kwargs,
+    ):
+        """Initialize block-diagonal CMA-ES.
+
+        Args:
+            population_size: Number of candidate solutions per generation.
+            solution: PyTree of a solution.
+            groups: PyTree with the structure of solution, where leaves with the same
+                group label share a covariance block. None for one block per leaf.
+            fitness_shaping_fn: Fitness shaping function.
+            metrics_fn: Metrics function.
+
+        """
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        # Flat indices of each block, from the leaves of the solution
+        leaf_slices = get_leaf_slices(solution)
+        if groups is None:
+            labels = range(len(leaf_slices))
+        else:
+            assert jax.tree.structure(groups) == jax.tree.structure(solution), (
+                "groups must have the same PyTree structure as solution."
+            )
+            labels = jax.tree.leaves(groups)
+
+        blocks = defaultdict(list)
+        for label, leaf_slice in zip(labels, leaf_slices, strict=True):
+            blocks[label].append(np.arange(self.num_dims)[leaf_slice])
+
+        # Stack blocks of the same size, shape (num_blocks, block_size) per size
+        blocks_by_size = defaultdict(list)
+        for block in blocks.values():
+            block = np.concatenate(block)
+            blocks_by_size[block.size].append(block)
+        self.block_indices = tuple(
+            np.stack(blocks_by_size[size]) for size in sorted(blocks_by_size)
+        )
+
+    @property
+    def _default_params(self) -> Params:
+        params = super()._default_params
+
+        # Learning rates of the covariance matrix for the size of each block
+        alpha_cov = 2
+        c_1_block, c_mu_block = [], []
+        for idx in self.block_indices:
+            block_size = idx.shape[1]
+            c_1 = alpha_cov / ((block_size + 1.3) ** 2 + params.mu_eff)  # Eq. (57)
+            c_mu = jnp.minimum(
+                1 - c_1 - 1e-8,
+                alpha_cov
+                * (params.mu_eff + 1 / params.mu_eff - 2)
+                / ((block_size + 2) ** 2 + alpha_cov * params.mu_eff / 2),
+            )  # Eq. (58)
+            c_1_block.append(c_1)
+            c_mu_block.append(c_mu)
+
+        return Params(
+            std_init=params.std_init,
+            std_min=params.std_min,
+            std_max=params.std_max,
+            weights=params.weights,
+            mu_eff=params.mu_eff,
+            c_mean=params.c_mean,
+            c_std=params.c_std,
+            d_std=params.d_std,
+            c_c=params.c_c,
+            c_1=params.c_1,  # Not used, see c_1_block
+            c_mu=params.c_mu,  # Not used, see c_mu_block
+            chi_n=params.chi_n,
+            c_1_block=tuple(c_1_block),
+            c_mu_block=tuple(c_mu_block),
+        )
+
+    def _init(self, key: jax.Array, params: Params) -> State:
+        eye = tuple(
+            jnp.broadcast_to(jnp.eye(idx.shape[1]), idx.shape + idx.shape[1:])
+            for idx in self.block_indices
+        )
+        state = State(
+            mean=jnp.full((self.num_dims,), jnp.nan),
+            std=params.std_init,
+            p_std=jnp.zeros(self.num_dims),
+            p_c=jnp.zeros(self.num_dims),
+            C=eye,
+            B=eye,
+            D=tuple(jnp.ones(idx.shape) for idx in self.block_indices),
+            best_solution=jnp.full((self.num_dims,), jnp.nan),
+            best_fitness=jnp.inf,
+            generation_counter=0,
+        )
+        return state
+
+    def _ask(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+    ) -> tuple[Population, State]:
+        # Compute B and D via eigen decomposition of each block of C
+        C, B, D = self._eigen_decomposition(state, params)
+
+        # Sample new population
+        z = jax.random.normal(key, (self.population_size, self.num_dims))
+        z = self._from_blocks(
+            tuple(
+                jnp.einsum("pnj,nkj->pnk", z_block * D_block, B_block)
+                for z_block, B_block, D_block in zip(
+                    self._to_blocks(z), B, D, strict=True
+                )
+            )
+        )
+        population = state.mean + state.std * z
+
+        return population, state.replace(C=C, B=B, D=D)
+
+    def _tell(
+        self,
+        key: jax.Array,
+        population: Population,
+        fitness: Fitness,
+        state: State,
+        params: Params,
+    ) -> State:
+        # Update mean
+        mean, y_k, y_w = self.update_mean(
+            population, fitness, state.mean, state.std, params
+        )
+
+        # Cumulative Step length Adaptation (CSA)
+        p_std = self.update_p_std(state.p_std, self._C_inv_sqrt(y_w, state), params)
+        norm_p_std = jnp.linalg.norm(p_std)
+
+        # Update std
+        std = self.update_std(state.std, norm_p_std, params)
+
+        # Covariance matrix adaptation
+        h_std = self.h_std(norm_p_std, state.generation_counter + 1, params)
+        p_c = self.update_p_c(state.p_c, h_std, y_w, params)
+
+        delta_h_std = self.delta_h_std(h_std, params)
+        w_o = self.rank_mu_weights(fitness, self._C_inv_sqrt(y_k, state))
+
+        C = []
+        for C_block, p_c_block, y_k_block, c_1, c_mu in zip(
+            state.C,
+            self._to_blocks(p_c),
+            self._to_blocks(y_k),
+            params.c_1_block,
+            params.c_mu_block,
+            strict=True,
+        ):
+            rank_one = jnp.einsum("nj,nk->njk", p_c_block, p_c_block)
+            rank_mu = jnp.einsum("i,inj,ink->njk", w_o, y_k_block, y_k_block)
+            C.append(
+                self.update_C(
+                    C_block,
+                    delta_h_std,
+                    rank_one,
+                    rank_mu,
+                    params.replace(c_1=c_1, c_mu=c_mu),
+                )
+            )
+
+        return state.replace(mean=mean, std=std, p_std=p_std, p_c=p_c, C=tuple(C))
+
+    def _eigen_decomposition(
+        self, state: State, params: Params
+    ) -> tuple[tuple, tuple, tuple]:
+        """Return blocks of C, B and D, reusing cached B and D between lazy updates."""
+
+        def decompose(C):
+            C, B, D = zip(
+                *(jax.vmap(eigen_decomposition)(C_block) for C_block in C),
+                strict=True,
+            )
+            return tuple(C), tuple(B), tuple(D)
+
+        if not self.lazy_eigen_decomposition:
+            return decompose(state.C)
+
+        return jax.lax.cond(
+            self._eigen_decomposition_due(state.generation_counter, params),
+            decompose,
+            lambda C: (C, state.B, state.D),
+            state.C,
+        )
+
+    def _eigen_decomposition_due(self, generation_counter: int, params: Params) -> bool:
+        """Return True if B and D are updated in the lazy eigen decomposition."""
+        gap = jnp.min(
+            jnp.stack(
+                [
+                    jnp.floor(1 / (10 * idx.shape[1] * (c_1 + c_mu)))
+                    for idx, c_1, c_mu in zip(
+                        self.block_indices,
+                        params.c_1_block,
+                        params.c_mu_block,
+                        strict=True,
+                    )
+                ]
+            )
+        )
+        return generation_counter % jnp.maximum(gap, 1).astype(jnp.int32) == 0
+
+    def _C_inv_sqrt(self, x: jax.Array, state: State) -> jax.Array:
+        """Return C^-1/2 x blockwise."""
+        return self._from_blocks(
+            tuple(
+                jnp.einsum(
+                    "...nk,njk->...nj",
+                    jnp.einsum("...nj,njk->...nk", x_block, B_block) / D_block,
+                    B_block,
+                )
+                for x_block, B_block, D_block in zip(
+                    self._to_blocks(x), state.B, state.D, strict=True
+                )
+            )
+        )
+
+    def _to_blocks(self, x: jax.Array) -> tuple[jax.Array, ...]:
+        """Gather the blocks of x, with shape (..., num_blocks, block_size) per size."""
+        return tuple(x[..., idx] for idx in self.block_indices)
+
+    def _from_blocks(self, x_blocks: tuple[jax.Array, ...]) -> jax.Array:
+        """Scatter blocks back into a vector of size num_dims."""
+        batch_shape = x_blocks[0].shape[:-2]
+        x = jnp.zeros(batch_shape + (self.num_dims,), x_blocks[0].dtype)
+        for idx, x_block in zip(self.block_indices, x_blocks, strict=True):
+            x = x.at[..., idx].set(x_block)
+        return x
@@ -0,0 +1,156 @@
+"""Cholesky-CMA-ES (Igel et al., 2006; Krause et al., 2016).
+
+CMA-ES maintaining a factor A of the covariance matrix C = A A^T and its inverse with
+rank-one updates, so every generation costs O(population_size * num_dims^2) without
+eigen decomposition.
+
+[1] Igel, Suttorp & Hansen (2006). A Computational Efficient Covariance Matrix Update
+    and a (1+1)-CMA for Evolution Strategies. GECCO.
+[2] Krause, Arbonès & Igel (2016). CMA-ES with Optimal Covariance Update and Storage
+    Complexity. NeurIPS.
+"""
+
+from collections.abc import Callable
+
+import jax
+import jax.numpy as jnp
+from flax import struct
+
+from evosax.core.fitness_shaping import weights_fitness_shaping_fn
+from evosax.types import Fitness, Population, Solution
+
+from .base import State as BaseState, metrics_fn
+from .cma_es import CMA_ES, Params as BaseParams
+
+
+@struct.dataclass
+class State(BaseState):
+    mean: jax.Array
+    std: float
+    p_std: jax.Array
+    p_c: jax.Array
+    A: jax.Array  # Factor of the covariance matrix, C = A A^T
+    A_inv: jax.Array
+
+
+@struct.dataclass
+class Params(BaseParams):
+    pass
+
+
+class Cholesky_CMA_ES(CMA_ES):
+    """Cholesky Covariance Matrix Adaptation Evolution Strategy (Cholesky-CMA-ES)."""
+
+    def __init__(
+        self,
+        population_size: int,
+        solution: Solution,
+        fitness_shaping_fn: Callable = weights_fitness_shaping_fn,
+        metrics_fn: Callable = metrics_fn,
+        **kwargs,
+    ):
+        """Initialize Cholesky-CMA-ES."""
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        self.quadratic_state_fields = ("A", "A_inv")
+
+    def _init(self, key: jax.Array, params: Params) -> State:
+        state = State(
+            mean=jnp.full((self.num_dims,), jnp.nan),
+            std=params.std_init,
+            p_std=jnp.zeros(self.num_dims),
+            p_c=jnp.zeros(self.num_dims),
+            A=jnp.eye(self.num_dims),
+            A_inv=jnp.eye(self.num_dims),
+            best_solution=jnp.full((self.num_dims,), jnp.nan),
+            best_fitness=jnp.inf,
+            generation_counter=0,
+        )
+        return state
+
+    def _ask(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+    ) -> tuple[Population, State]:
+        # Sample new population
+        z = jax.random.normal(key, (self.population_size, self.num_dims))
+        y = z @ state.A.T  # ~ N(0, C)
+        population = state.mean + state.std * y
+
+        return population, state
+
+    def _tell(
+        self,
+        key: jax.Array,
+        population: Population,
+        fitness: Fitness,
+        state: State,
+        params: Params,
+    ) -> State:
+        # Update mean
+        mean, y_k, y_w = self.update_mean(
+            population, fitness, state.mean, state.std, params
+        )
+
+        # Cumulative Step length Adaptation (CSA)
+        p_std = self.update_p_std(state.p_std, state.A_inv @ y_w, params)
+        norm_p_std = jnp.linalg.norm(p_std)
+
+        # Update std
+        std = self.update_std(state.std, norm_p_std, params)
+
+        # Covariance matrix adaptation
+        h_std = self.h_std(norm_p_std, state.generation_counter + 1, params)
+        p_c = self.update_p_c(state.p_c, h_std, y_w, params)
+
+        delta_h_std = self.delta_h_std(h_std, params)
+        w_o = self.rank_mu_weights(fitness, y_k @ state.A_inv.T)
+        A, A_inv = self.update_A(
+            state.A,
+            state.A_inv,
+            delta_h_std,
+            jnp.concatenate([p_c[None], y_k]),
+            jnp.concatenate([jnp.atleast_1d(params.c_1), params.c_mu * w_o]),
+            params,
+        )
+
+        return state.replace(mean=mean, std=std, p_std=p_std, p_c=p_c, A=A, A_inv=A_inv)
+
+    def update_A(
+        self,
+        A: jax.Array,
+        A_inv: jax.Array,
+        delta_h_std: float,
+        vectors: jax.Array,
+        betas: jax.Array,
+        params: Params,
+    ) -> tuple[jax.Array, jax.Array]:
+        """Update the factor of C = alpha * C + sum_i beta_i * v_i v_i^T."""
+        alpha = (
+            1
+            + params.c_1 * delta_h_std
+            - params.c_1
+            - params.c_mu * jnp.sum(params.weights)
+        )  # Eq. (47)
+        A = jnp.sqrt(alpha) * A
+        A_inv = A_inv / jnp.sqrt(alpha)
+
+        def rank_one_update(carry, x):
+            A, A_inv = carry
+            v, beta = x
+
+            u = A_inv @ v
+            norm_u_sq = jnp.clip(jnp.dot(u, u), min=1e-8)
+            # Negative updates are clipped to keep C positive definite
+            a = jnp.sqrt(jnp.clip(1 + beta * norm_u_sq, min=1e-8))
+
+            A = A + ((a - 1) / norm_u_sq) * jnp.outer(v, u)
+            A_inv = A_inv - ((1 - 1 / a) / norm_u_sq) * jnp.outer(u, u @ A_inv)
+            return (A, A_inv), None
+
+        (A, A_inv), _ = jax.lax.scan(rank_one_update, (A, A_inv), (vectors, betas))
+        return A, A_inv
@@ -57,12 +57,22 @@ class CMA_ES(DistributionBasedAlgorithm):
         solution: Solution,
         fitness_shaping_fn: Callable = weights_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        *,
+        lazy_eigen_decomposition: bool = False,
+        **kwargs,
     ):
         """Initialize CMA-ES."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         self.elite_ratio = 0.5
         self.use_negative_weights = True
+        self.quadratic_state_fields = ("C", "B")
+
+        # Reuse B and D between eigen decompositions, updated every
+        # 1 / (10 * num_dims * (c_1 + c_mu)) generations
+        self.lazy_eigen_decomposition = lazy_eigen_decomposition
 
     @property
     def _default_params(self) -> Params:
@@ -166,7 +176,7 @@ class CMA_ES(DistributionBasedAlgorithm):
         params: Params,
     ) -> tuple[Population, State]:
         # Compute B and D via eigen decomposition of C
-        C, B, D = eigen_decomposition(state.C)
+        C, B, D = self._eigen_decomposition(state, params)
 
         # Sample new population
         z = jax.random.normal(key, (self.population_size, self.num_dims))  # Eq. (38)
@@ -175,6 +185,25 @@ class CMA_ES(DistributionBasedAlgorithm):
 
         return population, state.replace(C=C, B=B, D=D)
 
+    def _eigen_decomposition(
+        self, state: State, params: Params
+    ) -> tuple[jax.Array, jax.Array, jax.Array]:
+        """Return C, B and D, reusing cached B and D between lazy updates."""
+        if not self.lazy_eigen_decomposition:
+            return eigen_decomposition(state.C)
+
+        return jax.lax.cond(
+            self._eigen_decomposition_due(state.generation_counter, params),
+            eigen_decomposition,
+            lambda C: (C, state.B, state.D),
+            state.C,
+        )
+
+    def _eigen_decomposition_due(self, generation_counter: int, params: Params) -> bool:
+        """Return True if B and D are updated in the lazy eigen decomposition."""
+        gap = jnp.floor(1 / (10 * self.num_dims * (params.c_1 + params.c_mu)))
+        return generation_counter % jnp.maximum(gap, 1).astype(jnp.int32) == 0
+
     def _tell(
         self,
         key: jax.Array,
@@ -266,13 +295,17 @@ class CMA_ES(DistributionBasedAlgorithm):
         self, fitness: Fitness, y_k: jax.Array, C_inv_sqrt_y_k: jax.Array
     ) -> jax.Array:
         """Compute the rank-mu update term for the covariance matrix."""
-        w_o = fitness * jnp.where(
+        w_o = self.rank_mu_weights(fitness, C_inv_sqrt_y_k)
+        return jnp.einsum("i,ij,ik->jk", w_o, y_k, y_k)
+
+    def rank_mu_weights(self, fitness: Fitness, C_inv_sqrt_y_k: jax.Array) -> jax.Array:
+        """Compute the weights of the rank-mu update, rescaling negative weights."""
+        return fitness * jnp.where(
             fitness >= 0,
             1,
             self.num_dims
             / jnp.clip(jnp.sum(jnp.square(C_inv_sqrt_y_k), axis=-1), min=1e-8),
         )  # Eq. (46)
-        return jnp.einsum("i,ij,ik->jk", w_o, y_k, y_k)
 
     def update_C(
         self,
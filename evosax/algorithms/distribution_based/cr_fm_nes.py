@@ -11,6 +11,7 @@ import jax.numpy as jnp
 from flax import struct
 
 from evosax.core.fitness_shaping import weights_fitness_shaping_fn
+from evosax.core.ordering import FitnessOrder, fitness_order
 from evosax.types import Fitness, Population, Solution
 
 from .base import (
@@ -81,10 +82,13 @@ class CR_FM_NES(DistributionBasedAlgorithm):
         solution: Solution,
         fitness_shaping_fn: Callable = weights_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize CR-FM-NES."""
         assert population_size % 2 == 0, "Population size must be even."
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         self.elite_ratio = 0.5
 
@@ -167,6 +171,10 @@ class CR_FM_NES(DistributionBasedAlgorithm):
         )
         return state
 
+    @property
+    def _noise_layout(self) -> tuple[int, int, bool]:
+        return self.population_size // 2, 0, True
+
     def _ask(
         self,
         key: jax.Array,
@@ -190,9 +198,11 @@ class CR_FM_NES(DistributionBasedAlgorithm):
         fitness: Fitness,
         state: State,
         params: Params,
+        order: FitnessOrder | None = None,
     ) -> State:
-        ranks = jax.scipy.stats.rankdata(-fitness, axis=-1) - 1.0
-        weights_hat = params.weights_hat[..., ranks.astype(jnp.int32)]
+        if order is None:
+            order = fitness_order(-fitness)
+        weights_hat = params.weights_hat[..., order.ranks.astype(jnp.int32)]
 
         # Remove negative weights
         fitness = jnp.clip(fitness, min=0.0)
@@ -208,7 +218,12 @@ class CR_FM_NES(DistributionBasedAlgorithm):
             params.alpha_dist * jnp.linalg.norm(state.z, axis=-1)
         )
         weights_dist = weights_hat * weights_dist_hat
-        weights_dist = weights_dist / jnp.sum(weights_dist) - 1.0 / self.population_size
+        weights_dist = jnp.where(
+            self.get_active_mask(params),
+            weights_dist / jnp.sum(weights_dist)
+            - 1.0 / self._get_population_size(params),
+            0.0,
+        )
 
         movement_cond = params.chi_n <= norm_p_std
         weights = jnp.where(movement_cond, weights_dist, fitness)
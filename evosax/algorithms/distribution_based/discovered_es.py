@@ -42,9 +42,12 @@ class DiscoveredES(DistributionBasedAlgorithm):
         optimizer: optax.GradientTransformation = optax.sgd(learning_rate=1.0),
         fitness_shaping_fn: Callable = weights_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize DES."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         # Optimizer
         self.optimizer = optimizer
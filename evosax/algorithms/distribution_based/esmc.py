@@ -50,10 +50,14 @@ class ESMC(DistributionBasedAlgorithm):
         std_schedule: Callable = optax.constant_schedule(1.0),
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        noise_chunk_size: int | None = None,
+        **kwargs,
     ):
         """Initialize ESMC."""
         assert population_size >= 4, "Population size must be >= 4"
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         # Optimizer
         self.optimizer = optimizer
@@ -61,6 +65,9 @@ class ESMC(DistributionBasedAlgorithm):
         # std schedule
         self.std_schedule = std_schedule
 
+        # Seed-regenerated perturbations
+        self.noise_chunk_size = noise_chunk_size
+
     @property
     def _default_params(self) -> Params:
         return Params()
@@ -76,15 +83,24 @@ class ESMC(DistributionBasedAlgorithm):
         )
         return state
 
+    @property
+    def _noise_layout(self) -> tuple[int, int, bool]:
+        return self.population_size // 2 - 1, 2, True
+
     def _ask(
         self,
         key: jax.Array,
         state: State,
         params: Params,
     ) -> tuple[Population, State]:
-        # Antithetic sampling
-        z_plus = jax.random.normal(key, (self.population_size // 2 - 1, self.num_dims))
-        z = jnp.concatenate([jnp.zeros((2, self.num_dims)), z_plus, -z_plus])
+        if self.noise_chunk_size is not None:
+            z = self._sample_noise(key, jnp.arange(self.population_size))
+        else:
+            # Antithetic sampling
+            z_plus = jax.random.normal(
+                key, (self.population_size // 2 - 1, self.num_dims)
+            )
+            z = jnp.concatenate([jnp.zeros((2, self.num_dims)), z_plus, -z_plus])
         x = state.mean + state.std * z
         return x, state
 
@@ -96,19 +112,29 @@ class ESMC(DistributionBasedAlgorithm):
         state: State,
         params: Params,
     ) -> State:
-        z_plus = (
-            population[2 : self.population_size // 2 + 1] - state.mean
-        ) / state.std
-
-        fitness_baseline, fitness = jnp.mean(fitness[:2], axis=0), fitness[2:]
-        fitness_plus = fitness[: self.population_size // 2 - 1]
-        fitness_minus = fitness[self.population_size // 2 - 1 :]
+        z = (population - state.mean) / state.std
+        stats = self._noise_stats(
+            z, self._noise_weights(fitness, state, params), state, params
+        )
+        return self._noise_update(stats, state, params)
 
-        # Compute grad
-        delta = jnp.minimum(fitness_plus, fitness_baseline) - jnp.minimum(
-            fitness_minus, fitness_baseline
+    def _noise_weights(self, fitness: Fitness, state: State, params: Params) -> Fitness:
+        # Baseline members are unperturbed and do not contribute to the grad
+        fitness_baseline = jnp.mean(fitness[:2], axis=0)
+        weights = jnp.where(
+            self.get_active_mask(params), jnp.minimum(fitness, fitness_baseline), 0.0
         )
-        grad = jnp.dot(delta, z_plus) / int((self.population_size - 1) / 2)
+        return weights.at[:2].set(0.0)
+
+    def _noise_stats(
+        self, z: jax.Array, weights: Fitness, state: State, params: Params
+    ) -> jax.Array:
+        return jnp.dot(weights, z)
+
+    def _noise_update(self, stats: jax.Array, state: State, params: Params) -> State:
+        # Compute grad, summing over antithetic pairs
+        # delta = min(fitness_plus, baseline) - min(fitness_minus, baseline)
+        grad = stats / ((self._get_population_size(params) - 1) // 2)
 
         # Update mean
         updates, opt_state = self.optimizer.update(grad, state.opt_state)
@@ -3,8 +3,8 @@
 [1] https://arxiv.org/abs/2403.02985
 """
 
-import pkgutil
 from collections.abc import Callable
+from importlib.resources import files
 
 import jax
 import jax.numpy as jnp
@@ -19,7 +19,7 @@ from ...learned_evolution.evotf_tools import (
     FitnessFeaturizer,
     SolutionFeaturizer,
 )
-from ...learned_evolution.les_tools import load_pkl_object
+from ...learned_evolution.les_tools import load_checkpoint
 from .base import (
     DistributionBasedAlgorithm,
     Params as BaseParams,
@@ -119,8 +119,14 @@ class EvoTF_ES(DistributionBasedAlgorithm):
         params_path: str | None = None,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        # Masked members would enter the learned update
+        self.supports_masking = False
 
         self.max_context_len = max_context_len
         self.model_config = model_config
@@ -152,7 +158,7 @@ class EvoTF_ES(DistributionBasedAlgorithm):
             self.params = params
         elif params_path is not None:
             # Load params from checkpoint
-            self.ckpt = load_pkl_object(params_path)
+            self.ckpt = load_checkpoint(params_path)
             self.params = self.ckpt["net_params"]
             self.model_config = self.ckpt["model_config"]
             self.model = EvoTransformer(**self.model_config)
@@ -176,9 +182,9 @@ class EvoTF_ES(DistributionBasedAlgorithm):
             )
         else:
             # Load default params
-            ckpt_fname = "2024_03_SNES_small.pkl"
-            data = pkgutil.get_data(__name__, f"../ckpt/evotf/{ckpt_fname}")
-            self.ckpt = load_pkl_object(data, pkg_load=True)
+            ckpt_fname = "2024_03_SNES_small.npz"
+            ckpt_path = files("evosax.algorithms.ckpt").joinpath("evotf", ckpt_fname)
+            self.ckpt = load_checkpoint(str(ckpt_path))
             self.params = self.ckpt["net_params"]
             self.model_config = self.ckpt["model_config"]
             self.model = EvoTransformer(**self.model_config)
@@ -44,9 +44,12 @@ class GradientlessDescent(DistributionBasedAlgorithm):
         solution: Solution,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize GLD."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
     @property
     def _default_params(self) -> Params:
@@ -87,6 +90,10 @@ class GradientlessDescent(DistributionBasedAlgorithm):
         x = state.mean + radius[..., None] * z
         return x, state
 
+    def _mask_shaped_fitness(self, fitness: Fitness, params: Params) -> Fitness:
+        # Masked members keep NaN fitness, so they are never selected
+        return self._mask_fitness(fitness, params)
+
     def _tell(
         self,
         key: jax.Array,
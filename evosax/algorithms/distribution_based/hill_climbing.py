@@ -42,9 +42,12 @@ class HillClimbing(DistributionBasedAlgorithm):
         std_schedule: Callable = optax.constant_schedule(1.0),
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize Gaussian Hill Climbing."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         # std schedule
         self.std_schedule = std_schedule
@@ -75,6 +78,10 @@ class HillClimbing(DistributionBasedAlgorithm):
         population = state.mean + state.std * z
         return population, state
 
+    def _mask_shaped_fitness(self, fitness: Fitness, params: Params) -> Fitness:
+        # Masked members keep NaN fitness, so they are never selected
+        return self._mask_fitness(fitness, params)
+
     def _tell(
         self,
         key: jax.Array,
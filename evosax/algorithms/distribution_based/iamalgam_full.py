@@ -14,6 +14,7 @@ import optax
 from flax import struct
 
 from evosax.core.fitness_shaping import identity_fitness_shaping_fn
+from evosax.core.ordering import FitnessOrder
 from evosax.types import Fitness, Population, Solution
 
 from ..base import update_best_solution_and_fitness
@@ -61,11 +62,18 @@ class iAMaLGaM_Full(DistributionBasedAlgorithm):
         std_schedule: Callable = optax.constant_schedule(1.0),
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize iAMaLGaM."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        # Masked members would enter the fixed-size elite selection
+        self.supports_masking = False
 
         self.elite_ratio = 0.5
+        self.quadratic_state_fields = ("C",)
         alpha_ams = (
             0.5
             * self.elite_ratio
@@ -146,9 +154,11 @@ class iAMaLGaM_Full(DistributionBasedAlgorithm):
         fitness: Fitness,
         state: State,
         params: Params,
+        order: FitnessOrder | None = None,
     ) -> State:
         # Sort
-        idx = jnp.argsort(fitness)[: self.num_elites]
+        argsort = jnp.argsort(fitness) if order is None else order.argsort
+        idx = argsort[: self.num_elites]
         elites = population[idx]
         fitness_elites = fitness[idx]
 
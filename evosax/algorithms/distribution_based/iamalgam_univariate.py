@@ -28,10 +28,16 @@ class iAMaLGaM_Univariate(iAMaLGaM_Full):
         std_schedule: Callable = optax.constant_schedule(1.0),
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize iAMaLGaM."""
         super().__init__(
-            population_size, solution, std_schedule, fitness_shaping_fn, metrics_fn
+            population_size,
+            solution,
+            std_schedule,
+            fitness_shaping_fn,
+            metrics_fn,
+            **kwargs,
         )
 
     def _init(self, key: jax.Array, params: Params) -> State:
@@ -7,8 +7,8 @@ meta-trained and tested on a handful of Brax tasks. The results may therefore di
 from the ones shown in the paper.
 """
 
-import pkgutil
 from collections.abc import Callable
+from importlib.resources import files
 
 import jax
 import jax.numpy as jnp
@@ -22,7 +22,7 @@ from ...learned_evolution.les_tools import (
     EvolutionPath,
     EvoPathMLP,
     FitnessFeatures,
-    load_pkl_object,
+    load_checkpoint,
     tanh_timestamp,
 )
 from ..base import update_best_solution_and_fitness
@@ -61,9 +61,15 @@ class LearnedES(DistributionBasedAlgorithm):
         params_path: str | None = None,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize LES."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        # Masked members would enter the learned update
+        self.supports_masking = False
 
         # LES components
         self.fitness_features = FitnessFeatures(centered_rank=True, z_score=True)
@@ -78,12 +84,12 @@ class LearnedES(DistributionBasedAlgorithm):
             self.les_params = params
         elif params_path is not None:
             # Load params from checkpoint
-            self.les_params = load_pkl_object(params_path)
+            self.les_params = load_checkpoint(params_path)
         else:
             # Load default params
-            ckpt_fname = "2023_10_les_v2.pkl"
-            data = pkgutil.get_data(__name__, f"../ckpt/les/{ckpt_fname}")
-            self.les_params = load_pkl_object(data, pkg_load=True)
+            ckpt_fname = "2023_10_les_v2.npz"
+            ckpt_path = files("evosax.algorithms.ckpt").joinpath("les", ckpt_fname)
+            self.les_params = load_checkpoint(str(ckpt_path))
 
     @property
     def _default_params(self) -> Params:
@@ -37,12 +37,16 @@ class LM_MA_ES(MA_ES):
         solution: Solution,
         fitness_shaping_fn: Callable = weights_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize LM-MA-ES."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         self.elite_ratio = 0.5
         self.use_negative_weights = False
+        self.quadratic_state_fields = ()
 
     @property
     def _default_params(self) -> Params:
@@ -39,12 +39,16 @@ class MA_ES(CMA_ES):
         solution: Solution,
         fitness_shaping_fn: Callable = weights_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize MA-ES."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         self.elite_ratio = 0.5
         self.use_negative_weights = False
+        self.quadratic_state_fields = ("M",)
 
     def _init(self, key: jax.Array, params: Params) -> State:
         state = State(
@@ -47,10 +47,13 @@ class NoiseReuseES(DistributionBasedAlgorithm):
         std_schedule: Callable = optax.constant_schedule(1.0),
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize NRES."""
         assert population_size % 2 == 0, "Population size must be even."
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         # Optimizer
         self.optimizer = optimizer
@@ -75,6 +78,10 @@ class NoiseReuseES(DistributionBasedAlgorithm):
         )
         return state
 
+    @property
+    def _noise_layout(self) -> tuple[int, int, bool]:
+        return self.population_size // 2, 0, True
+
     def _ask(
         self, key: jax.Array, state: State, params: Params
     ) -> tuple[Population, State]:
@@ -99,7 +106,11 @@ class NoiseReuseES(DistributionBasedAlgorithm):
         params: Params,
     ) -> State:
         # Compute grad
-        grad = jnp.dot(fitness, state.pert) / state.std**2 / self.population_size
+        grad = (
+            jnp.dot(fitness, state.pert)
+            / state.std**2
+            / self._get_population_size(params)
+        )
 
         # Update mean
         updates, opt_state = self.optimizer.update(grad, state.opt_state)
@@ -46,10 +46,14 @@ class Open_ES(DistributionBasedAlgorithm):
         std_schedule: Callable = optax.constant_schedule(1.0),
         fitness_shaping_fn: Callable = centered_rank_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        noise_chunk_size: int | None = None,
+        **kwargs,
     ):
         """Initialize OpenAI-ES."""
         assert population_size % 2 == 0, "Population size must be even."
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         # Optimizer
         self.optimizer = optimizer
@@ -60,6 +64,9 @@ class Open_ES(DistributionBasedAlgorithm):
         # Antithetic sampling
         self.use_antithetic_sampling = use_antithetic_sampling
 
+        # Seed-regenerated perturbations
+        self.noise_chunk_size = noise_chunk_size
+
     @property
     def _default_params(self) -> Params:
         return Params()
@@ -75,13 +82,21 @@ class Open_ES(DistributionBasedAlgorithm):
         )
         return state
 
+    @property
+    def _noise_layout(self) -> tuple[int, int, bool]:
+        if self.use_antithetic_sampling:
+            return self.population_size // 2, 0, True
+        return self.population_size, 0, False
+
     def _ask(
         self,
         key: jax.Array,
         state: State,
         params: Params,
     ) -> tuple[Population, State]:
-        if self.use_antithetic_sampling:
+        if self.noise_chunk_size is not None:
+            z = self._sample_noise(key, jnp.arange(self.population_size))
+        elif self.use_antithetic_sampling:
             z_plus = jax.random.normal(key, (self.population_size // 2, self.num_dims))
             z = jnp.concatenate([z_plus, -z_plus])
         else:
@@ -97,10 +112,20 @@ class Open_ES(DistributionBasedAlgorithm):
         state: State,
         params: Params,
     ) -> State:
-        # Compute grad
-        grad = jnp.dot(fitness, (population - state.mean) / state.std) / (
-            self.population_size * state.std
+        z = (population - state.mean) / state.std
+        stats = self._noise_stats(
+            z, self._noise_weights(fitness, state, params), state, params
         )
+        return self._noise_update(stats, state, params)
+
+    def _noise_stats(
+        self, z: jax.Array, weights: Fitness, state: State, params: Params
+    ) -> jax.Array:
+        return jnp.dot(weights, z)
+
+    def _noise_update(self, stats: jax.Array, state: State, params: Params) -> State:
+        # Compute grad
+        grad = stats / (self._get_population_size(params) * state.std)
 
         # Update mean
         updates, opt_state = self.optimizer.update(grad, state.opt_state)
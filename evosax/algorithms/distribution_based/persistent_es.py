@@ -48,10 +48,13 @@ class PersistentES(DistributionBasedAlgorithm):
         std_schedule: Callable = optax.constant_schedule(1.0),
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize PES."""
         assert population_size % 2 == 0, "Population size must be even."
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         # Optimizer
         self.optimizer = optimizer
@@ -76,6 +79,10 @@ class PersistentES(DistributionBasedAlgorithm):
         )
         return state
 
+    @property
+    def _noise_layout(self) -> tuple[int, int, bool]:
+        return self.population_size // 2, 0, True
+
     def _ask(
         self, key: jax.Array, state: State, params: Params
     ) -> tuple[Population, State]:
@@ -100,7 +107,11 @@ class PersistentES(DistributionBasedAlgorithm):
         params: Params,
     ) -> State:
         # Compute grad
-        grad = jnp.dot(fitness, state.pert_accum) / state.std**2 / self.population_size
+        grad = (
+            jnp.dot(fitness, state.pert_accum)
+            / state.std**2
+            / self._get_population_size(params)
+        )
 
         # Update mean
         updates, opt_state = self.optimizer.update(grad, state.opt_state)
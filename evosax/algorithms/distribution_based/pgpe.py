@@ -48,14 +48,21 @@ class PGPE(DistributionBasedAlgorithm):
         ),
         fitness_shaping_fn: Callable = centered_rank_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        noise_chunk_size: int | None = None,
+        **kwargs,
     ):
         """Initialize PGPE."""
         assert population_size % 2 == 0, "Population size must be even."
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         # Optimizer
         self.optimizer = optimizer
 
+        # Seed-regenerated perturbations
+        self.noise_chunk_size = noise_chunk_size
+
     @property
     def _default_params(self) -> Params:
         return Params(
@@ -75,15 +82,22 @@ class PGPE(DistributionBasedAlgorithm):
         )
         return state
 
+    @property
+    def _noise_layout(self) -> tuple[int, int, bool]:
+        return self.population_size // 2, 0, True
+
     def _ask(
         self,
         key: jax.Array,
         state: State,
         params: Params,
     ) -> tuple[Population, State]:
-        # Antithetic sampling
-        z_plus = jax.random.normal(key, (self.population_size // 2, self.num_dims))
-        z = jnp.concatenate([z_plus, -z_plus])
+        if self.noise_chunk_size is not None:
+            z = self._sample_noise(key, jnp.arange(self.population_size))
+        else:
+            # Antithetic sampling
+            z_plus = jax.random.normal(key, (self.population_size // 2, self.num_dims))
+            z = jnp.concatenate([z_plus, -z_plus])
 
         population = state.mean + state.std * z
         return population, state
@@ -96,35 +110,43 @@ class PGPE(DistributionBasedAlgorithm):
         state: State,
         params: Params,
     ) -> State:
-        z_scaled = population[: self.population_size // 2] - state.mean
-        fitness_plus = fitness[: self.population_size // 2]
-        fitness_minus = fitness[self.population_size // 2 :]
-
-        # Compute grad for mean
-        grad_mean = (
-            jnp.dot(fitness_plus - fitness_minus, z_scaled) / self.population_size
-        )  # equivalent to below
-
-        # grad_mean = jnp.mean(
-        #     0.5 * (fitness_plus - fitness_minus)[:, None] * z_scaled, axis=0
-        # )
-
-        # Compute grad for std
-        baseline = jnp.mean(fitness)
-        grad_std = (
-            jnp.dot(
-                fitness_plus + fitness_minus - 2 * baseline,
-                (z_scaled**2 - state.std**2) / state.std,
-            )
-            / self.population_size
-        )  # equivalent to below
-
-        # grad_std = jnp.mean(
-        #     (0.5 * (fitness_plus + fitness_minus) - baseline)
-        #     * (z_scaled**2 - state.std**2)
-        #     / state.std,
-        #     axis=0,
-        # )
+        z = (population - state.mean) / state.std
+        stats = self._noise_stats(
+            z, self._noise_weights(fitness, state, params), state, params
+        )
+        return self._noise_update(stats, state, params)
+
+    def _noise_weights(
+        self, fitness: Fitness, state: State, params: Params
+    ) -> tuple[Fitness, Fitness]:
+        baseline = jnp.sum(fitness) / self._get_population_size(params)
+        return fitness, jnp.where(self.get_active_mask(params), fitness - baseline, 0.0)
+
+    def _noise_stats(
+        self,
+        z: jax.Array,
+        weights: tuple[Fitness, Fitness],
+        state: State,
+        params: Params,
+    ) -> tuple[jax.Array, jax.Array]:
+        fitness, fitness_centered = weights
+        return jnp.dot(fitness, z), jnp.dot(fitness_centered, z**2 - 1)
+
+    def _noise_update(
+        self, stats: tuple[jax.Array, jax.Array], state: State, params: Params
+    ) -> State:
+        fitness_z, fitness_centered_z_sq = stats
+
+        # Compute grad for mean, summing over antithetic pairs
+        # jnp.dot(fitness_plus - fitness_minus, z_scaled) / population_size
+        grad_mean = state.std * fitness_z / self._get_population_size(params)
+
+        # Compute grad for std, summing over antithetic pairs
+        # jnp.dot(
+        #     fitness_plus + fitness_minus - 2 * baseline,
+        #     (z_scaled**2 - state.std**2) / state.std,
+        # ) / population_size
+        grad_std = state.std * fitness_centered_z_sq / self._get_population_size(params)
 
         # Update mean
         updates, opt_state = self.optimizer.update(grad_mean, state.opt_state)
@@ -39,9 +39,12 @@ class RandomSearch(DistributionBasedAlgorithm):
         sampling_fn: Callable,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize Random Search."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
         self.sampling_fn = sampling_fn
 
     @property
@@ -70,6 +73,10 @@ class RandomSearch(DistributionBasedAlgorithm):
         population = jax.vmap(self._ravel_solution)(population)
         return population, state
 
+    def _mask_shaped_fitness(self, fitness: Fitness, params: Params) -> Fitness:
+        # Masked members keep NaN fitness, so they are never selected
+        return self._mask_fitness(fitness, params)
+
     def _tell(
         self,
         key: jax.Array,
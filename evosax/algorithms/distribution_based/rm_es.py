@@ -45,12 +45,16 @@ class Rm_ES(CMA_ES):
         m: int = 1,
         fitness_shaping_fn: Callable = weights_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize Rm-ES."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         self.elite_ratio = 0.5
         self.use_negative_weights = False
+        self.quadratic_state_fields = ()
 
         # Number of evolution paths
         self.m = m
@@ -83,7 +87,9 @@ class Rm_ES(CMA_ES):
             cumulative_rank_rate=0.0,
             P=jnp.zeros((self.m, self.num_dims)),
             t=jnp.zeros(self.m),
-            fitness_elites_sorted=jnp.full((self.num_elites,), -jnp.inf),
+            fitness_elites_sorted=self._pad_elites(
+                jnp.full((self.num_elites,), -jnp.inf), params
+            ),
             best_solution=jnp.full((self.num_dims,), jnp.nan),
             best_fitness=jnp.inf,
             generation_counter=0,
@@ -115,8 +121,11 @@ class Rm_ES(CMA_ES):
         state: State,
         params: Params,
     ) -> State:
-        # Sort
-        fitness_elites_sorted = jnp.sort(fitness)[: self.num_elites]
+        # Sort active members, padded elites are inf so they are ranked last
+        fitness_active = jnp.where(self.get_active_mask(params), fitness, jnp.inf)
+        fitness_elites_sorted = self._pad_elites(
+            jnp.sort(fitness_active)[: self.num_elites], params
+        )
 
         # Update mean
         mean, y_k, y_w = self.update_mean(
@@ -126,13 +135,10 @@ class Rm_ES(CMA_ES):
         # Rank-based Success Rule (RSR)
         F = jnp.concatenate([state.fitness_elites_sorted, fitness_elites_sorted])
         ranks = jax.scipy.stats.rankdata(F, axis=-1) - 1.0
-        q = (
-            jnp.dot(
-                params.weights[: self.num_elites],
-                ranks[: self.num_elites] - ranks[self.num_elites :],
-            )
-            / self.num_elites
-        )
+        q = jnp.dot(
+            params.weights[: self.num_elites],
+            ranks[: self.num_elites] - ranks[self.num_elites :],
+        ) / self._get_num_elites(params)
         cumulative_rank_rate = (
             1 - params.c_std
         ) * state.cumulative_rank_rate + params.c_std * (q - params.q_star)
@@ -181,6 +187,14 @@ class Rm_ES(CMA_ES):
             fitness_elites_sorted=fitness_elites_sorted,
         )
 
+    def _pad_elites(self, fitness_elites: jax.Array, params: Params) -> jax.Array:
+        """Set elites beyond the elites of the active members to inf."""
+        return jnp.where(
+            jnp.arange(self.num_elites) < self._get_num_elites(params),
+            fitness_elites,
+            jnp.inf,
+        )
+
     def update_std(
         self, std: float, cumulative_rank_rate: float, params: Params
     ) -> float:
@@ -42,12 +42,16 @@ class Sep_CMA_ES(CMA_ES):
         solution: Solution,
         fitness_shaping_fn: Callable = weights_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize Sep-CMA-ES."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         self.elite_ratio = 0.5
         self.use_negative_weights = False
+        self.quadratic_state_fields = ()
 
     def _init(self, key: jax.Array, params: Params) -> State:
         state = State(
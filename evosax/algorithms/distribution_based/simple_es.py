@@ -46,15 +46,22 @@ class SimpleES(DistributionBasedAlgorithm):
         optimizer: optax.GradientTransformation = optax.sgd(learning_rate=1.0),
         fitness_shaping_fn: Callable = weights_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        noise_chunk_size: int | None = None,
+        **kwargs,
     ):
         """Initialize Simple ES."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         self.elite_ratio = 0.5
 
         # Optimizer
         self.optimizer = optimizer
 
+        # Seed-regenerated perturbations
+        self.noise_chunk_size = noise_chunk_size
+
     @property
     def _default_params(self) -> Params:
         mask = jnp.arange(self.population_size) < self.num_elites
@@ -83,7 +90,10 @@ class SimpleES(DistributionBasedAlgorithm):
         state: State,
         params: Params,
     ) -> tuple[Population, State]:
-        z = jax.random.normal(key, (self.population_size, self.num_dims))
+        if self.noise_chunk_size is not None:
+            z = self._sample_noise(key, jnp.arange(self.population_size))
+        else:
+            z = jax.random.normal(key, (self.population_size, self.num_dims))
         population = state.mean + state.std * z
         return population, state
 
@@ -95,15 +105,31 @@ class SimpleES(DistributionBasedAlgorithm):
         state: State,
         params: Params,
     ) -> State:
+        z = (population - state.mean) / state.std
+        stats = self._noise_stats(
+            z, self._noise_weights(fitness, state, params), state, params
+        )
+        return self._noise_update(stats, state, params)
+
+    def _noise_stats(
+        self, z: jax.Array, weights: Fitness, state: State, params: Params
+    ) -> tuple[jax.Array, jax.Array]:
+        return jnp.dot(weights, z), jnp.dot(weights, z**2)
+
+    def _noise_update(
+        self, stats: tuple[jax.Array, jax.Array], state: State, params: Params
+    ) -> State:
+        fitness_z, fitness_z_sq = stats
+
         # Compute grad
-        grad = -jnp.dot(fitness, population - state.mean)
+        grad = -state.std * fitness_z
 
         # Update mean
         updates, opt_state = self.optimizer.update(grad, state.opt_state)
         mean = optax.apply_updates(state.mean, updates)
 
         # Update std
-        std_update = jnp.sqrt(jnp.dot(fitness, (population - state.mean) ** 2))
+        std_update = state.std * jnp.sqrt(fitness_z_sq)
         std = (1 - params.c_std) * state.std + params.c_std * std_update
 
         return state.replace(mean=mean, std=std, opt_state=opt_state)
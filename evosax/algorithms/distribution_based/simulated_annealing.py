@@ -47,9 +47,12 @@ class SimulatedAnnealing(DistributionBasedAlgorithm):
         std_schedule: Callable = optax.constant_schedule(1.0),
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize SA."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         # std schedule
         self.std_schedule = std_schedule
@@ -85,6 +88,10 @@ class SimulatedAnnealing(DistributionBasedAlgorithm):
         population = state.mean + state.std * z
         return population, state
 
+    def _mask_shaped_fitness(self, fitness: Fitness, params: Params) -> Fitness:
+        # Masked members keep NaN fitness, so they are never selected
+        return self._mask_fitness(fitness, params)
+
     def _tell(
         self,
         key: jax.Array,
@@ -93,7 +100,7 @@ class SimulatedAnnealing(DistributionBasedAlgorithm):
         state: State,
         params: Params,
     ) -> State:
-        best_idx = jnp.argmin(fitness)
+        best_idx = jnp.nanargmin(fitness)
         best_member, best_fitness = population[best_idx], fitness[best_idx]
 
         delta = best_fitness - state.fitness
@@ -42,12 +42,24 @@ class SNES(xNES):
         optimizer: optax.GradientTransformation = optax.sgd(learning_rate=1.0),
         fitness_shaping_fn: Callable = weights_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        noise_chunk_size: int | None = None,
+        **kwargs,
     ):
         """Initialize SNES."""
         super().__init__(
-            population_size, solution, optimizer, fitness_shaping_fn, metrics_fn
+            population_size,
+            solution,
+            optimizer,
+            fitness_shaping_fn,
+            metrics_fn,
+            **kwargs,
         )
 
+        self.quadratic_state_fields = ()
+
+        # Seed-regenerated perturbations
+        self.noise_chunk_size = noise_chunk_size
+
     @property
     def _default_params(self) -> Params:
         params = super()._default_params
@@ -79,7 +91,10 @@ class SNES(xNES):
         state: State,
         params: Params,
     ) -> tuple[Population, State]:
-        z = jax.random.normal(key, (self.population_size, self.num_dims))
+        if self.noise_chunk_size is not None:
+            z = self._sample_noise(key, jnp.arange(self.population_size))
+        else:
+            z = jax.random.normal(key, (self.population_size, self.num_dims))
         population = state.mean + state.std * z
         return population, state
 
@@ -92,16 +107,30 @@ class SNES(xNES):
         params: Params,
     ) -> State:
         z = (population - state.mean) / state.std
+        stats = self._noise_stats(
+            z, self._noise_weights(fitness, state, params), state, params
+        )
+        return self._noise_update(stats, state, params)
+
+    def _noise_stats(
+        self, z: jax.Array, weights: Fitness, state: State, params: Params
+    ) -> tuple[jax.Array, jax.Array]:
+        return jnp.dot(weights, z), jnp.dot(weights, z**2 - 1)
+
+    def _noise_update(
+        self, stats: tuple[jax.Array, jax.Array], state: State, params: Params
+    ) -> State:
+        fitness_z, fitness_z_sq = stats
 
         # Compute grad
-        grad_mean = -state.std * jnp.dot(fitness, z)
+        grad_mean = -state.std * fitness_z
 
         # Update mean
         updates, opt_state = self.optimizer.update(grad_mean, state.opt_state)
         mean = optax.apply_updates(state.mean, updates)
 
         # Compute grad for std
-        grad_std = jnp.dot(fitness, z**2 - 1)
+        grad_std = fitness_z_sq
 
         # Update std
         std = state.std * jnp.exp(0.5 * state.lr_std * grad_std)
@@ -4,8 +4,10 @@ from collections.abc import Callable
 from functools import partial
 
 import jax
+import jax.numpy as jnp
 
 from evosax.core.kernel import kernel_rbf
+from evosax.core.ordering import call_with_order, fitness_order
 from evosax.types import Fitness, Metrics, Population, Solution
 
 from ...base import update_best_solution_and_fitness
@@ -29,10 +31,11 @@ class SV_ES(DistributionBasedAlgorithm):
         kernel: Callable = kernel_rbf,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize base class for Stein Variational Evolution Strategy."""
         DistributionBasedAlgorithm.__init__(
-            self, population_size, solution, fitness_shaping_fn, metrics_fn
+            self, population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
         )
 
         self.num_populations = num_populations
@@ -50,7 +53,10 @@ class SV_ES(DistributionBasedAlgorithm):
         """Initialize distribution-based algorithm."""
         state = self._init(key, params)
         state = state.replace(mean=jax.vmap(self._ravel_solution)(means))
-        return state
+        state = self._init_std(state)
+        state = self._init_archive(state)
+        state = self._init_fitness_history(state)
+        return self._cast_state(state)
 
     @partial(jax.jit, static_argnames=("self",))
     def ask(
@@ -61,15 +67,18 @@ class SV_ES(DistributionBasedAlgorithm):
     ) -> tuple[Population, State]:
         """Ask evolutionary algorithm for new candidate solutions to evaluate."""
         # Generate population
-        population, state = self._ask(key, state, params)
+        with jax.named_scope("ask"):
+            population, state = self._ask(key, state, params)
 
         # Reshape population
         population = population.reshape(self.total_population_size, self.num_dims)
 
         # Unravel population
-        population = jax.vmap(self._unravel_solution)(population)
+        with jax.named_scope("unravel"):
+            population = jax.vmap(self._unravel_solution)(population)
+            population = self._shard_population(population)
 
-        return population, state
+        return self._cast_population(population), self._cast_state(state)
 
     @partial(jax.jit, static_argnames=("self",))
     def tell(
@@ -82,7 +91,11 @@ class SV_ES(DistributionBasedAlgorithm):
     ) -> tuple[State, Metrics]:
         """Tell evolutionary algorithm fitness for state update."""
         # Ravel population
-        population = jax.vmap(jax.vmap(self._ravel_solution))(population)
+        with jax.named_scope("ravel"):
+            population, fitness = self._shard_population((population, fitness))
+            population = jax.vmap(jax.vmap(self._ravel_solution))(population)
+            population = self._upcast_population(population)
+            population = self._shard_population(population)
 
         # Reshape population and fitness
         population = population.reshape(
@@ -90,29 +103,61 @@ class SV_ES(DistributionBasedAlgorithm):
         )
         fitness = fitness.reshape(self.num_populations, self.population_size)
 
+        # Sort fitness once for all stages, masked members are ranked last
+        with jax.named_scope("order"):
+            fitness = self._mask_fitness(fitness, params)
+            order = jax.vmap(fitness_order, in_axes=(0, None))(
+                fitness, params.active_population_size
+            )
+
         # Update best solution and fitness
-        best_solution, best_fitness = jax.vmap(update_best_solution_and_fitness)(
-            population, fitness, state.best_solution, state.best_fitness
-        )
+        best_solution, best_fitness = jax.vmap(
+            partial(
+                update_best_solution_and_fitness,
+                sharded=self.population_sharding is not None,
+            )
+        )(population, fitness, state.best_solution, state.best_fitness, order.best_idx)
         state = state.replace(best_solution=best_solution, best_fitness=best_fitness)
 
+        # Archive and history share one order of the flattened fitness
+        flat_fitness = fitness.reshape(self.total_population_size)
+        flat_order = fitness_order(
+            flat_fitness,
+            None
+            if params.active_population_size is None
+            else self.num_populations * params.active_population_size,
+        )
+        state = self._update_archive(
+            population.reshape(self.total_population_size, self.num_dims),
+            flat_fitness,
+            state,
+            flat_order,
+        )
+        state = self._update_fitness_history(flat_fitness, state, flat_order)
+
         # Compute metrics
         key, subkey = jax.random.split(key)
         keys = jax.random.split(subkey, num=self.num_populations)
-        metrics = jax.vmap(self.metrics_fn, in_axes=(0, 0, 0, 0, None))(
-            keys, population, fitness, state, params
-        )
+        with jax.named_scope("metrics"):
+            metrics = jax.vmap(
+                partial(call_with_order, self.metrics_fn),
+                in_axes=(0, 0, 0, self._state_axes(state), None),
+            )(keys, population, fitness, state, params, order=order)
 
         # Shape fitness
-        fitness = jax.vmap(self.fitness_shaping_fn, in_axes=(0, 0, 0, None))(
-            population, fitness, state, params
-        )
+        with jax.named_scope("shape"):
+            fitness = jax.vmap(
+                partial(call_with_order, self.fitness_shaping_fn),
+                in_axes=(0, 0, self._state_axes(state), None),
+            )(population, fitness, state, params, order=order)
+            fitness = self._mask_shaped_fitness(fitness, params)
 
         # Update state
-        state = self._tell(key, population, fitness, state, params)
+        with jax.named_scope("tell"):
+            state = self._call_tell(key, population, fitness, state, params, order)
         state = state.replace(generation_counter=state.generation_counter + 1)
 
-        return state, metrics
+        return self._cast_state(state), metrics
 
     def _init(self, key: jax.Array, params: Params) -> State:
         keys = jax.random.split(key, num=self.num_populations)
@@ -126,9 +171,30 @@ class SV_ES(DistributionBasedAlgorithm):
         params: Params,
     ) -> tuple[Population, State]:
         keys = jax.random.split(key, num=self.num_populations)
-        return jax.vmap(super()._ask, in_axes=(0, 0, None))(keys, state, params)
+        state_axes = self._state_axes(state)
+        return jax.vmap(
+            super()._ask, in_axes=(0, state_axes, None), out_axes=(0, state_axes)
+        )(keys, state, params)
+
+    def _state_axes(self, state: State) -> State:
+        """Return vmap axes of the state, archive and history are shared."""
+        return jax.tree.map(lambda _: 0, state).replace(
+            archive_solution=None,
+            archive_fitness=None,
+            best_fitness_history=None,
+            median_fitness_history=None,
+        )
 
     def get_mean(self, state: State) -> Solution:
         """Return unravelled mean."""
         mean = jax.vmap(self._unravel_solution)(state.mean)
         return mean
+
+    def _init_args_shape(self) -> tuple:
+        mean = jax.tree.map(
+            lambda x: jax.ShapeDtypeStruct(
+                (self.num_populations,) + jnp.shape(x), jnp.result_type(x)
+            ),
+            self.solution,
+        )
+        return (mean,)
@@ -13,7 +13,12 @@ from evosax.core.fitness_shaping import weights_fitness_shaping_fn
 from evosax.core.kernel import kernel_rbf
 from evosax.types import Fitness, Population, Solution
 
-from ..cma_es import CMA_ES, Params as BaseParams, State as BaseState
+from ..cma_es import (
+    CMA_ES,
+    Params as BaseParams,
+    State as BaseState,
+    eigen_decomposition,
+)
 from .base import SV_ES, metrics_fn
 
 
@@ -39,6 +44,9 @@ class SV_CMA_ES(SV_ES, CMA_ES):
         kernel: Callable = kernel_rbf,
         fitness_shaping_fn: Callable = weights_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        *,
+        lazy_eigen_decomposition: bool = False,
+        **kwargs,
     ):
         """Initialize SV-CMA-ES."""
         SV_ES.__init__(
@@ -49,6 +57,7 @@ class SV_CMA_ES(SV_ES, CMA_ES):
             kernel,
             fitness_shaping_fn,
             metrics_fn,
+            **kwargs,
         )
 
         CMA_ES.__init__(
@@ -57,6 +66,8 @@ class SV_CMA_ES(SV_ES, CMA_ES):
             solution,
             fitness_shaping_fn,
             metrics_fn,
+            lazy_eigen_decomposition=lazy_eigen_decomposition,
+            **kwargs,
         )
 
     @property
@@ -79,6 +90,33 @@ class SV_CMA_ES(SV_ES, CMA_ES):
             alpha=1.0,
         )
 
+    def _ask(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+    ) -> tuple[Population, State]:
+        # Eigen decomposition outside of the vmap over populations, where the lazy
+        # update would evaluate both branches of lax.cond
+        if self.lazy_eigen_decomposition:
+            C, B, D = jax.lax.cond(
+                self._eigen_decomposition_due(state.generation_counter[0], params),
+                jax.vmap(eigen_decomposition),
+                lambda C: (C, state.B, state.D),
+                state.C,
+            )
+        else:
+            C, B, D = jax.vmap(eigen_decomposition)(state.C)
+        state = state.replace(C=C, B=B, D=D)
+
+        return super()._ask(key, state, params)
+
+    def _eigen_decomposition(
+        self, state: State, params: Params
+    ) -> tuple[jax.Array, jax.Array, jax.Array]:
+        # B and D of all populations are already updated in _ask
+        return state.C, state.B, state.D
+
     def _tell(
         self,
         key: jax.Array,
@@ -43,6 +43,7 @@ class SV_Open_ES(SV_ES, Open_ES):
         std_schedule: Callable = optax.constant_schedule(1.0),
         fitness_shaping_fn: Callable = centered_rank_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize SV-OpenAI-ES."""
         SV_ES.__init__(
@@ -53,6 +54,7 @@ class SV_Open_ES(SV_ES, Open_ES):
             kernel,
             fitness_shaping_fn,
             metrics_fn,
+            **kwargs,
         )
 
         Open_ES.__init__(
@@ -64,6 +66,7 @@ class SV_Open_ES(SV_ES, Open_ES):
             std_schedule,
             fitness_shaping_fn,
             metrics_fn,
+            **kwargs,
         )
 
     @property
@@ -81,7 +84,7 @@ class SV_Open_ES(SV_ES, Open_ES):
         # OpenAI-ES gradient
         grad = jax.vmap(jnp.dot)(
             fitness, (state.mean[:, None] - population) / state.std[:, None, None]
-        ) / (self.population_size * state.std[:, None])
+        ) / (self._get_population_size(params) * state.std[:, None])
 
         # Compute SVGD steps
         svgd_grad = svgd_grad_fn(state.mean, grad, self.kernel, params)
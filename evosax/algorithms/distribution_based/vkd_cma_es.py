@@ -0,0 +1,329 @@
+"""VkD-CMA-ES (Akimoto & Hansen, 2016).
+
+CMA-ES with a restricted covariance model C = D (I + V diag(eigenvalues) V^T) D, where
+D is diagonal and V has max_rank orthonormal columns. Each generation, the CMA-ES
+covariance update is projected back onto the model with a Rayleigh-Ritz step in a
+subspace of dimension O(max_rank), so memory is O(max_rank * num_dims) and every
+generation costs O(population_size * max_rank * num_dims).
+
+The number k of principal vectors is adapted online [2], up to max_rank. Every window
+of generations, the time scale 1 / (c_1 + c_mu) of the covariance learning, the slopes
+of log std, log D^2 and log(1 + eigenvalues) are compared with the expected progress
+rate of log std. k is increased by a factor if they all stagnate while all k
+eigenvalues exceed rank_inc_cond, i.e. the model is saturated. Trailing principal
+vectors whose 1 + eigenvalue is below rank_dec_cond and no longer grows at the
+learning rate are removed. The learning rates follow the number of free parameters of
+the model of rank k.
+
+[1] Akimoto & Hansen (2016). Projection-Based Restricted Covariance Matrix Adaptation
+    for High Dimension. GECCO.
+[2] Akimoto & Hansen (2016). Online Model Selection for Restricted Covariance Matrix
+    Adaptation. PPSN.
+"""
+
+import math
+from collections.abc import Callable
+
+import jax
+import jax.numpy as jnp
+from flax import struct
+
+from evosax.core.fitness_shaping import weights_fitness_shaping_fn
+from evosax.types import Fitness, Population, Solution
+
+from .base import State as BaseState, metrics_fn
+from .cma_es import CMA_ES, Params as BaseParams
+
+
+@struct.dataclass
+class State(BaseState):
+    mean: jax.Array
+    std: float
+    p_std: jax.Array
+    p_c: jax.Array
+    D: jax.Array
+    V: jax.Array  # Orthonormal principal vectors, one per column
+    eigenvalues: jax.Array  # Zero for the columns of V beyond rank
+    rank: int  # Number of active principal vectors
+    generation_rank_ref: int  # Generation of the reference of the rank adaptation
+    log_std_ref: float
+    log_D_ref: jax.Array
+    log_eigenvalues_ref: jax.Array  # log(1 + eigenvalues)
+
+
+@struct.dataclass
+class Params(BaseParams):
+    rank_inc_cond: float
+    rank_dec_cond: float
+    rank_factor: float
+    std_slope_factor: float
+    D_slope_factor: float
+    rank_dec_slope_factor: float
+
+
+class VkD_CMA_ES(CMA_ES):
+    """VkD Covariance Matrix Adaptation Evolution Strategy (VkD-CMA-ES)."""
+
+    def __init__(
+        self,
+        population_size: int,
+        solution: Solution,
+        fitness_shaping_fn: Callable = weights_fitness_shaping_fn,
+        metrics_fn: Callable = metrics_fn,
+        **kwargs,
+    ):
+        """Initialize VkD-CMA-ES."""
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        self.elite_ratio = 0.5
+        self.use_negative_weights = False
+        self.quadratic_state_fields = ()
+
+        # Maximum number of principal vectors of the covariance model, rank is adapted
+        # between 0 and max_rank
+        self.max_rank = max(1, min(self.num_dims - 1, int(math.log(self.num_dims))))
+
+    @property
+    def _default_params(self) -> Params:
+        params = super()._default_params
+        return Params(
+            std_init=params.std_init,
+            std_min=params.std_min,
+            std_max=params.std_max,
+            weights=params.weights,
+            mu_eff=params.mu_eff,
+            c_mean=params.c_mean,
+            c_std=params.c_std,
+            d_std=params.d_std,
+            c_c=params.c_c,
+            c_1=params.c_1,  # Not used, see learning_rates
+            c_mu=params.c_mu,  # Not used, see learning_rates
+            chi_n=params.chi_n,
+            rank_inc_cond=30.0,
+            rank_dec_cond=30.0,
+            rank_factor=jnp.sqrt(2.0),
+            std_slope_factor=0.1,
+            D_slope_factor=1.0,
+            rank_dec_slope_factor=0.1,
+        )
+
+    def _init(self, key: jax.Array, params: Params) -> State:
+        state = State(
+            mean=jnp.full((self.num_dims,), jnp.nan),
+            std=params.std_init,
+            p_std=jnp.zeros(self.num_dims),
+            p_c=jnp.zeros(self.num_dims),
+            D=jnp.ones(self.num_dims),
+            V=jnp.zeros((self.num_dims, self.max_rank)),
+            eigenvalues=jnp.zeros(self.max_rank),
+            rank=0,
+            generation_rank_ref=0,
+            log_std_ref=jnp.log(params.std_init),
+            log_D_ref=jnp.zeros(self.num_dims),
+            log_eigenvalues_ref=jnp.zeros(self.max_rank),
+            best_solution=jnp.full((self.num_dims,), jnp.nan),
+            best_fitness=jnp.inf,
+            generation_counter=0,
+        )
+        return state
+
+    def _ask(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+    ) -> tuple[Population, State]:
+        # Sample new population
+        z = jax.random.normal(key, (self.population_size, self.num_dims))
+        scale = jnp.sqrt(1 + state.eigenvalues) - 1
+        y = state.D * (z + ((z @ state.V) * scale) @ state.V.T)  # ~ N(0, C)
+        population = state.mean + state.std * y
+
+        return population, state
+
+    def _tell(
+        self,
+        key: jax.Array,
+        population: Population,
+        fitness: Fitness,
+        state: State,
+        params: Params,
+    ) -> State:
+        # Update mean
+        mean, y_k, y_w = self.update_mean(
+            population, fitness, state.mean, state.std, params
+        )
+
+        # Cumulative Step length Adaptation (CSA)
+        y_w_tilde = y_w / state.D
+        scale = 1 / jnp.sqrt(1 + state.eigenvalues) - 1
+        C_inv_sqrt_y_w = y_w_tilde + ((y_w_tilde @ state.V) * scale) @ state.V.T
+        p_std = self.update_p_std(state.p_std, C_inv_sqrt_y_w, params)
+        norm_p_std = jnp.linalg.norm(p_std)
+
+        # Update std
+        std = self.update_std(state.std, norm_p_std, params)
+
+        # Covariance matrix adaptation
+        h_std = self.h_std(norm_p_std, state.generation_counter + 1, params)
+        p_c = self.update_p_c(state.p_c, h_std, y_w, params)
+
+        state = self.update_rank(state, params)
+        delta_h_std = self.delta_h_std(h_std, params)
+        c_1, c_mu = self.learning_rates(state.rank, params)
+        D, V, eigenvalues = self.update_covariance(
+            state, p_c, y_k, jnp.clip(fitness, min=0.0), delta_h_std, c_1, c_mu, params
+        )
+
+        return state.replace(
+            mean=mean,
+            std=std,
+            p_std=p_std,
+            p_c=p_c,
+            D=D,
+            V=V,
+            eigenvalues=eigenvalues,
+        )
+
+    def update_rank(self, state: State, params: Params) -> State:
+        """Adapt the number of principal vectors, see [2]."""
+        log_std = jnp.log(state.std)
+        log_D = jnp.log(state.D)
+        log_eigenvalues = jnp.log1p(state.eigenvalues)
+
+        # Check every window of the time scale of the covariance learning
+        c_1, c_mu = self.learning_rates(state.rank, params)
+        num_generations = state.generation_counter - state.generation_rank_ref
+        is_check = num_generations >= jnp.ceil(1 / (c_1 + c_mu))
+
+        # Slopes of the log scales per generation relative to the expected progress
+        # rate of log std
+        progress_rate = 0.5 * min(1.0, self.population_size / self.num_dims)
+        num_generations = jnp.maximum(num_generations, 1)
+        std_slope = jnp.abs(log_std - state.log_std_ref) / num_generations
+        D_slope = 2 * jnp.abs(log_D - state.log_D_ref) / num_generations
+        eigenvalues_slope = (
+            jnp.abs(log_eigenvalues - state.log_eigenvalues_ref) / num_generations
+        )
+        std_stagnates = std_slope < params.std_slope_factor * progress_rate
+        D_stagnates = D_slope < params.D_slope_factor * progress_rate
+        eigenvalues_stagnate = eigenvalues_slope < params.D_slope_factor * progress_rate
+
+        # Increase rank if the model of rank k is saturated
+        active = jnp.arange(self.max_rank) < state.rank
+        is_saturated = (
+            std_stagnates
+            & jnp.all(D_stagnates)
+            & jnp.all(eigenvalues_stagnate | ~active)
+            & jnp.all((1 + state.eigenvalues >= params.rank_inc_cond) | ~active)
+        )
+        rank_inc = jnp.minimum(
+            jnp.maximum(
+                state.rank + 1, jnp.floor(state.rank * params.rank_factor)
+            ).astype(jnp.int32),
+            self.max_rank,
+        )
+
+        # Decrease rank by the trailing vectors whose eigenvalues are small and no
+        # longer grow at the learning rate of the covariance
+        eigenvalues_grow = eigenvalues_slope >= params.rank_dec_slope_factor * (
+            c_1 + c_mu
+        )
+        keep = eigenvalues_grow | (1 + state.eigenvalues >= params.rank_dec_cond)
+        rank_dec = jnp.sum(jnp.cumprod(keep & active))
+
+        rank = jnp.where(is_saturated, rank_inc, rank_dec)
+        return state.replace(
+            rank=jnp.where(is_check, rank, state.rank),
+            generation_rank_ref=jnp.where(
+                is_check, state.generation_counter, state.generation_rank_ref
+            ),
+            log_std_ref=jnp.where(is_check, log_std, state.log_std_ref),
+            log_D_ref=jnp.where(is_check, log_D, state.log_D_ref),
+            log_eigenvalues_ref=jnp.where(
+                is_check, log_eigenvalues, state.log_eigenvalues_ref
+            ),
+        )
+
+    def learning_rates(self, rank: int, params: Params) -> tuple[float, float]:
+        """Compute c_1 and c_mu for the free parameters of the model of rank k."""
+        # Dimension of a full covariance model with as many free parameters
+        num_dims_eq = jnp.minimum(
+            jnp.sqrt(2 * (rank + 1) * self.num_dims), self.max_num_dims_sq
+        )
+
+        alpha_cov = 2
+        c_1 = alpha_cov / ((num_dims_eq + 1.3) ** 2 + params.mu_eff)  # Eq. (57)
+        c_mu = jnp.minimum(
+            1 - c_1 - 1e-8,
+            alpha_cov
+            * (params.mu_eff + 1 / params.mu_eff - 2)
+            / ((num_dims_eq + 2) ** 2 + alpha_cov * params.mu_eff / 2),
+        )  # Eq. (58)
+        return c_1, c_mu
+
+    def update_covariance(
+        self,
+        state: State,
+        p_c: jax.Array,
+        y_k: jax.Array,
+        weights: jax.Array,
+        delta_h_std: float,
+        c_1: float,
+        c_mu: float,
+        params: Params,
+    ) -> tuple[jax.Array, jax.Array, jax.Array]:
+        """Project the CMA-ES covariance update onto the restricted model."""
+        alpha = 1 + c_1 * delta_h_std - c_1 - c_mu * jnp.sum(weights)  # Eq. (47)
+
+        # Updated covariance S in the coordinates scaled by D, applied in O(k * d)
+        p_c = p_c / state.D
+        y_k = y_k / state.D
+
+        def S_matvec(X):
+            return (
+                alpha * (X + state.V @ (state.eigenvalues[:, None] * (state.V.T @ X)))
+                + c_1 * jnp.outer(p_c, p_c @ X)
+                + c_mu * y_k.T @ (weights[:, None] * (y_k @ X))
+            )
+
+        S_diag = (
+            alpha * (1 + jnp.square(state.V) @ state.eigenvalues)
+            + c_1 * jnp.square(p_c)
+            + c_mu * weights @ jnp.square(y_k)
+        )
+
+        # Correlation matrix T = S_diag^-1/2 S S_diag^-1/2 minus identity
+        S_diag_inv_sqrt = 1 / jnp.sqrt(jnp.clip(S_diag, min=1e-16))
+
+        def T_matvec(X):
+            X_scaled = S_diag_inv_sqrt[:, None] * X
+            return S_diag_inv_sqrt[:, None] * S_matvec(X_scaled) - X
+
+        # Rayleigh-Ritz in the span of V, the new directions and one power iteration
+        X = jnp.concatenate([state.V, p_c[:, None], (weights @ y_k)[:, None]], axis=1)
+        Q, _ = jnp.linalg.qr(jnp.concatenate([X, T_matvec(X)], axis=1))
+        M = Q.T @ T_matvec(Q)
+        eigenvalues, U = jnp.linalg.eigh((M + M.T) / 2)
+
+        # Keep the rank largest eigenvalues of T as low-rank part W W^T, the others and
+        # negative ones go to the diagonal
+        eigenvalues = jnp.clip(eigenvalues[::-1][: self.max_rank], min=0.0)
+        eigenvalues = jnp.where(
+            jnp.arange(self.max_rank) < state.rank, eigenvalues, 0.0
+        )
+        W = (Q @ U[:, ::-1][:, : self.max_rank]) * jnp.sqrt(eigenvalues)
+
+        # Diagonal of S not explained by the low-rank part, guarded against round-off
+        D_scale = jnp.sqrt(jnp.clip(1 - jnp.sum(jnp.square(W), axis=1), min=1e-8))
+        D = state.D * jnp.sqrt(S_diag) * D_scale
+
+        # Low-rank part in the coordinates scaled by the new D, as orthonormal vectors
+        # and eigenvalues, in O(max_rank^2 * num_dims)
+        V, R = jnp.linalg.qr(W / D_scale[:, None])
+        eigenvalues, U = jnp.linalg.eigh(R @ R.T)
+        V = V @ U[:, ::-1]
+        eigenvalues = jnp.clip(eigenvalues[::-1], min=0.0)
+        return D, V, eigenvalues
@@ -50,9 +50,14 @@ class xNES(DistributionBasedAlgorithm):
         optimizer: optax.GradientTransformation = optax.sgd(learning_rate=1.0),
         fitness_shaping_fn: Callable = weights_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize xNES."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        self.quadratic_state_fields = ("B",)
 
         # Optimizer
         self.optimizer = optimizer
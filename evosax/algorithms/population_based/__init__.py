@@ -1,23 +1,47 @@
 """Population-based algorithms module."""
 
-from .differential_evolution import DifferentialEvolution
-from .diffusion_evolution import DiffusionEvolution
-from .gesmr_ga import GESMR_GA
-from .learned_ga import LearnedGA
-from .mr15_ga import MR15_GA
-from .pso import PSO
-from .samr_ga import SAMR_GA
-from .simple_ga import SimpleGA
+# ruff: noqa: F401
 
-population_based_algorithms = {
-    "DifferentialEvolution": DifferentialEvolution,
-    "DiffusionEvolution": DiffusionEvolution,
-    "GESMR_GA": GESMR_GA,
-    "LGA": LearnedGA,
-    "MR15_GA": MR15_GA,
-    "PSO": PSO,
-    "SAMR_GA": SAMR_GA,
-    "SimpleGA": SimpleGA,
-}
+from typing import TYPE_CHECKING
+
+from evosax.core.lazy import LazyRegistry, lazy_getattr
+
+if TYPE_CHECKING:
+    from .differential_evolution import DifferentialEvolution
+    from .diffusion_evolution import DiffusionEvolution
+    from .gesmr_ga import GESMR_GA
+    from .learned_ga import LearnedGA
+    from .mr15_ga import MR15_GA
+    from .pso import PSO
+    from .samr_ga import SAMR_GA
+    from .simple_ga import SimpleGA
+
+__getattr__, __dir__ = lazy_getattr(
+    __name__,
+    {
+        "DifferentialEvolution": ".differential_evolution",
+        "DiffusionEvolution": ".diffusion_evolution",
+        "GESMR_GA": ".gesmr_ga",
+        "LearnedGA": ".learned_ga",
+        "MR15_GA": ".mr15_ga",
+        "PSO": ".pso",
+        "SAMR_GA": ".samr_ga",
+        "SimpleGA": ".simple_ga",
+    },
+)
+
+population_based_algorithms = LazyRegistry(
+    __name__,
+    {
+        "DifferentialEvolution": "DifferentialEvolution",
+        "DiffusionEvolution": "DiffusionEvolution",
+        "GESMR_GA": "GESMR_GA",
+        "LGA": "LearnedGA",
+        "MR15_GA": "MR15_GA",
+        "PSO": "PSO",
+        "SAMR_GA": "SAMR_GA",
+        "SimpleGA": "SimpleGA",
+    },
+)
 
 __all__ = list(population_based_algorithms.keys())
@@ -8,6 +8,7 @@ import jax.numpy as jnp
 from flax import struct
 
 from evosax.core.fitness_shaping import identity_fitness_shaping_fn
+from evosax.core.ordering import call_with_order, fitness_order
 from evosax.types import Fitness, Population, Solution
 
 from ..base import (
@@ -38,9 +39,12 @@ class PopulationBasedAlgorithm(EvolutionaryAlgorithm):
         solution: Solution,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize base class for population-based algorithm."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
     @partial(jax.jit, static_argnames=("self",))
     def init(
@@ -56,14 +60,28 @@ class PopulationBasedAlgorithm(EvolutionaryAlgorithm):
         # Ravel population
         population = jax.vmap(self._ravel_solution)(population)
 
+        # Initialize elite archive with initial population
+        fitness = self._mask_fitness(fitness, params)
+        order = fitness_order(fitness, params.active_population_size)
+        state = self._init_archive(state)
+        state = self._update_archive(population, fitness, state, order)
+        state = self._init_fitness_history(state)
+
         # Shape fitness
-        fitness = self.fitness_shaping_fn(population, fitness, state, params)
+        fitness = call_with_order(
+            self.fitness_shaping_fn, population, fitness, state, params, order=order
+        )
+        fitness = self._mask_shaped_fitness(fitness, params)
 
         state = state.replace(
             population=population,
             fitness=fitness,
         )
-        return state
+        return self._cast_state(state)
+
+    def _mask_shaped_fitness(self, fitness: Fitness, params: Params) -> Fitness:
+        """Set shaped fitness of inactive members to NaN, so they are never selected."""
+        return self._mask_fitness(fitness, params)
 
     def get_best_solution(self, state: State) -> Solution:
         """Return unravelled best solution."""
@@ -74,3 +92,13 @@ class PopulationBasedAlgorithm(EvolutionaryAlgorithm):
     def get_population(self, state: State) -> Population:
         """Return unravelled population."""
         return jax.vmap(self._unravel_solution)(state.population)
+
+    def _init_args_shape(self) -> tuple:
+        population = jax.tree.map(
+            lambda x: jax.ShapeDtypeStruct(
+                (self.population_size,) + jnp.shape(x), jnp.result_type(x)
+            ),
+            self.solution,
+        )
+        fitness = jax.ShapeDtypeStruct((self.population_size,), jnp.float32)
+        return population, fitness
@@ -34,7 +34,12 @@ class Params(BaseParams):
 
 
 class DifferentialEvolution(PopulationBasedAlgorithm):
-    """Differential Evolution (DE)."""
+    """Differential Evolution (DE).
+
+    Trial i of `ask` only competes with member i, so `tell` accepts partial batches
+    for steady-state use: candidates that were not evaluated have NaN fitness and
+    leave their member unchanged.
+    """
 
     def __init__(
         self,
@@ -43,10 +48,13 @@ class DifferentialEvolution(PopulationBasedAlgorithm):
         num_diff: int = 1,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize DE."""
         assert population_size >= 4, "DE requires population_size >= 4."
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         self.num_diff = num_diff
 
@@ -122,7 +130,7 @@ class DifferentialEvolution(PopulationBasedAlgorithm):
         state: State,
         params: Params,
     ) -> State:
-        # Replace member in population if performance improved
+        # Replace member in population if performance improved, NaN never replaces
         replace = fitness <= state.fitness
         population = jnp.where(replace[..., None], population, state.population)
         fitness = jnp.where(replace, fitness, state.fitness)
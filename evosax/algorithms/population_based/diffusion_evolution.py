@@ -85,12 +85,19 @@ class DiffusionEvolution(PopulationBasedAlgorithm):
         num_latent_dims: int | None = None,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize Diffusion Evolution."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        # Masked members would enter the fitness-weighted denoising
+        self.supports_masking = False
 
         self.num_generations = num_generations
         self.num_latent_dims = num_latent_dims
+        self.quadratic_state_fields = ("latent_projection",)
         self.fitness_mapping = fitness_mapping
         self.alpha_schedule = alpha_schedule
 
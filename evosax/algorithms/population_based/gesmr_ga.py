@@ -45,12 +45,18 @@ class GESMR_GA(PopulationBasedAlgorithm):
         num_groups: int = 1,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize GESMR."""
         assert (population_size - 1) % num_groups == 0, (
             "Population size must be divisible by number of std groups"
         )
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        # Masked members would enter the fixed-size elite selection
+        self.supports_masking = False
 
         self.elite_ratio = 0.5
         self.std_ratio = 0.5
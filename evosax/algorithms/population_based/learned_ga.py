@@ -7,8 +7,8 @@ meta-trained and tested on a handful of Brax tasks. The results may therefore di
 from the ones shown in the paper.
 """
 
-import pkgutil
 from collections.abc import Callable
+from importlib.resources import files
 
 import jax
 import jax.numpy as jnp
@@ -19,7 +19,7 @@ from evosax.types import Fitness, Population, PyTree, Solution
 
 from ...learned_evolution.les_tools import (
     FitnessFeatures,
-    load_pkl_object,
+    load_checkpoint,
 )
 from ...learned_evolution.lga_tools import (
     MutationAttention,
@@ -65,9 +65,15 @@ class LearnedGA(PopulationBasedAlgorithm):
         params_path: str | None = None,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize LGA."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        # Masked members would enter the learned selection
+        self.supports_masking = False
 
         self.elite_ratio = 1.0
 
@@ -82,15 +88,15 @@ class LearnedGA(PopulationBasedAlgorithm):
             self.lga_params = params
         elif params_path is not None:
             # Load params from checkpoint
-            self.lga_params = load_pkl_object(params_path)
+            self.lga_params = load_checkpoint(params_path)
         else:
             # Load default params
             if self.num_dims > 50:
-                ckpt_fname = "2023_04_lga_v7.pkl"
+                ckpt_fname = "2023_04_lga_v7.npz"
             else:
-                ckpt_fname = "2023_04_lga_v4.pkl"
-            data = pkgutil.get_data(__name__, f"../ckpt/lga/{ckpt_fname}")
-            self.lga_params = load_pkl_object(data, pkg_load=True)
+                ckpt_fname = "2023_04_lga_v4.npz"
+            ckpt_path = files("evosax.algorithms.ckpt").joinpath("lga", ckpt_fname)
+            self.lga_params = load_checkpoint(str(ckpt_path))
 
     @property
     def _default_params(self) -> Params:
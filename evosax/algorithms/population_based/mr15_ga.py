@@ -45,9 +45,15 @@ class MR15_GA(PopulationBasedAlgorithm):
         solution: Solution,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize MR15-GA."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        # Masked members would enter the rate of beneficial mutations
+        self.supports_masking = False
 
         self.elite_ratio = 0.5
 
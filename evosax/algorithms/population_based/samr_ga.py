@@ -42,9 +42,15 @@ class SAMR_GA(PopulationBasedAlgorithm):
         solution: Solution,
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize SAMR-GA."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
+
+        # Masked members would enter the fixed-size elite selection
+        self.supports_masking = False
 
         self.elite_ratio = 0.5
 
@@ -44,9 +44,12 @@ class SimpleGA(PopulationBasedAlgorithm):
         std_schedule: Callable = optax.constant_schedule(1.0),
         fitness_shaping_fn: Callable = identity_fitness_shaping_fn,
         metrics_fn: Callable = metrics_fn,
+        **kwargs,
     ):
         """Initialize Simple GA."""
-        super().__init__(population_size, solution, fitness_shaping_fn, metrics_fn)
+        super().__init__(
+            population_size, solution, fitness_shaping_fn, metrics_fn, **kwargs
+        )
 
         self.elite_ratio = 0.5
 
@@ -77,7 +80,7 @@ class SimpleGA(PopulationBasedAlgorithm):
         # Get elites
         idx = jnp.argsort(state.fitness)
         population = state.population[idx]
-        p = jnp.arange(self.population_size) < self.num_elites
+        p = jnp.arange(self.population_size) < self._get_num_elites(params)
 
         key_crossover, key_mutation, key_1, key_2 = jax.random.split(key, 4)
         key_crossover = jax.random.split(key_crossover, self.population_size)
@@ -0,0 +1,371 @@
+"""IPOP and BIPOP restart wrapper for distribution-based algorithms."""
+
+import copy
+from collections.abc import Callable
+from functools import partial
+
+import jax
+import jax.numpy as jnp
+from flax import struct
+
+from evosax.core.restart import (
+    BIPOPRestartParams,
+    BIPOPRestartState,
+    IPOPRestartParams,
+    IPOPRestartState,
+    cma_cond,
+    generation_cond,
+    spread_cond,
+)
+from evosax.types import Fitness, Metrics, Population, PyTree, Solution
+
+from .base import update_best_solution_and_fitness
+from .distribution_based.base import (
+    DistributionBasedAlgorithm,
+    Params as AlgorithmParams,
+    State as AlgorithmState,
+)
+from .distribution_based.cma_es import CMA_ES
+
+
+@struct.dataclass
+class State:
+    algorithm_state: AlgorithmState
+    restart_state: IPOPRestartState | BIPOPRestartState
+    best_solution: jax.Array  # Best solution over all runs
+    best_fitness: float
+    num_evaluations: int  # Number of evaluated active members over all runs
+
+
+@struct.dataclass
+class Params:
+    # Params of the algorithm with a leading axis over population_sizes
+    algorithm_params: AlgorithmParams
+    restart_params: IPOPRestartParams | BIPOPRestartParams
+
+
+class RestartAlgorithm:
+    """Restart a distribution-based algorithm with IPOP or BIPOP population sizes.
+
+    The algorithm is built once for the largest population size, and `ask` always
+    returns max_population_size candidates. Restarts switch between the masked params
+    of each population size, see `get_masked_params`, so only active_population_size
+    candidates are used by `tell` and the population size changes without
+    recompilation.
+
+    Population sizes are population_size * population_size_multiplier**k. With IPOP,
+    every restart moves to the next size. With BIPOP, a run with a small population
+    size and a reduced step size is interleaved whenever fewer evaluations were spent
+    on small runs than on large runs. The step size is scaled in the initial state, so
+    BIPOP requires an algorithm that adapts std in its state rather than following a
+    std_schedule.
+
+    By default, restarts are triggered by spread_cond, and also by cma_cond for CMA_ES
+    and its subclasses: Sep_CMA_ES, Block_CMA_ES, Cholesky_CMA_ES, VkD_CMA_ES, MA_ES,
+    LM_MA_ES, Rm_ES and SV_CMA_ES. Criteria of cma_cond that read state a variant
+    does not keep, such as B or D, fall back to the coordinate std or never trigger.
+
+    [1] Auger & Hansen (2005). A Restart CMA Evolution Strategy With Increasing
+        Population Size. CEC.
+    [2] Hansen (2009). Benchmarking a BI-Population CMA-ES on the BBOB-2009 Function
+        Testbed. GECCO.
+    """
+
+    def __init__(
+        self,
+        algorithm: DistributionBasedAlgorithm,
+        max_population_size: int,
+        population_size_multiplier: int = 2,
+        strategy: str = "ipop",
+        restart_conds: tuple[Callable, ...] | None = None,
+    ):
+        """Initialize restart algorithm.
+
+        Args:
+            algorithm: Distribution-based algorithm with the population size of the
+                first run.
+            max_population_size: Upper bound on the population size of restarts.
+            population_size_multiplier: Factor between successive population sizes.
+            strategy: One of "ipop" or "bipop".
+            restart_conds: Conditions of `evosax.core.restart`, the algorithm is
+                restarted once any of them is met after min_num_gens generations.
+                Defaults to spread_cond, and cma_cond for CMA-ES variants.
+
+        """
+        assert strategy in ("ipop", "bipop"), f"Unknown restart strategy {strategy}."
+        assert max_population_size >= algorithm.population_size, (
+            "max_population_size must be at least the population size of algorithm."
+        )
+        assert population_size_multiplier > 1, (
+            "population_size_multiplier must be greater than 1."
+        )
+        assert strategy == "ipop" or not hasattr(algorithm, "std_schedule"), (
+            "bipop scales std in the state, which a std_schedule overwrites in tell."
+        )
+
+        if restart_conds is None:
+            restart_conds = (spread_cond,)
+            if isinstance(algorithm, CMA_ES):
+                restart_conds += (cma_cond,)
+
+        self.strategy = strategy
+        self.restart_conds = restart_conds
+
+        population_sizes = [algorithm.population_size]
+        while population_sizes[-1] * population_size_multiplier <= max_population_size:
+            population_sizes.append(population_sizes[-1] * population_size_multiplier)
+        self.population_sizes = tuple(population_sizes)
+
+        self.algorithm = copy.copy(algorithm)
+        self.algorithm.population_size = self.max_population_size
+
+    @property
+    def max_population_size(self) -> int:
+        """Number of candidates returned by ask."""
+        return self.population_sizes[-1]
+
+    @property
+    def default_params(self) -> Params:
+        """Return params of the algorithm for every population size."""
+        algorithm_params = [
+            self.algorithm.get_masked_params(size) for size in self.population_sizes
+        ]
+        if self.strategy == "ipop":
+            restart_params = IPOPRestartParams()
+        else:
+            restart_params = BIPOPRestartParams()
+
+        return Params(
+            algorithm_params=jax.tree.map(lambda *x: jnp.stack(x), *algorithm_params),
+            restart_params=restart_params,
+        )
+
+    @partial(jax.jit, static_argnames=("self",))
+    def init(self, key: jax.Array, mean: Solution, params: Params) -> State:
+        """Initialize restart algorithm."""
+        if self.strategy == "ipop":
+            restart_state = IPOPRestartState(
+                restart_counter=0,
+                restart_next=False,
+                active_population_size=self.population_sizes[0],
+            )
+        else:
+            restart_state = BIPOPRestartState(
+                restart_counter=0,
+                restart_next=False,
+                active_population_size=self.population_sizes[0],
+                restart_large_counter=0,
+                large_eval_budget=0,
+                small_eval_budget=0,
+                small_pop_active=False,
+            )
+
+        algorithm_state = self.algorithm.init(
+            key, mean, self._get_algorithm_params(params, restart_state)
+        )
+        return State(
+            algorithm_state=algorithm_state,
+            restart_state=restart_state,
+            best_solution=algorithm_state.best_solution,
+            best_fitness=algorithm_state.best_fitness,
+            num_evaluations=0,
+        )
+
+    @partial(jax.jit, static_argnames=("self",))
+    def ask(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+    ) -> tuple[Population, State]:
+        """Ask for max_population_size candidates, restarting first if due."""
+        key, key_restart = jax.random.split(key)
+        state = jax.lax.cond(
+            state.restart_state.restart_next,
+            self._restart,
+            lambda key, state, params: state,
+            key_restart,
+            state,
+            params,
+        )
+
+        population, algorithm_state = self.algorithm.ask(
+            key,
+            state.algorithm_state,
+            self._get_algorithm_params(params, state.restart_state),
+        )
+        return population, state.replace(algorithm_state=algorithm_state)
+
+    @partial(jax.jit, static_argnames=("self",))
+    def tell(
+        self,
+        key: jax.Array,
+        population: Population,
+        fitness: Fitness,
+        state: State,
+        params: Params,
+    ) -> tuple[State, Metrics]:
+        """Tell fitness of the active candidates and decide whether to restart."""
+        restart_state = state.restart_state
+        active_population_size = restart_state.active_population_size
+        algorithm_params = self._get_algorithm_params(params, restart_state)
+
+        algorithm_state, metrics = self.algorithm.tell(
+            key, population, fitness, state.algorithm_state, algorithm_params
+        )
+        fitness = jnp.where(
+            self.algorithm.get_active_mask(algorithm_params), fitness, jnp.nan
+        )
+
+        # Update best solution and fitness over all runs
+        best_solution, best_fitness = update_best_solution_and_fitness(
+            algorithm_state.best_solution[None],
+            algorithm_state.best_fitness[None],
+            state.best_solution,
+            state.best_fitness,
+        )
+
+        # Count evaluations, per regime for BIPOP
+        if self.strategy == "bipop":
+            restart_state = restart_state.replace(
+                small_eval_budget=restart_state.small_eval_budget
+                + restart_state.small_pop_active * active_population_size,
+                large_eval_budget=restart_state.large_eval_budget
+                + (1 - restart_state.small_pop_active) * active_population_size,
+            )
+
+        # Restart on the next ask once a restart condition is met
+        restart_args = (
+            population,
+            fitness,
+            algorithm_state,
+            algorithm_params,
+            restart_state,
+            params.restart_params,
+        )
+        restart_next = jnp.logical_and(
+            generation_cond(*restart_args),
+            jnp.any(jnp.array([cond(*restart_args) for cond in self.restart_conds])),
+        )
+        restart_state = restart_state.replace(restart_next=restart_next)
+
+        state = state.replace(
+            algorithm_state=algorithm_state,
+            restart_state=restart_state,
+            best_solution=best_solution,
+            best_fitness=best_fitness,
+            num_evaluations=state.num_evaluations + active_population_size,
+        )
+        return state, metrics | {
+            "restart_counter": restart_state.restart_counter,
+            "active_population_size": active_population_size,
+            "num_evaluations": state.num_evaluations,
+        }
+
+    @partial(jax.jit, static_argnames=("self", "problem", "num_generations"))
+    def run(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+        problem,
+        problem_state,
+        num_generations: int,
+    ) -> tuple[State, PyTree, Metrics]:
+        """Run the ask-eval-tell loop with restarts for a number of generations.
+
+        Returns:
+            tuple: containing the final state, the final problem state and the metrics
+                stacked over generations.
+
+        """
+
+        def step(carry, key):
+            state, problem_state = carry
+            key_ask, key_eval, key_tell = jax.random.split(key, 3)
+            population, state = self.ask(key_ask, state, params)
+            fitness, problem_state, _ = problem.eval(
+                key_eval, population, problem_state
+            )
+            state, metrics = self.tell(key_tell, population, fitness, state, params)
+            return (state, problem_state), metrics
+
+        (state, problem_state), metrics = jax.lax.scan(
+            step, (state, problem_state), jax.random.split(key, num_generations)
+        )
+        return state, problem_state, metrics
+
+    def get_best_solution(self, state: State) -> Solution:
+        """Return unravelled best solution over all runs."""
+        return self.algorithm._unravel_solution(state.best_solution)
+
+    def get_mean(self, state: State) -> Solution:
+        """Return unravelled mean of the current run."""
+        return self.algorithm.get_mean(state.algorithm_state)
+
+    def _restart(self, key: jax.Array, state: State, params: Params) -> State:
+        """Reinitialize the algorithm with the population size of the next run."""
+        restart_state = state.restart_state.replace(
+            restart_counter=state.restart_state.restart_counter + 1,
+            restart_next=False,
+        )
+        num_sizes = len(self.population_sizes)
+        sizes = jnp.array(self.population_sizes)
+
+        key_init, key_uniform, key_mean = jax.random.split(key, 3)
+        if self.strategy == "ipop":
+            idx = jnp.minimum(self._get_size_idx(restart_state) + 1, num_sizes - 1)
+            restart_state = restart_state.replace(active_population_size=sizes[idx])
+        else:
+            # Small run with population size on the grid, Eq. (1) in [2]
+            uniform = jax.random.uniform(key_uniform)
+            small = restart_state.small_eval_budget < restart_state.large_eval_budget
+            large_counter = restart_state.restart_large_counter + (1 - small)
+            large_idx = jnp.minimum(large_counter, num_sizes - 1)
+            small_idx = jnp.floor(
+                jnp.square(uniform) * jnp.maximum(large_idx - 1, 0)
+            ).astype(jnp.int32)
+            restart_state = restart_state.replace(
+                active_population_size=sizes[jnp.where(small, small_idx, large_idx)],
+                restart_large_counter=large_counter,
+                small_pop_active=small,
+            )
+            std_scale = jnp.where(small, 10 ** (-2 * uniform), 1.0)
+
+        # Continue from the last mean or sample a new one uniformly within bounds
+        mean = jnp.where(
+            params.restart_params.copy_mean,
+            state.algorithm_state.mean,
+            jax.random.uniform(
+                key_mean,
+                state.algorithm_state.mean.shape,
+                minval=params.restart_params.mean_min,
+                maxval=params.restart_params.mean_max,
+            ),
+        )
+        algorithm_state = self.algorithm.init(
+            key_init,
+            self.algorithm._unravel_solution(mean),
+            self._get_algorithm_params(params, restart_state),
+        )
+        if self.strategy == "bipop":
+            algorithm_state = algorithm_state.replace(
+                std=std_scale * algorithm_state.std,
+                std_init=std_scale * algorithm_state.std,
+            )
+        return state.replace(
+            algorithm_state=algorithm_state, restart_state=restart_state
+        )
+
+    def _get_size_idx(self, restart_state: IPOPRestartState) -> jax.Array:
+        """Return index of the active population size in population_sizes."""
+        return jnp.argmax(
+            jnp.array(self.population_sizes) == restart_state.active_population_size
+        )
+
+    def _get_algorithm_params(
+        self, params: Params, restart_state: IPOPRestartState
+    ) -> AlgorithmParams:
+        """Return params of the algorithm for the active population size."""
+        idx = self._get_size_idx(restart_state)
+        return jax.tree.map(lambda x: x[idx], params.algorithm_params)
@@ -0,0 +1,224 @@
+"""Steady-state wrapper to tell distribution-based algorithms partial batches."""
+
+from functools import partial
+
+import jax
+import jax.numpy as jnp
+from flax import struct
+
+from evosax.types import Fitness, Metrics, Population, Solution
+
+from .distribution_based.base import (
+    DistributionBasedAlgorithm,
+    Params as AlgorithmParams,
+    State as AlgorithmState,
+)
+
+
+@struct.dataclass
+class State:
+    algorithm_state: AlgorithmState
+    population: jax.Array  # Window of solutions evaluated since the last update
+    fitness: jax.Array
+    num_evaluated: int  # Number of evaluated solutions in window
+
+
+@struct.dataclass
+class Params:
+    # Params of the algorithm with a leading axis over the window sizes
+    # update_every, ..., population_size
+    algorithm_params: AlgorithmParams
+
+
+class SteadyStateAlgorithm:
+    """Steady-state distribution-based algorithm for asynchronous evaluation.
+
+    `tell` accepts any batch of at most population_size candidates, where candidates
+    that were not evaluated have NaN fitness. Evaluated candidates enter a window. Once
+    the window holds update_every candidates, the algorithm is updated on the window
+    and the window is emptied, so workers can be refilled from `ask` without waiting
+    for stragglers.
+
+    Late candidates, asked before the last update, enter the window of the next update
+    as samples of the current distribution, so no evaluation is wasted. Candidates
+    asked more than max_age updates before the current distribution are discarded.
+
+    With update_every < population_size, the update only uses the candidates in the
+    window with the masked params of the window size, see `get_masked_params`.
+    """
+
+    def __init__(
+        self,
+        algorithm: DistributionBasedAlgorithm,
+        update_every: int | None = None,
+        max_age: int | None = None,
+    ):
+        """Initialize steady-state algorithm."""
+        if update_every is None:
+            update_every = algorithm.population_size
+        assert 0 < update_every <= algorithm.population_size, (
+            "update_every must be in [1, population_size]."
+        )
+        assert max_age is None or max_age >= 0, "max_age must be non-negative."
+
+        self.algorithm = algorithm
+        self.update_every = update_every
+
+        # Maximum number of updates since the ask of a candidate, None to keep all
+        self.max_age = max_age
+
+    @property
+    def population_size(self) -> int:
+        """Number of candidates returned by ask."""
+        return self.algorithm.population_size
+
+    @property
+    def default_params(self) -> Params:
+        """Return params of the algorithm for every window size."""
+        if self.update_every == self.population_size:
+            algorithm_params = [self.algorithm.default_params]
+        else:
+            algorithm_params = [
+                self.algorithm.get_masked_params(size)
+                for size in range(self.update_every, self.population_size + 1)
+            ]
+        return Params(
+            algorithm_params=jax.tree.map(lambda *x: jnp.stack(x), *algorithm_params)
+        )
+
+    @partial(jax.jit, static_argnames=("self",))
+    def init(self, key: jax.Array, mean: Solution, params: Params) -> State:
+        """Initialize steady-state algorithm."""
+        return State(
+            algorithm_state=self.algorithm.init(
+                key, mean, self._get_algorithm_params(params, self.population_size)
+            ),
+            population=jnp.full(
+                (self.population_size, self.algorithm.num_dims), jnp.nan
+            ),
+            fitness=jnp.full((self.population_size,), jnp.nan),
+            num_evaluated=0,
+        )
+
+    @partial(jax.jit, static_argnames=("self",))
+    def ask(
+        self,
+        key: jax.Array,
+        state: State,
+        params: Params,
+    ) -> tuple[Population, State]:
+        """Ask for population_size candidates from the current distribution.
+
+        The candidates are tagged with `get_generation(state)` of the returned state.
+        """
+        population, algorithm_state = self.algorithm.ask(
+            key,
+            state.algorithm_state,
+            self._get_algorithm_params(params, self.population_size),
+        )
+        return population, state.replace(algorithm_state=algorithm_state)
+
+    @partial(jax.jit, static_argnames=("self",))
+    def tell(
+        self,
+        key: jax.Array,
+        population: Population,
+        fitness: Fitness,
+        state: State,
+        params: Params,
+        generation: jax.Array | None = None,
+    ) -> tuple[State, Metrics]:
+        """Tell fitness of a partial batch, NaN fitness marks unevaluated candidates.
+
+        Args:
+            key: JAX PRNG key.
+            population: Batch of at most population_size candidates.
+            fitness: Fitness of the candidates, NaN if not evaluated.
+            state: State of the steady-state algorithm.
+            params: Params of the steady-state algorithm.
+            generation: Generation of each candidate, i.e. `get_generation` of the
+                state returned by the ask of the candidate. Candidates more than
+                max_age generations before the current one are discarded. None if
+                all candidates are kept.
+
+        Returns:
+            tuple: containing the new state and the metrics of the algorithm update,
+                which are zero-filled if the algorithm was not updated.
+
+        """
+        population = jax.vmap(self.algorithm._ravel_solution)(population)
+        assert population.shape[0] <= self.population_size, (
+            "Batch size must be at most population_size."
+        )
+
+        # Append evaluated candidates to the window, candidates older than max_age or
+        # beyond population_size are discarded
+        evaluated = ~jnp.isnan(fitness)
+        if generation is not None and self.max_age is not None:
+            evaluated &= self.get_generation(state) - generation <= self.max_age
+        idx = state.num_evaluated + jnp.cumsum(evaluated) - 1
+        idx = jnp.where(evaluated, idx, self.population_size)
+
+        state = state.replace(
+            population=state.population.at[idx].set(population, mode="drop"),
+            fitness=state.fitness.at[idx].set(fitness, mode="drop"),
+            num_evaluated=jnp.minimum(
+                state.num_evaluated + jnp.sum(evaluated), self.population_size
+            ),
+        )
+
+        # Update algorithm on the window
+        def update(state):
+            algorithm_params = self._get_algorithm_params(params, state.num_evaluated)
+
+            # Place the window at the active members
+            active = self.algorithm.get_active_mask(algorithm_params)
+            slots = jnp.flatnonzero(
+                active, size=self.population_size, fill_value=self.population_size
+            )
+            population = (
+                jnp.zeros_like(state.population)
+                .at[slots]
+                .set(state.population, mode="drop")
+            )
+            fitness = (
+                jnp.zeros_like(state.fitness).at[slots].set(state.fitness, mode="drop")
+            )
+
+            algorithm_state, metrics = self.algorithm.tell(
+                key,
+                jax.vmap(self.algorithm._unravel_solution)(population),
+                fitness,
+                state.algorithm_state,
+                algorithm_params,
+            )
+            state = state.replace(
+                algorithm_state=algorithm_state,
+                population=jnp.full_like(state.population, jnp.nan),
+                fitness=jnp.full_like(state.fitness, jnp.nan),
+                num_evaluated=0,
+            )
+            return state, metrics
+
+        def no_update(state):
+            metrics = jax.eval_shape(update, state)[1]
+            return state, jax.tree.map(lambda x: jnp.zeros(x.shape, x.dtype), metrics)
+
+        return jax.lax.cond(
+            state.num_evaluated >= self.update_every, update, no_update, state
+        )
+
+    def get_generation(self, state: State) -> jax.Array:
+        """Return generation of the current distribution, tagging asked candidates."""
+        return state.algorithm_state.generation_counter
+
+    def get_mean(self, state: State) -> Solution:
+        """Return unravelled mean."""
+        return self.algorithm.get_mean(state.algorithm_state)
+
+    def _get_algorithm_params(
+        self, params: Params, window_size: int | jax.Array
+    ) -> AlgorithmParams:
+        """Return params of the algorithm for a window of window_size candidates."""
+        idx = jnp.clip(window_size - self.update_every, 0, None)
+        return jax.tree.map(lambda x: x[idx], params.algorithm_params)
@@ -0,0 +1,215 @@
+"""Asynchronous incremental checkpointing of states and params.
+
+Each checkpoint is a directory of one `.npy` file per leaf and a JSON manifest. Saving
+only blocks for the device-to-host copy of the leaves that changed since the previous
+checkpoint, files are written to disk on a background thread. Unchanged leaves are
+detected by comparing a 64-bit fingerprint of their bits, computed on device, with the
+fingerprint of the leaves of the previous checkpoint, and point to the file of an
+earlier checkpoint, so large constant leaves such as learned params are written once.
+Only the fingerprints are kept, not the leaves of the previous checkpoint.
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+
+from evosax.types import PyTree
+
+
+class Checkpointer:
+    """Save and restore PyTrees of arrays, e.g. flax struct states and params."""
+
+    def __init__(self, directory: str):
+        """Initialize checkpointer writing to directory."""
+        self.directory = os.path.abspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._future = None
+
+        # Fingerprints and files of the previous checkpoint
+        self._last_fingerprints = None
+        self._last_files = None
+
+    def save(self, step: int, tree: PyTree) -> None:
+        """Save tree as checkpoint step without waiting for the disk write."""
+        paths_and_leaves = jax.tree_util.tree_flatten_with_path(tree)[0]
+        leaves = [_key_data(leaf) for _, leaf in paths_and_leaves]
+
+        fingerprints = _fingerprints(leaves)
+        changed = self._changed(fingerprints)
+
+        # Start all device-to-host copies before waiting on any of them
+        for leaf, is_changed in zip(leaves, changed):
+            if is_changed and isinstance(leaf, jax.Array):
+                leaf.copy_to_host_async()
+        arrays = [
+            np.asarray(leaf) if is_changed else None
+            for leaf, is_changed in zip(leaves, changed)
+        ]
+
+        step_dir = os.path.join(self.directory, f"step_{step}")
+        files = [
+            f"step_{step}/leaf_{i}.npy" if is_changed else self._last_files[i]
+            for i, is_changed in enumerate(changed)
+        ]
+        manifest = {
+            "step": step,
+            "leaves": [
+                {
+                    "path": jax.tree_util.keystr(path),
+                    "file": file,
+                    "is_key": _is_key(leaf),
+                }
+                for (path, leaf), file in zip(paths_and_leaves, files)
+            ],
+        }
+
+        self.wait()
+        self._future = self._executor.submit(
+            _write, self.directory, step_dir, arrays, manifest
+        )
+
+        self._last_fingerprints = fingerprints
+        self._last_files = files
+
+    def wait(self) -> None:
+        """Wait until the pending checkpoint is written to disk."""
+        if self._future is not None:
+            self._future.result()
+            self._future = None
+
+    def latest_step(self) -> int | None:
+        """Return the latest complete checkpoint step, or None."""
+        steps = [
+            int(name[len("step_") : -len(".json")])
+            for name in os.listdir(self.directory)
+            if name.startswith("step_") and name.endswith(".json")
+        ]
+        return max(steps, default=None)
+
+    def restore(self, target: PyTree, step: int | None = None) -> PyTree:
+        """Restore checkpoint step, defaults to latest, with the structure of target.
+
+        Leaves of target can be arrays or `jax.ShapeDtypeStruct`. Each restored leaf is
+        put on the device or sharding of the corresponding target leaf.
+        """
+        self.wait()
+        if step is None:
+            step = self.latest_step()
+        assert step is not None, f"No checkpoint found in {self.directory}."
+
+        with open(os.path.join(self.directory, f"step_{step}.json")) as f:
+            manifest = json.load(f)
+
+        target_leaves, treedef = jax.tree.flatten(target)
+        assert len(target_leaves) == len(manifest["leaves"]), (
+            "Target structure does not match checkpoint."
+        )
+
+        leaves = []
+        for target_leaf, entry in zip(target_leaves, manifest["leaves"]):
+            array = np.load(os.path.join(self.directory, entry["file"]), mmap_mode="r")
+            leaf = jax.device_put(array, getattr(target_leaf, "sharding", None))
+            if entry["is_key"]:
+                leaf = jax.random.wrap_key_data(leaf)
+            leaves.append(leaf)
+        return jax.tree.unflatten(treedef, leaves)
+
+    def close(self) -> None:
+        """Wait for the pending checkpoint and stop the background thread."""
+        self.wait()
+        self._executor.shutdown()
+
+    def _changed(self, fingerprints: list) -> list[bool]:
+        """Return which leaves changed since the previous checkpoint."""
+        if self._last_fingerprints is None or len(fingerprints) != len(
+            self._last_fingerprints
+        ):
+            return [True] * len(fingerprints)
+        return [
+            fingerprint != last_fingerprint
+            for fingerprint, last_fingerprint in zip(
+                fingerprints, self._last_fingerprints
+            )
+        ]
+
+
+def _is_key(leaf) -> bool:
+    """Return whether leaf is an array of typed PRNG keys."""
+    return isinstance(leaf, jax.Array) and jnp.issubdtype(
+        leaf.dtype, jax.dtypes.prng_key
+    )
+
+
+def _key_data(leaf):
+    """Return the raw data of typed PRNG keys, other leaves are unchanged."""
+    return jax.random.key_data(leaf) if _is_key(leaf) else leaf
+
+
+def _bits(x: jax.Array) -> jax.Array:
+    """Return the bits of x as flat uint32, so that NaN equals itself."""
+    if x.dtype == jnp.bool_:
+        return x.ravel().astype(jnp.uint32)
+    if x.dtype.itemsize < 4:
+        x = jax.lax.bitcast_convert_type(x, jnp.dtype(f"uint{8 * x.dtype.itemsize}"))
+        return x.ravel().astype(jnp.uint32)
+    return jax.lax.bitcast_convert_type(x, jnp.uint32).ravel()
+
+
+def _mix(x: jax.Array) -> jax.Array:
+    """Return the murmur3 finalizer of uint32 x."""
+    x = (x ^ (x >> 16)) * jnp.uint32(0x85EBCA6B)
+    x = (x ^ (x >> 13)) * jnp.uint32(0xC2B2AE35)
+    return x ^ (x >> 16)
+
+
+@jax.jit
+def _fingerprint_fn(x: jax.Array) -> jax.Array:
+    """Return two 32-bit hashes of the bits of x and their positions on device."""
+    bits = _bits(x)
+    idx = jnp.arange(bits.size, dtype=jnp.uint32)
+    return jnp.stack(
+        [
+            jnp.sum(_mix(bits ^ _mix(idx ^ jnp.uint32(seed))), dtype=jnp.uint32)
+            for seed in (0x9E3779B9, 0x7F4A7C15)
+        ]
+    )
+
+
+def _fingerprints(leaves: list) -> list[tuple]:
+    """Return shape, dtype and a hash of the bits of each leaf.
+
+    Arrays on device are hashed on device, all hashes are dispatched before any is
+    copied to the host, and only two scalars are copied per leaf.
+    """
+    fingerprints = []
+    for leaf in leaves:
+        if isinstance(leaf, jax.Array):
+            fingerprints.append((leaf.shape, leaf.dtype, _fingerprint_fn(leaf)))
+        else:
+            leaf = np.asarray(leaf)
+            digest = hashlib.blake2b(leaf.tobytes()).hexdigest()
+            fingerprints.append((leaf.shape, leaf.dtype, digest))
+    return [
+        (shape, dtype, digest if isinstance(digest, str) else tuple(digest.tolist()))
+        for shape, dtype, digest in fingerprints
+    ]
+
+
+def _write(directory: str, step_dir: str, arrays: list, manifest: dict) -> None:
+    """Write changed leaves, then the manifest marking the checkpoint complete."""
+    os.makedirs(step_dir, exist_ok=True)
+    for i, array in enumerate(arrays):
+        if array is not None:
+            np.save(os.path.join(step_dir, f"leaf_{i}.npy"), array)
+
+    path = os.path.join(directory, f"step_{manifest['step']}.json")
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f)
+    os.replace(path + ".tmp", path)
@@ -0,0 +1,102 @@
+"""Ahead-of-time compilation utilities for evolutionary algorithms.
+
+This module lowers and compiles the ask-eval-tell functions of an algorithm and problem
+for fixed shapes before the first call. Combined with the persistent compilation cache,
+the compiled executables are written to a local directory and reloaded by every later
+process that compiles the same functions, which turns cold starts into cache hits.
+"""
+
+from collections.abc import Callable
+from typing import NamedTuple
+
+import jax
+
+from evosax.types import Params, PyTree
+
+
+class CompiledAlgorithm(NamedTuple):
+    init: Callable
+    ask: Callable
+    tell: Callable
+    eval: Callable
+    run: Callable | None
+
+
+def enable_compilation_cache(
+    cache_dir: str, min_compile_time_secs: float = 0.0
+) -> None:
+    """Enable the persistent compilation cache in cache_dir.
+
+    Executables are keyed by a fingerprint of the lowered program, the compile options
+    and the backend, so any change of algorithm configuration or shapes results in a
+    new entry.
+
+    Args:
+        cache_dir: Directory to store compiled executables.
+        min_compile_time_secs: Only cache executables that take longer to compile.
+
+    """
+    jax.config.update("jax_compilation_cache_dir", cache_dir)
+    jax.config.update(
+        "jax_persistent_cache_min_compile_time_secs", min_compile_time_secs
+    )
+    jax.config.update("jax_persistent_cache_min_entry_size_bytes", -1)
+
+
+def compile_algorithm(
+    algorithm,
+    problem,
+    key: jax.Array,
+    init_args: tuple,
+    params: Params,
+    num_generations: int | None = None,
+) -> CompiledAlgorithm:
+    """Compile init, ask, tell, problem eval and optionally run ahead of time.
+
+    Args:
+        algorithm: Evolutionary algorithm instance.
+        problem: Problem instance with `init(key)` and `eval(key, population, state)`.
+        key: JAX PRNG key, or its `jax.ShapeDtypeStruct`.
+        init_args: Arguments of `algorithm.init` between key and params, e.g. the
+            initial mean for distribution-based algorithms. Arrays or
+            `jax.ShapeDtypeStruct`.
+        params: Params of the evolutionary algorithm.
+        num_generations: If given, also compile `algorithm.run` for this number of
+            generations.
+
+    Returns:
+        CompiledAlgorithm: containing the compiled executables. They are called
+            like the original functions, without the problem and static arguments.
+
+    """
+    init = _compile(algorithm, "init", key, *init_args, params)
+    state = jax.eval_shape(algorithm.init, key, *init_args, params)
+
+    ask = _compile(algorithm, "ask", key, state, params)
+    population, state = jax.eval_shape(algorithm.ask, key, state, params)
+
+    problem_state = jax.eval_shape(problem.init, key)
+    problem_eval = _compile(problem, "eval", key, population, problem_state)
+    fitness, _, _ = jax.eval_shape(problem.eval, key, population, problem_state)
+
+    tell = _compile(algorithm, "tell", key, population, fitness, state, params)
+
+    run = None
+    if num_generations is not None:
+        run = _compile(
+            algorithm,
+            "run",
+            key,
+            state,
+            params,
+            problem,
+            problem_state,
+            num_generations,
+        )
+
+    return CompiledAlgorithm(init=init, ask=ask, tell=tell, eval=problem_eval, run=run)
+
+
+def _compile(obj, name: str, *args: PyTree):
+    """Lower and compile the jitted method name of obj for the given arguments."""
+    return getattr(type(obj), name).lower(obj, *args).compile()
@@ -0,0 +1,105 @@
+"""Static memory and FLOP cost analysis of algorithm configurations.
+
+The state is only traced with `jax.eval_shape` and `ask` and `tell` are only compiled,
+never run, so configurations can be checked before they are launched, even when they
+would not fit in memory.
+"""
+
+import math
+import warnings
+
+import jax
+import jax.numpy as jnp
+
+from evosax.types import Params, PyTree
+
+# Algorithms with O(num_dims) state approximating a full covariance matrix
+LINEAR_STATE_ALGORITHMS = ("Sep_CMA_ES", "VkD_CMA_ES", "LM_MA_ES", "Rm_ES")
+
+
+def cost_report(algorithm, init_args: tuple, params: Params) -> dict:
+    """Report state size and compiled cost of ask and tell of an algorithm.
+
+    Args:
+        algorithm: Evolutionary algorithm instance.
+        init_args: Arguments of `algorithm.init` between key and params, as arrays or
+            `jax.ShapeDtypeStruct`.
+        params: Params of the evolutionary algorithm.
+
+    Returns:
+        dict: containing the bytes of each state and params leaf, the leaves of
+            O(num_dims^2) size, and the FLOPs, bytes accessed and temporary memory
+            of the compiled ask and tell.
+
+    """
+    key = jax.eval_shape(lambda: jax.random.key(0))
+    state = jax.eval_shape(algorithm.init, key, *init_args, params)
+    population, _ = jax.eval_shape(algorithm.ask, key, state, params)
+    fitness = jax.ShapeDtypeStruct(
+        jax.tree.leaves(population)[0].shape[:1], jnp.float32
+    )
+
+    ask = type(algorithm).ask.lower(algorithm, key, state, params).compile()
+    tell = (
+        type(algorithm)
+        .tell.lower(algorithm, key, population, fitness, state, params)
+        .compile()
+    )
+
+    state_leaves = _leaf_bytes(state)
+    params_leaves = _leaf_bytes(params)
+
+    # Leaves of quadratic state fields with trailing axes (num_dims, num_dims), the
+    # shape alone is ambiguous, e.g. population leaves when population_size == num_dims
+    num_dims = algorithm.num_dims
+    quadratic_leaves = [
+        path
+        for path, x in jax.tree_util.tree_flatten_with_path(state)[0]
+        if num_dims > 1
+        and getattr(path[0], "name", None) in algorithm.quadratic_state_fields
+        and x.shape[-2:] == (num_dims, num_dims)
+    ]
+    if quadratic_leaves:
+        warnings.warn(
+            f"{type(algorithm).__name__} state has O(num_dims^2) leaves "
+            f"{[jax.tree_util.keystr(path) for path in quadratic_leaves]} of "
+            f"{sum(state_leaves.values()) / 2**30:.2f} GiB in total for num_dims="
+            f"{num_dims}. Consider {', '.join(LINEAR_STATE_ALGORITHMS)}, which "
+            "have O(num_dims) state.",
+            stacklevel=3,
+        )
+
+    return {
+        "state_bytes": sum(state_leaves.values()),
+        "state_leaves": state_leaves,
+        "params_bytes": sum(params_leaves.values()),
+        "params_leaves": params_leaves,
+        "quadratic_state_leaves": [
+            jax.tree_util.keystr(path) for path in quadratic_leaves
+        ],
+        "ask": _compiled_cost(ask),
+        "tell": _compiled_cost(tell),
+    }
+
+
+def _leaf_bytes(tree: PyTree) -> dict[str, int]:
+    """Return the number of bytes of each leaf of a PyTree by path."""
+    leaf_bytes = {}
+    for path, x in jax.tree_util.tree_flatten_with_path(tree)[0]:
+        if not hasattr(x, "shape"):
+            x = jnp.asarray(x)
+        leaf_bytes[jax.tree_util.keystr(path)] = math.prod(x.shape) * x.dtype.itemsize
+    return leaf_bytes
+
+
+def _compiled_cost(compiled) -> dict[str, float]:
+    """Return FLOPs, bytes accessed and temporary memory of a compiled function."""
+    cost = compiled.cost_analysis()
+    if isinstance(cost, list):
+        cost = cost[0]
+    memory = compiled.memory_analysis()
+    return {
+        "flops": cost.get("flops", 0.0),
+        "bytes_accessed": cost.get("bytes accessed", 0.0),
+        "temp_bytes": memory.temp_size_in_bytes if memory is not None else None,
+    }
@@ -4,6 +4,11 @@ This module provides various fitness shaping functions that can be used to trans
 raw fitness values. Fitness shaping can help improve the convergence properties of
 evolutionary algorithms by normalizing or standardizing fitness values, or by adding
 regularization terms like weight decay.
+
+Shaping functions that preserve the order of the fitness take an `order` keyword
+argument, the `FitnessOrder` computed once per generation in `tell`, which is then also
+passed to the update of the algorithm. They return 0 for members ranked after
+`order.num_active`, i.e. masked members.
 """
 
 import jax
@@ -11,6 +16,8 @@ import jax.numpy as jnp
 
 from evosax.types import Fitness, Params, Population, State
 
+from .ordering import FitnessOrder, fitness_order
+
 
 def normalize(
     a: jax.Array, axis: int = -1, minval: float = -1.0, maxval: float = 1.0
@@ -26,6 +33,13 @@ def normalize(
     )
 
 
+def mask_fitness(fitness: Fitness, order: FitnessOrder | None) -> Fitness:
+    """Set shaped fitness of members ranked after order.num_active to 0."""
+    if order is None:
+        return fitness
+    return jnp.where(order.is_active, fitness, 0.0)
+
+
 def add_weight_decay(fitness_shaping_fn, weight_decay=0.001):
     """Add weight decay to any fitness shaping function."""
 
@@ -37,41 +51,75 @@ def add_weight_decay(fitness_shaping_fn, weight_decay=0.001):
         # Apply the original fitness shaping function to the penalized fitness
         return fitness_shaping_fn(population, fitness, state, params)
 
+    # Shaping depends on the population, see uses_population
+    wrapped_fitness_fn.uses_population = True
     return wrapped_fitness_fn
 
 
+def uses_population(fitness_shaping_fn) -> bool:
+    """Return True if fitness_shaping_fn is marked as depending on the population."""
+    return getattr(fitness_shaping_fn, "uses_population", False)
+
+
 def identity_fitness_shaping_fn(
-    population: Population, fitness: jax.Array, state: State, params: Params
+    population: Population,
+    fitness: jax.Array,
+    state: State,
+    params: Params,
+    order: FitnessOrder | None = None,
 ) -> Fitness:
     """Return fitness."""
     return fitness
 
 
 def standardize_fitness_shaping_fn(
-    population: Population, fitness: jax.Array, state: State, params: Params
+    population: Population,
+    fitness: jax.Array,
+    state: State,
+    params: Params,
+    order: FitnessOrder | None = None,
 ) -> Fitness:
     """Return standardized fitness."""
-    return jax.nn.standardize(fitness, axis=-1, epsilon=1e-8, where=~jnp.isnan(fitness))
+    fitness = jax.nn.standardize(
+        fitness, axis=-1, epsilon=1e-8, where=~jnp.isnan(fitness)
+    )
+    return mask_fitness(fitness, order)
 
 
 def normalize_fitness_shaping_fn(
-    population: Population, fitness: Fitness, state: State, params: Params
+    population: Population,
+    fitness: Fitness,
+    state: State,
+    params: Params,
+    order: FitnessOrder | None = None,
 ) -> Fitness:
     """Return normalized fitness."""
-    return normalize(fitness, axis=-1)
+    return mask_fitness(normalize(fitness, axis=-1), order)
 
 
 def centered_rank_fitness_shaping_fn(
-    population: Population, fitness: Fitness, state: State, params: Params
+    population: Population,
+    fitness: Fitness,
+    state: State,
+    params: Params,
+    order: FitnessOrder | None = None,
 ) -> Fitness:
     """Return centered ranks in [-0.5, 0.5] according to fitness."""
-    ranks = jax.scipy.stats.rankdata(fitness, axis=-1) - 1.0
-    return ranks / (fitness.shape[-1] - 1) - 0.5
+    if order is None:
+        order = fitness_order(fitness)
+    # A single active member has rank 0
+    num_ranks = jnp.maximum(order.num_active - 1, 1)
+    return mask_fitness(order.ranks / num_ranks - 0.5, order)
 
 
 def weights_fitness_shaping_fn(
-    population: Population, fitness: Fitness, state: State, params: Params
+    population: Population,
+    fitness: Fitness,
+    state: State,
+    params: Params,
+    order: FitnessOrder | None = None,
 ) -> Fitness:
     """Return weights according to fitness."""
-    ranks = jax.scipy.stats.rankdata(fitness, axis=-1) - 1.0
-    return params.weights[..., ranks.astype(jnp.int32)]
+    if order is None:
+        order = fitness_order(fitness)
+    return mask_fitness(params.weights[..., order.ranks.astype(jnp.int32)], order)
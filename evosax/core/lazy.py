@@ -0,0 +1,71 @@
+"""Lazy loading of package attributes and registries for fast imports.
+
+Packages declare which submodule defines each public attribute. The submodule is only
+imported on first access, so `import evosax.algorithms` does not import every algorithm
+and its dependencies, e.g. the flax models of learned algorithms.
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Iterator, Mapping
+
+
+def lazy_getattr(package: str, attributes: dict[str, str]) -> tuple[Callable, Callable]:
+    """Return module `__getattr__` and `__dir__` importing attributes on first access.
+
+    Args:
+        package: Name of the package, i.e. `__name__` in its `__init__`.
+        attributes: Map from attribute name to the module defining it, relative to
+            the package.
+
+    Returns:
+        tuple: containing the `__getattr__` and `__dir__` functions of the package.
+
+    """
+
+    def getattr_(name: str):
+        if name not in attributes:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(attributes[name], package)
+        value = getattr(module, name)
+
+        # Cache attribute so that later accesses do not go through __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def dir_() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return getattr_, dir_
+
+
+class LazyRegistry(Mapping):
+    """Registry mapping names to attributes of packages, loaded on first access."""
+
+    def __init__(self, package: str, attributes: dict[str, str]):
+        """Initialize registry.
+
+        Args:
+            package: Name of the package defining the attributes.
+            attributes: Map from registry name to attribute name in package.
+
+        """
+        self._entries = {name: (package, attr) for name, attr in attributes.items()}
+
+    def __getitem__(self, name: str):
+        package, attr = self._entries[name]
+        return getattr(importlib.import_module(package), attr)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __or__(self, other: "LazyRegistry") -> "LazyRegistry":
+        registry = LazyRegistry.__new__(LazyRegistry)
+        registry._entries = self._entries | other._entries
+        return registry
+
+    def __repr__(self) -> str:
+        return f"LazyRegistry({list(self._entries)})"
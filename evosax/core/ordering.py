@@ -0,0 +1,117 @@
+"""Ordering of the fitness of a generation, shared by the stages of tell.
+
+Within one call to `tell`, the best member, the metrics, rank-based fitness shaping and
+the update of several algorithms all depend on the order of the fitness. `tell` wraps
+the fitness once into a lazy `FitnessOrder` and passes it to every function that
+declares an `order` keyword argument, so the fitness is sorted at most once and only if
+a stage needs the argsort or ranks.
+
+A fitness shaping function that takes `order` declares that it keeps the ranking of the
+members, so the order is also passed to the `_tell` of algorithms that take it.
+"""
+
+import functools
+import inspect
+from collections.abc import Callable
+
+import jax
+import jax.numpy as jnp
+
+from evosax.types import Fitness
+
+
+@jax.tree_util.register_pytree_node_class
+class FitnessOrder:
+    """Order of the fitness of a generation, computed lazily.
+
+    Each field is computed on first access and cached, so stages that only need the
+    best member do not sort, and the sort is shared by the stages that need it. Fields
+    are computed over the last axis, so orders of several populations can be batched.
+    """
+
+    def __init__(self, fitness: Fitness, num_active: int | None = None):
+        self.fitness = fitness  # Fitness, masked members are NaN
+        self._num_active = num_active  # None if all members are active
+
+    @property
+    def num_active(self) -> jax.Array:
+        """Number of active members, members ranked after are masked."""
+        if self._num_active is None:
+            return jnp.asarray(self.fitness.shape[-1])
+        return jnp.asarray(self._num_active)
+
+    @functools.cached_property
+    def best_idx(self) -> jax.Array:
+        """Index of the best member."""
+        return jnp.nanargmin(self.fitness, axis=-1)
+
+    @functools.cached_property
+    def argsort(self) -> jax.Array:
+        """Indices of members sorted by fitness, best first, NaN last."""
+        return jnp.argsort(self.fitness, axis=-1)
+
+    @functools.cached_property
+    def ranks(self) -> jax.Array:
+        """Rank of each member, 0 for the best, ties share their mean rank."""
+        return jnp.vectorize(_ranks, signature="(n),(n)->(n)")(
+            self.fitness, self.argsort
+        )
+
+    @functools.cached_property
+    def is_active(self) -> jax.Array:
+        """Whether each member is ranked within the num_active active members."""
+        if self._num_active is None:
+            return jnp.ones(self.fitness.shape, dtype=bool)
+        return self.ranks < self.num_active[..., None]
+
+    def tree_flatten(self):
+        return (self.fitness, self._num_active), None
+
+    @classmethod
+    def tree_unflatten(cls, aux_data, children):
+        return cls(*children)
+
+
+def fitness_order(fitness: Fitness, num_active: int | None = None) -> FitnessOrder:
+    """Return the order of the fitness of a generation, ties share their mean rank.
+
+    Ranks match `jax.scipy.stats.rankdata` minus one, computed from the sorted fitness
+    instead of a second sort. Masked members have NaN fitness and are ranked after the
+    num_active active members, which defaults to all members.
+    """
+    return FitnessOrder(fitness, num_active)
+
+
+def _ranks(fitness: Fitness, argsort: jax.Array) -> jax.Array:
+    """Return the rank of each member from the indices that sort the fitness."""
+    ranks = _average_ranks(fitness[argsort])
+    return jnp.zeros_like(ranks).at[argsort].set(ranks)
+
+
+def _average_ranks(sorted_fitness: Fitness) -> jax.Array:
+    """Return the rank of each sorted member, averaged over runs of equal fitness."""
+    idx = jnp.arange(sorted_fitness.shape[0])
+    is_new = jnp.concatenate(
+        [jnp.array([True]), sorted_fitness[1:] != sorted_fitness[:-1]]
+    )
+    is_last = jnp.concatenate([is_new[1:], jnp.array([True])])
+
+    # First and last index of the run of ties of each member
+    first = jax.lax.cummax(jnp.where(is_new, idx, 0))
+    last = jax.lax.cummin(jnp.where(is_last, idx, idx[-1]), reverse=True)
+    return (first + last) / 2
+
+
+def accepts_order(fn: Callable) -> bool:
+    """Return True if fn takes an order keyword argument."""
+    try:
+        return "order" in inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def call_with_order(fn: Callable, *args, order: FitnessOrder):
+    """Call fn, passing order if fn accepts it."""
+    if accepts_order(fn):
+        return fn(*args, order=order)
+    return fn(*args)
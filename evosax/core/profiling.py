@@ -0,0 +1,102 @@
+"""Per-stage timing and profiler annotations of the ask-eval-tell loop.
+
+Inside jitted code, `ask`, `tell` and the generation step of `run` are annotated with
+named scopes (ask, unravel, eval, ravel, metrics, shape, tell), so each stage shows up
+by name in `jax.profiler` traces and HLO dumps. On the host, `StageTimer` measures the
+wall-clock time of separately dispatched stages and reports a breakdown across
+generations.
+"""
+
+import contextlib
+import time
+from collections import defaultdict
+
+import jax
+
+from evosax.types import Params, PyTree
+
+
+class StageTimer:
+    """Host-side timer of named stages, e.g. ask, eval and tell."""
+
+    def __init__(self, trace_annotations: bool = False):
+        """Initialize timer.
+
+        Args:
+            trace_annotations: If True, also annotate each stage with
+                `jax.profiler.TraceAnnotation` for traces captured with
+                `jax.profiler.trace`.
+
+        """
+        self.trace_annotations = trace_annotations
+        self.times = defaultdict(list)
+
+    def time(self, stage: str, fn, *args, **kwargs):
+        """Call fn, wait for its outputs to be ready and record the elapsed time."""
+        annotation = (
+            jax.profiler.TraceAnnotation(stage)
+            if self.trace_annotations
+            else contextlib.nullcontext()
+        )
+        with annotation:
+            start = time.perf_counter()
+            outputs = jax.block_until_ready(fn(*args, **kwargs))
+            self.times[stage].append(time.perf_counter() - start)
+        return outputs
+
+    def step(
+        self,
+        algorithm,
+        problem,
+        key: jax.Array,
+        state: PyTree,
+        params: Params,
+        problem_state: PyTree,
+    ):
+        """Run a timed ask-eval-tell generation, see `algorithm.run`."""
+        key_ask, key_eval, key_tell = jax.random.split(key, 3)
+        population, state = self.time("ask", algorithm.ask, key_ask, state, params)
+        fitness, problem_state, _ = self.time(
+            "eval", problem.eval, key_eval, population, problem_state
+        )
+        state, metrics = self.time(
+            "tell", algorithm.tell, key_tell, population, fitness, state, params
+        )
+        return state, problem_state, metrics
+
+    def reset(self) -> None:
+        """Clear recorded times."""
+        self.times.clear()
+
+    def summary(self, skip_first: int = 1) -> dict[str, dict[str, float]]:
+        """Return total, mean and fraction of time per stage.
+
+        Args:
+            skip_first: Number of initial calls per stage to exclude, which include
+                compilation time.
+
+        """
+        totals = {
+            stage: (sum(times[skip_first:]), len(times[skip_first:]))
+            for stage, times in self.times.items()
+        }
+        total = sum(t for t, _ in totals.values()) or 1.0
+        return {
+            stage: {
+                "total": t,
+                "mean": t / max(count, 1),
+                "count": count,
+                "fraction": t / total,
+            }
+            for stage, (t, count) in totals.items()
+        }
+
+    def report(self, skip_first: int = 1) -> str:
+        """Return a table of the per-stage breakdown."""
+        lines = [f"{'stage':<12}{'count':>8}{'mean [ms]':>12}{'total [s]':>12}{'%':>8}"]
+        for stage, s in self.summary(skip_first).items():
+            lines.append(
+                f"{stage:<12}{s['count']:>8}{1e3 * s['mean']:>12.3f}"
+                f"{s['total']:>12.3f}{100 * s['fraction']:>8.1f}"
+            )
+        return "\n".join(lines)
@@ -1,11 +1,12 @@
 """Restart utilities for Evolution Strategies."""
 
+import jax
 import jax.numpy as jnp
 from flax import struct
 
 from evosax.types import Fitness, Params, Population, State
 
-from ..algorithms.distribution_based.cma_es import eigen_decomposition
+from .termination import TerminationParams, cma_criteria, configure_termination_fn
 
 
 @struct.dataclass
@@ -26,8 +27,8 @@ def generation_cond(
     restart_state: RestartState,
     restart_params: RestartParams,
 ) -> bool:
-    """Stop after a certain number of generations."""
-    return state.generation_counter >= restart_params.generation_threshold
+    """Stop after the run has lasted min_num_gens generations."""
+    return state.generation_counter >= restart_params.min_num_gens
 
 
 def spread_cond(
@@ -38,8 +39,8 @@ def spread_cond(
     restart_state: RestartState,
     restart_params: RestartParams,
 ) -> bool:
-    """Stop if fitness max minus fitness min is below threshold."""
-    return jnp.max(fitness) - jnp.min(fitness) < restart_params.fitness_spread_threshold
+    """Stop if fitness max minus fitness min is below threshold, ignoring NaN."""
+    return jnp.nanmax(fitness) - jnp.nanmin(fitness) < restart_params.min_fitness_spread
 
 
 def cma_cond(
@@ -52,44 +53,11 @@ def cma_cond(
 ) -> bool:
     """Stop if condition specific to CMA-ES is met.
 
-    Default tolerances:
-    tol_x: 1e-12 * sigma
-    tol_x_up: 1e4
-    tol_condition_C: 1e14
+    Reuses B and D stored in the state, see `evosax.core.termination` for the
+    criteria and their default tolerances.
     """
-    dC = jnp.diag(state.C)
-    C, B, D = eigen_decomposition(
-        state.C,
-        state.B,
-        state.D,
-    )
-
-    # Stop if std of normal distribution is smaller than tolx in all coordinates
-    # and pc is smaller than tolx in all components.
-    cond_s_1 = jnp.all(state.std * dC < restart_params.tol_x)
-    cond_s_2 = jnp.all(state.std * state.p_c < restart_params.tol_x)
-    cond_1 = jnp.logical_and(cond_s_1, cond_s_2)
-
-    # Stop if std diverges
-    cond_2 = state.std * jnp.max(D) > restart_params.tol_x_up
-
-    # Stop if adding 0.2 std does not change mean.
-    cond_no_coord_change = jnp.any(
-        state.mean == state.mean + (0.2 * state.std * jnp.sqrt(dC))
-    )
-    cond_3 = cond_no_coord_change
-
-    # Stop if adding 0.1 std in principal directions of C does not change mean.
-    cond_no_axis_change = jnp.all(
-        state.mean == state.mean + (0.1 * state.sigma * D[0] * B[:, 0])
-    )
-    cond_4 = cond_no_axis_change
-
-    # Stop if the condition number of the covariance matrix exceeds 1e14.
-    cond_condition_cov = jnp.max(D) / jnp.min(D) > restart_params.tol_condition_C
-    cond_5 = cond_condition_cov
-
-    return cond_1 | cond_2 | cond_3 | cond_4 | cond_5
+    termination_fn = configure_termination_fn(cma_criteria, TerminationParams())
+    return termination_fn(population, fitness, state, params)
 
 
 def amalgam_cond(
@@ -115,8 +83,9 @@ class IPOPRestartState(RestartState):
 class IPOPRestartParams(RestartParams):
     min_num_gens: int = 50
     min_fitness_spread: float = 1e-12
-    population_size_multiplier: int = 2
-    copy_mean: bool = False
+    copy_mean: bool = False  # Restart from the last mean instead of a uniform sample
+    mean_min: float | jax.Array = -5.0  # Bounds of the uniform sample of the mean
+    mean_max: float | jax.Array = 5.0
 
 
 @struct.dataclass
@@ -134,5 +103,6 @@ class BIPOPRestartState(RestartState):
 class BIPOPRestartParams(RestartParams):
     min_num_gens: int = 50
     min_fitness_spread: float = 1e-12
-    population_size_multiplier: int = 2
-    copy_mean: bool = False
+    copy_mean: bool = False  # Restart from the last mean instead of a uniform sample
+    mean_min: float | jax.Array = -5.0  # Bounds of the uniform sample of the mean
+    mean_max: float | jax.Array = 5.0
@@ -0,0 +1,38 @@
+"""Sharding utilities to split the population across devices.
+
+The population axis of `ask` outputs and `tell` inputs is sharded over a one-dimensional
+device mesh. Updates that reduce over the population, such as the weighted sums of the
+mean and covariance updates, are then computed locally on each device and only the
+reduced sufficient statistics are all-reduced.
+"""
+
+import jax
+from jax.sharding import Mesh, NamedSharding, PartitionSpec
+
+from evosax.types import PyTree
+
+
+def get_population_sharding(
+    axis_name: str = "population", devices: list | None = None
+) -> NamedSharding:
+    """Return sharding of the population axis over a one-dimensional device mesh.
+
+    Args:
+        axis_name: Name of the mesh axis.
+        devices: Devices of the mesh, defaults to all devices.
+
+    Returns:
+        NamedSharding: splitting the leading axis across devices.
+
+    """
+    if devices is None:
+        devices = jax.devices()
+    mesh = Mesh(devices, axis_names=(axis_name,))
+    return NamedSharding(mesh, PartitionSpec(axis_name))
+
+
+def shard_population(population: PyTree, sharding: NamedSharding) -> PyTree:
+    """Constrain the leading population axis of all leaves to sharding."""
+    return jax.tree.map(
+        lambda x: jax.lax.with_sharding_constraint(x, sharding), population
+    )
@@ -0,0 +1,279 @@
+"""Termination criteria for Evolution Strategies.
+
+Each criterion is a function `(population, fitness, state, params, termination_params)
+-> bool` evaluated after `tell`. Criteria read the step size, evolution paths and the B
+and D already stored in the state by CMA-ES variants, so no eigen decomposition is
+recomputed and each check costs O(num_dims) per generation. Criteria that do not apply
+to the state of an algorithm return False.
+
+Criteria on the fitness history require the algorithm to be constructed with
+`fitness_history_size`, so that `tell` keeps a rolling history of the best and median
+fitness on device.
+
+`configure_termination_fn` combines criteria into the `termination_fn` of `run_until`.
+
+[1] Hansen (2009). Benchmarking a BI-Population CMA-ES on the BBOB-2009 Function
+    Testbed. GECCO.
+[2] https://github.com/CMA-ES/pycma
+"""
+
+import math
+from collections.abc import Callable
+
+import jax
+import jax.numpy as jnp
+from flax import struct
+
+from evosax.types import Fitness, Params, Population, State
+
+
+@struct.dataclass
+class TerminationParams:
+    tol_fun: float = 1e-12
+    tol_fun_hist: float = 1e-12
+    tol_x: float = 1e-12
+    tol_x_up: float = 1e4
+    tol_up_sigma: float = 1e20
+    tol_condition_cov: float = 1e14
+
+
+def coordinate_std(state: State) -> jax.Array:
+    """Return the standard deviation of the search distribution in each coordinate."""
+    std = state.std * jnp.ones_like(state.mean)
+    C = getattr(state, "C", None)
+    if isinstance(C, jax.Array) and C.ndim == 2:
+        return std * jnp.sqrt(jnp.diag(C))
+    if isinstance(C, jax.Array) and C.ndim == 1:
+        return std * jnp.sqrt(C)
+    return std
+
+
+def tol_x_cond(
+    population: Population,
+    fitness: Fitness,
+    state: State,
+    params: Params,
+    termination_params: TerminationParams,
+) -> bool:
+    """Stop if the std in all coordinates and the evolution path are below tol_x."""
+    cond = jnp.all(coordinate_std(state) < termination_params.tol_x)
+    if hasattr(state, "p_c"):
+        cond &= jnp.all(state.std * jnp.abs(state.p_c) < termination_params.tol_x)
+    return cond
+
+
+def tol_x_up_cond(
+    population: Population,
+    fitness: Fitness,
+    state: State,
+    params: Params,
+    termination_params: TerminationParams,
+) -> bool:
+    """Stop if the std along a principal axis diverges above tol_x_up, TolXUp in [2]."""
+    return jnp.max(_principal_std(state)) > termination_params.tol_x_up
+
+
+def tol_up_sigma_cond(
+    population: Population,
+    fitness: Fitness,
+    state: State,
+    params: Params,
+    termination_params: TerminationParams,
+) -> bool:
+    """Stop if std / std_init exceeds tol_up_sigma * sqrt(max eigenvalue of C).
+
+    TolUpSigma in [1], signals a creeping behavior with a too small step size.
+    """
+    std_init = getattr(state, "std_init", None)
+    if std_init is None:
+        return jnp.array(False)
+    return jnp.max(state.std / std_init) > termination_params.tol_up_sigma * jnp.max(
+        _principal_std(state) / state.std
+    )
+
+
+def condition_cov_cond(
+    population: Population,
+    fitness: Fitness,
+    state: State,
+    params: Params,
+    termination_params: TerminationParams,
+) -> bool:
+    """Stop if the condition number of the covariance matrix exceeds threshold."""
+    D = _principal_std(state)
+    return jnp.square(jnp.max(D) / jnp.min(D)) > termination_params.tol_condition_cov
+
+
+def no_effect_axis_cond(
+    population: Population,
+    fitness: Fitness,
+    state: State,
+    params: Params,
+    termination_params: TerminationParams,
+) -> bool:
+    """Stop if adding 0.1 std along a principal axis does not change the mean.
+
+    One principal axis is checked per generation, cycling through all axes.
+    """
+    B = getattr(state, "B", None)
+    if not isinstance(B, jax.Array) or B.ndim != 2:
+        return jnp.array(False)
+    i = state.generation_counter % state.mean.shape[-1]
+    axis = state.D[i] * B[:, i]
+    return jnp.all(state.mean == state.mean + 0.1 * state.std * axis)
+
+
+def no_effect_coord_cond(
+    population: Population,
+    fitness: Fitness,
+    state: State,
+    params: Params,
+    termination_params: TerminationParams,
+) -> bool:
+    """Stop if adding 0.2 std in any coordinate does not change the mean."""
+    return jnp.any(state.mean == state.mean + 0.2 * coordinate_std(state))
+
+
+def tol_fun_cond(
+    population: Population,
+    fitness: Fitness,
+    state: State,
+    params: Params,
+    termination_params: TerminationParams,
+) -> bool:
+    """Stop if the range of the best fitness and of the generation is below tol_fun.
+
+    TolFun in [1], the best fitness of the last 10 + ceil(30 num_dims /
+    population_size) generations is used, so fitness_history_size must be at least
+    that long.
+    """
+    if state.best_fitness_history is None:
+        return jnp.array(False)
+    size = state.best_fitness_history.shape[0]
+    window = 10 + math.ceil(30 * state.mean.shape[-1] / fitness.shape[-1])
+    assert size >= window, (
+        f"tol_fun_cond requires fitness_history_size >= {window}, got {size}."
+    )
+
+    # Generation of each entry of the ring buffer, keep the last window generations
+    idx = jnp.arange(size)
+    last_generation = state.generation_counter - 1
+    generation = last_generation - (last_generation - idx) % size
+    history = jnp.where(
+        generation >= state.generation_counter - window,
+        state.best_fitness_history,
+        jnp.nan,
+    )
+    history = jnp.concatenate([history, fitness])
+    return (state.generation_counter >= window) & (
+        jnp.nanmax(history) - jnp.nanmin(history) < termination_params.tol_fun
+    )
+
+
+def tol_fun_hist_cond(
+    population: Population,
+    fitness: Fitness,
+    state: State,
+    params: Params,
+    termination_params: TerminationParams,
+) -> bool:
+    """Stop if the range of the best fitness history is below tol_fun_hist."""
+    if state.best_fitness_history is None:
+        return jnp.array(False)
+    history = state.best_fitness_history
+    return _history_full(state) & (
+        jnp.max(history) - jnp.min(history) < termination_params.tol_fun_hist
+    )
+
+
+def stagnation_cond(
+    population: Population,
+    fitness: Fitness,
+    state: State,
+    params: Params,
+    termination_params: TerminationParams,
+) -> bool:
+    """Stop if the best and median fitness stopped improving over the history.
+
+    Compares the median of the newest 20% of the history to the oldest 20%.
+    """
+    if state.best_fitness_history is None:
+        return jnp.array(False)
+    size = state.best_fitness_history.shape[0]
+    window = max(1, size // 5)
+
+    def stagnated(history):
+        # Oldest entry first
+        history = jnp.roll(history, -(state.generation_counter % size))
+        return jnp.median(history[-window:]) >= jnp.median(history[:window])
+
+    return (
+        _history_full(state)
+        & stagnated(state.best_fitness_history)
+        & stagnated(state.median_fitness_history)
+    )
+
+
+cma_criteria = (
+    tol_x_cond,
+    tol_x_up_cond,
+    tol_up_sigma_cond,
+    condition_cov_cond,
+    no_effect_axis_cond,
+    no_effect_coord_cond,
+)
+fitness_criteria = (tol_fun_cond, tol_fun_hist_cond, stagnation_cond)
+
+
+def check_termination(
+    population: Population,
+    fitness: Fitness,
+    state: State,
+    params: Params,
+    termination_params: TerminationParams,
+    criteria: tuple[Callable, ...] = cma_criteria + fitness_criteria,
+) -> dict[str, bool]:
+    """Evaluate criteria, return a dict from the name of each criterion to its value."""
+    return {
+        criterion.__name__: criterion(
+            population, fitness, state, params, termination_params
+        )
+        for criterion in criteria
+    }
+
+
+def configure_termination_fn(
+    criteria: tuple[Callable, ...] = cma_criteria + fitness_criteria,
+    termination_params: TerminationParams = TerminationParams(),
+) -> Callable:
+    """Combine criteria into a termination function for `run_until`.
+
+    Args:
+        criteria: Termination criteria, the run stops once any of them is met.
+        termination_params: Tolerances of the criteria.
+
+    Returns:
+        Function `(population, fitness, state, params) -> bool`.
+
+    """
+
+    def termination_fn(population, fitness, state, params):
+        done = check_termination(
+            population, fitness, state, params, termination_params, criteria
+        )
+        return jnp.any(jnp.array(list(done.values())))
+
+    return termination_fn
+
+
+def _principal_std(state: State) -> jax.Array:
+    """Return the std along the principal axes, reusing D of CMA-ES variants."""
+    D = getattr(state, "D", None)
+    if isinstance(D, jax.Array):
+        return state.std * D
+    return coordinate_std(state)
+
+
+def _history_full(state: State) -> bool:
+    """Return True once every entry of the fitness history is written."""
+    return state.generation_counter >= state.best_fitness_history.shape[0]
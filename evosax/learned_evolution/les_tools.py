@@ -1,9 +1,13 @@
 import functools
+import json
+import os
 import pickle
+from collections.abc import Mapping
 from typing import Any
 
 import jax
 import jax.numpy as jnp
+import numpy as np
 from flax import linen as nn
 
 from .fitness_shaping import (
@@ -24,6 +28,66 @@ def load_pkl_object(filename: Any, pkg_load: bool = False) -> Any:
     return obj
 
 
+def save_checkpoint(filename: str, ckpt: Mapping) -> None:
+    """Save nested mapping of arrays and JSON-serializable values to an npz file."""
+    arrays, config = {}, {}
+
+    def flatten(tree, prefix):
+        for k, v in tree.items():
+            if isinstance(v, Mapping):
+                flatten(v, f"{prefix}{k}/")
+            elif isinstance(v, np.ndarray | jax.Array):
+                arrays[f"{prefix}{k}"] = np.asarray(v)
+            else:
+                config[f"{prefix}{k}"] = v
+
+    flatten(ckpt, "")
+    np.savez(filename, __config__=np.array(json.dumps(config)), **arrays)
+
+
+def load_checkpoint(filename: str | os.PathLike) -> dict:
+    """Load checkpoint from an npz or pickle file, once per process.
+
+    Checkpoints are cached by filename, so all instances loading the same checkpoint
+    share the same arrays. Each call returns new dicts, and numpy arrays are returned
+    as read-only views, so callers cannot modify the cached checkpoint.
+    """
+    return jax.tree.map(_read_only, _load_checkpoint(str(filename)))
+
+
+def _read_only(x: Any) -> Any:
+    """Return a read-only view of numpy arrays, other leaves are unchanged."""
+    if not isinstance(x, np.ndarray):
+        return x
+    x = x.view()
+    x.flags.writeable = False
+    return x
+
+
+@functools.cache
+def _load_checkpoint(filename: str) -> dict:
+    """Load checkpoint from an npz or pickle file, cached by filename."""
+    if filename.endswith(".pkl"):
+        return load_pkl_object(filename)
+
+    ckpt = {}
+
+    def insert(key, value):
+        *parents, name = key.split("/")
+        node = ckpt
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[name] = value
+
+    with np.load(filename) as data:
+        for key in data.files:
+            if key != "__config__":
+                insert(key, jnp.asarray(data[key]))
+        for key, value in json.loads(str(data["__config__"])).items():
+            insert(key, value)
+    return ckpt
+
+
 def tanh_timestamp(x: jax.Array) -> jax.Array:
     """Timestamp embedding with evo-adapted timescales (Metz et al., 2022)."""
 
@@ -12,32 +12,49 @@ Each problem implements a common interface with `sample` and `eval` methods to s
 solutions from the search space and evaluate their fitness, respectively.
 """
 
-# BBOB
-from .bbob.bbob import BBOBProblem
-from .bbob.bbob_fns import bbob_fns
-from .bbob.meta_bbob import MetaBBOBProblem
-
-# Meta-Problem
-from .meta_problem import MetaProblem
-
-# Networks
-from .networks import (
-    CNN,
-    MLP,
-    categorical_output_fn,
-    identity_output_fn,
-    tanh_output_fn,
-)
+# ruff: noqa: F401
+
+from typing import TYPE_CHECKING
 
-# Problem
-from .problem import Problem
+from evosax.core.lazy import lazy_getattr
 
-# RL
-from .rl.brax import BraxProblem
-from .rl.gymnax import GymnaxProblem
+if TYPE_CHECKING:
+    from .bbob.bbob import BBOBProblem
+    from .bbob.bbob_fns import bbob_fns
+    from .bbob.meta_bbob import MetaBBOBProblem
+    from .host import HostProblem
+    from .meta_problem import MetaProblem
+    from .networks import (
+        CNN,
+        MLP,
+        categorical_output_fn,
+        identity_output_fn,
+        tanh_output_fn,
+    )
+    from .problem import Problem
+    from .rl.brax import BraxProblem
+    from .rl.gymnax import GymnaxProblem
+    from .vision.torchvision import TorchVisionProblem
 
-# Vision
-from .vision.torchvision import TorchVisionProblem
+__getattr__, __dir__ = lazy_getattr(
+    __name__,
+    {
+        "BBOBProblem": ".bbob.bbob",
+        "bbob_fns": ".bbob.bbob_fns",
+        "MetaBBOBProblem": ".bbob.meta_bbob",
+        "HostProblem": ".host",
+        "MetaProblem": ".meta_problem",
+        "CNN": ".networks",
+        "MLP": ".networks",
+        "categorical_output_fn": ".networks",
+        "identity_output_fn": ".networks",
+        "tanh_output_fn": ".networks",
+        "Problem": ".problem",
+        "BraxProblem": ".rl.brax",
+        "GymnaxProblem": ".rl.gymnax",
+        "TorchVisionProblem": ".vision.torchvision",
+    },
+)
 
 __all__ = [
     "Problem",
@@ -48,6 +65,7 @@ __all__ = [
     "GymnaxProblem",
     "BraxProblem",
     "TorchVisionProblem",
+    "HostProblem",
     "MLP",
     "CNN",
     "identity_output_fn",
@@ -8,8 +8,6 @@ from functools import partial
 
 import jax
 import jax.numpy as jnp
-import matplotlib.colors
-import matplotlib.pyplot as plt
 from evosax.types import Fitness, Metrics, Population, Solution
 from flax import struct
 
@@ -127,6 +125,9 @@ class BBOBProblem(Problem):
 
     def visualize_2d(self, key: jax.Array, *, ax=None, logscale=False):
         """Visualize optimization problem in 2D."""
+        import matplotlib.colors
+        import matplotlib.pyplot as plt
+
         assert self._num_dims == 2
 
         # Create a meshgrid for visualization
@@ -198,6 +199,8 @@ class BBOBProblem(Problem):
 
     def visualize_3d(self, key: jax.Array, *, ax=None, logscale=False):
         """Visualize optimization problem in 3D."""
+        import matplotlib.pyplot as plt
+
         assert self._num_dims == 2
 
         # Create a meshgrid for visualization
@@ -0,0 +1,156 @@
+"""Host Problem for non-JAX objectives.
+
+This module implements a problem class for objectives that cannot be traced by JAX, such
+as plain Python functions or simulators implemented as C extensions.
+
+The HostProblem class handles:
+- Transfer of the population to the host through `jax.pure_callback`
+- Batched dispatch of chunks of solutions to a thread or process pool
+- Ordering of the fitness values to match the population
+"""
+
+import concurrent.futures
+import multiprocessing
+import os
+from collections.abc import Callable
+from functools import partial
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+from flax import struct
+
+from evosax.types import Fitness, Metrics, Population, Solution
+
+from .problem import Problem, State
+
+
+@struct.dataclass
+class State(State):
+    pass
+
+
+class HostProblem(Problem):
+    """Problem evaluating a Python objective on the host with a worker pool."""
+
+    def __init__(
+        self,
+        fn: Callable,
+        solution: Solution,
+        x_range: tuple[float, float] = (-5.0, 5.0),
+        executor: str | concurrent.futures.Executor = "thread",
+        num_workers: int | None = None,
+        chunk_size: int | None = None,
+    ):
+        """Initialize the host problem.
+
+        Args:
+            fn: Objective taking a solution as a PyTree of NumPy arrays and returning
+                its fitness as a float. With a process pool, fn must be picklable,
+                i.e. defined at the top level of a module.
+            solution: Solution defining the structure of the search space.
+            x_range: Range of the search space used by `sample`.
+            executor: "thread", "process" or a `concurrent.futures.Executor`.
+            num_workers: Number of workers, defaults to the number of host cores.
+            chunk_size: Number of solutions per task, defaults to an even split of
+                the population over the workers.
+
+        """
+        assert isinstance(executor, concurrent.futures.Executor) or executor in (
+            "thread",
+            "process",
+        ), "executor must be 'thread', 'process' or a concurrent.futures.Executor."
+
+        self.fn = fn
+        self.solution = solution
+        self.x_range = x_range
+        self.num_workers = num_workers or os.cpu_count()
+        self.chunk_size = chunk_size
+
+        # Pools created by the problem are owned and shut down by close, an executor
+        # passed by the user is left running
+        self._executor_kind = executor
+        self._executor = (
+            executor if isinstance(executor, concurrent.futures.Executor) else None
+        )
+
+    @property
+    def executor(self) -> concurrent.futures.Executor:
+        """Worker pool, created on first use and after close."""
+        if self._executor is None:
+            if self._executor_kind == "thread":
+                self._executor = concurrent.futures.ThreadPoolExecutor(self.num_workers)
+            else:
+                # Forking a process running JAX can deadlock, so workers are spawned
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    self.num_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+        return self._executor
+
+    def close(self):
+        """Shut down the worker pool if it was created by the problem.
+
+        A later `eval` creates a new pool.
+        """
+        if self._executor is not None and self._executor is not self._executor_kind:
+            self._executor.shutdown()
+            self._executor = None
+
+    @partial(jax.jit, static_argnames=("self",))
+    def eval(
+        self,
+        key: jax.Array,
+        solutions: Population,
+        state: State,
+    ) -> tuple[Fitness, State, Metrics]:
+        """Evaluate a batch of solutions on the host."""
+        population_size = jax.tree.leaves(solutions)[0].shape[0]
+        fitness = jax.pure_callback(
+            self._eval_host,
+            jax.ShapeDtypeStruct((population_size,), jnp.float32),
+            solutions,
+            vmap_method="sequential",
+        )
+        return fitness, state.replace(counter=state.counter + 1), {}
+
+    def _eval_host(self, solutions: Population) -> np.ndarray:
+        """Dispatch chunks of solutions to the worker pool and gather fitness."""
+        population_size = jax.tree.leaves(solutions)[0].shape[0]
+
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            chunk_size = -(-population_size // self.num_workers)
+
+        chunks = [
+            jax.tree.map(lambda x: np.asarray(x[i : i + chunk_size]), solutions)
+            for i in range(0, population_size, chunk_size)
+        ]
+
+        # Executor.map yields results in the order of the chunks
+        results = self.executor.map(partial(_eval_chunk, self.fn), chunks)
+        return np.concatenate(list(results)).astype(np.float32)
+
+    @partial(jax.jit, static_argnames=("self",))
+    def sample(self, key: jax.Array) -> Solution:
+        """Sample a solution in the search space."""
+        leaves, treedef = jax.tree.flatten(self.solution)
+        keys = jax.random.split(key, len(leaves))
+        leaves = [
+            jax.random.uniform(
+                key,
+                shape=jnp.shape(x),
+                minval=self.x_range[0],
+                maxval=self.x_range[1],
+            )
+            for key, x in zip(keys, leaves)
+        ]
+        return jax.tree.unflatten(treedef, leaves)
+
+
+def _eval_chunk(fn: Callable, solutions: Population) -> np.ndarray:
+    """Evaluate a chunk of solutions one by one."""
+    chunk_size = jax.tree.leaves(solutions)[0].shape[0]
+    return np.array(
+        [fn(jax.tree.map(lambda x: x[i], solutions)) for i in range(chunk_size)],
+        dtype=np.float32,
+    )
@@ -0,0 +1,376 @@
+"""Tests for the base evolutionary algorithm API."""
+
+from functools import partial
+
+import jax
+import jax.numpy as jnp
+import pytest
+from evosax.algorithms import (
+    ARS,
+    CMA_ES,
+    CR_FM_NES,
+    ESMC,
+    MA_ES,
+    PGPE,
+    NoiseReuseES,
+    Open_ES,
+    Rm_ES,
+    Sep_CMA_ES,
+    SimpleGA,
+)
+from evosax.algorithms.base import configure_metrics_fn
+from evosax.algorithms.distribution_based.base import metrics_fn
+from evosax.core.fitness_shaping import centered_rank_fitness_shaping_fn
+
+
+def test_run(key, num_generations, population_size, bbob_problem):
+    """Test the compiled multi-generation run loop."""
+    solution = bbob_problem.sample(key)
+    algo = CMA_ES(population_size=population_size, solution=solution)
+    params = algo.default_params
+
+    key, key_init, key_problem, key_run = jax.random.split(key, 4)
+    state = algo.init(key_init, solution, params)
+    problem_state = bbob_problem.init(key_problem)
+
+    # Stacked metrics
+    final_state, _, metrics = algo.run(
+        key_run, state, params, bbob_problem, problem_state, num_generations
+    )
+    assert final_state.generation_counter == num_generations
+    assert metrics["best_fitness"].shape == (num_generations,)
+
+    # Metrics of last generation only
+    final_state_last, _, metrics_last = algo.run(
+        key_run,
+        state,
+        params,
+        bbob_problem,
+        problem_state,
+        num_generations,
+        stack_metrics=False,
+    )
+    assert metrics_last["best_fitness"].shape == ()
+    assert jnp.allclose(metrics_last["best_fitness"], metrics["best_fitness"][-1])
+    assert jnp.allclose(final_state_last.mean, final_state.mean)
+
+
+def test_run_until(key, population_size, bbob_problem):
+    """Test the compiled run loop with early termination."""
+    solution = bbob_problem.sample(key)
+    algo = CMA_ES(population_size=population_size, solution=solution)
+    params = algo.default_params
+
+    key, key_init, key_problem, key_run = jax.random.split(key, 4)
+    state = algo.init(key_init, solution, params)
+    problem_state = bbob_problem.init(key_problem)
+
+    def termination_fn(population, fitness, state, params):
+        return state.best_fitness < bbob_problem.f_opt + 1e-3
+
+    final_state, _, metrics = algo.run_until(
+        key_run, state, params, bbob_problem, problem_state, 1000, termination_fn
+    )
+    assert final_state.generation_counter < 1000
+    assert metrics["best_fitness"] < bbob_problem.f_opt + 1e-3
+
+
+def test_run_population_based(key, num_generations, population_size, bbob_problem):
+    """Test the compiled run loop for population-based algorithms."""
+    solution = bbob_problem.sample(key)
+    algo = SimpleGA(population_size=population_size, solution=solution)
+    params = algo.default_params
+
+    key, key_init, key_problem, key_run = jax.random.split(key, 4)
+    population = jax.vmap(bbob_problem.sample)(
+        jax.random.split(key_init, population_size)
+    )
+    problem_state = bbob_problem.init(key_problem)
+    fitness, problem_state, _ = bbob_problem.eval(key, population, problem_state)
+    state = algo.init(key_init, population, fitness, params)
+
+    final_state, _, metrics = algo.run(
+        key_run, state, params, bbob_problem, problem_state, num_generations
+    )
+    assert final_state.generation_counter == num_generations
+    assert metrics["best_fitness"].shape == (num_generations,)
+
+
+def test_archive(key, num_generations, population_size, bbob_problem):
+    """Test that the elite archive keeps the top-k distinct solutions."""
+    solution = bbob_problem.sample(key)
+    algo = SimpleGA(population_size=population_size, solution=solution, archive_size=4)
+    params = algo.default_params
+
+    key, key_init, key_problem, key_run = jax.random.split(key, 4)
+    population = jax.vmap(bbob_problem.sample)(
+        jax.random.split(key_init, population_size)
+    )
+    problem_state = bbob_problem.init(key_problem)
+    fitness, problem_state, _ = bbob_problem.eval(key, population, problem_state)
+
+    # Duplicate of the best member is archived once
+    population = population.at[1].set(population[jnp.argmin(fitness)])
+    fitness = fitness.at[1].set(jnp.min(fitness))
+    state = algo.init(key_init, population, fitness, params)
+    assert jnp.allclose(state.archive_fitness, jnp.unique(fitness)[:4])
+
+    state, _, _ = algo.run(
+        key_run, state, params, bbob_problem, problem_state, num_generations
+    )
+    archive_solution, archive_fitness = algo.get_archive(state)
+    assert archive_solution.shape == (4,) + solution.shape
+    assert archive_fitness[0] == state.best_fitness
+    assert jnp.all(jnp.diff(archive_fitness) > 0)
+
+
+def test_donated_ask_tell(key, population_size, bbob_problem):
+    """Test that donated ask and tell consume the input state."""
+    solution = bbob_problem.sample(key)
+    algo = CMA_ES(population_size=population_size, solution=solution)
+    params = algo.default_params
+
+    key, key_init, key_problem, key_ask, key_tell = jax.random.split(key, 5)
+    state = algo.init(key_init, solution, params)
+    problem_state = bbob_problem.init(key_problem)
+
+    population, state_ask = algo.donated_ask(key_ask, state, params)
+    assert state.C.is_deleted()
+
+    fitness, problem_state, _ = bbob_problem.eval(key_tell, population, problem_state)
+    state_tell, metrics = algo.donated_tell(
+        key_tell, population, fitness, state_ask, params
+    )
+    assert state_ask.C.is_deleted()
+    assert state_tell.generation_counter == 1
+    assert "best_fitness" in metrics
+
+
+def test_run_metrics_every(key, num_generations, population_size, bbob_problem):
+    """Test that run only stacks metrics of every N-th generation."""
+    solution = bbob_problem.sample(key)
+    algo = CMA_ES(population_size=population_size, solution=solution)
+    params = algo.default_params
+
+    key, key_init, key_problem, key_run = jax.random.split(key, 4)
+    state = algo.init(key_init, solution, params)
+    problem_state = bbob_problem.init(key_problem)
+
+    _, _, metrics = algo.run(
+        key_run, state, params, bbob_problem, problem_state, num_generations
+    )
+    _, _, metrics_every = algo.run(
+        key_run,
+        state,
+        params,
+        bbob_problem,
+        problem_state,
+        num_generations,
+        metrics_every=4,
+    )
+    assert metrics_every["best_fitness"].shape == (num_generations // 4,)
+    assert jnp.allclose(metrics_every["best_fitness"], metrics["best_fitness"][3::4])
+
+
+def test_configure_metrics_fn(key, num_generations, population_size, bbob_problem):
+    """Test metrics levels and decimation."""
+    solution = bbob_problem.sample(key)
+
+    key, key_init, key_problem, key_run = jax.random.split(key, 4)
+    problem_state = bbob_problem.init(key_problem)
+
+    # No metrics
+    algo = CMA_ES(
+        population_size=population_size,
+        solution=solution,
+        metrics_fn=configure_metrics_fn(metrics_fn, level="none"),
+    )
+    state = algo.init(key_init, solution, algo.default_params)
+    _, _, metrics = algo.run(
+        key_run, state, algo.default_params, bbob_problem, problem_state, 4
+    )
+    assert metrics == {}
+
+    # Scalar metrics every 4 generations
+    algo = CMA_ES(
+        population_size=population_size,
+        solution=solution,
+        metrics_fn=configure_metrics_fn(metrics_fn, level="scalars", every=4),
+    )
+    state = algo.init(key_init, solution, algo.default_params)
+    _, _, metrics = algo.run(
+        key_run,
+        state,
+        algo.default_params,
+        bbob_problem,
+        problem_state,
+        num_generations,
+    )
+    assert "best_solution" not in metrics
+    assert "mean" not in metrics
+    assert jnp.all(
+        metrics["generation_counter"][3::4] == jnp.arange(3, num_generations, 4)
+    )
+    assert jnp.all(metrics["best_fitness"][0::4] == 0.0)
+
+
+def test_precision_policy(key, num_generations, population_size, bbob_problem):
+    """Test that population and state are stored in the policy dtypes."""
+    solution = bbob_problem.sample(key)
+    algo = CMA_ES(
+        population_size=population_size,
+        solution=solution,
+        population_dtype=jnp.bfloat16,
+        state_dtype=jnp.float32,
+    )
+    params = algo.default_params
+
+    key, key_init, key_problem, key_ask, key_run = jax.random.split(key, 5)
+    state = algo.init(key_init, solution, params)
+    problem_state = bbob_problem.init(key_problem)
+
+    population, state = algo.ask(key_ask, state, params)
+    assert population.dtype == jnp.bfloat16
+    assert state.C.dtype == jnp.float32
+
+    state, _, metrics = algo.run(
+        key_run, state, params, bbob_problem, problem_state, num_generations
+    )
+    assert state.mean.dtype == jnp.float32
+    assert jnp.all(jnp.isfinite(metrics["best_fitness"]))
+
+
+def test_precision_policy_update(key, population_size, bbob_problem):
+    """Test that tell updates from the upcast population it is given."""
+    solution = bbob_problem.sample(key)
+    algo = CMA_ES(population_size=population_size, solution=solution)
+    algo_bf16 = CMA_ES(
+        population_size=population_size,
+        solution=solution,
+        population_dtype=jnp.bfloat16,
+    )
+    params = algo.default_params
+
+    state = algo.init(key, solution, params)
+    population_bf16, state_bf16 = algo_bf16.ask(key, state, params)
+    assert population_bf16.dtype == jnp.bfloat16
+
+    # A population repaired after ask is used for the update
+    population_bf16 = jnp.clip(population_bf16, -1.0, 1.0)
+    fitness, _, _ = bbob_problem.eval(key, population_bf16, bbob_problem.init(key))
+
+    state_bf16, _ = algo_bf16.tell(key, population_bf16, fitness, state_bf16, params)
+    state, _ = algo.tell(
+        key, population_bf16.astype(jnp.float32), fitness, state, params
+    )
+    assert state_bf16.mean.dtype == jnp.float32
+    assert jnp.allclose(state_bf16.mean, state.mean)
+    assert jnp.allclose(state_bf16.C, state.C)
+
+
+def test_precision_policy_per_leaf(key, population_size, bbob_problem):
+    """Test that state_dtype as a dict only casts the given state fields."""
+    solution = bbob_problem.sample(key)
+    algo = CMA_ES(
+        population_size=population_size,
+        solution=solution,
+        state_dtype={"C": jnp.bfloat16},
+    )
+    params = algo.default_params
+
+    state = algo.init(key, solution, params)
+    population, state = algo.ask(key, state, params)
+    assert state.C.dtype == jnp.bfloat16
+    assert state.mean.dtype == jnp.float32
+    assert state.p_c.dtype == jnp.float32
+
+
+def test_cost_report():
+    """Test that the cost report warns on O(num_dims^2) state."""
+    solution = jnp.zeros(64)
+
+    with pytest.warns(UserWarning, match="Sep_CMA_ES"):
+        report = CMA_ES(population_size=16, solution=solution).cost_report()
+    assert report["quadratic_state_leaves"] == [".C", ".B"]
+    assert report["state_leaves"][".C"] == 64 * 64 * 4
+    assert report["tell"]["flops"] > 0
+
+    report = Sep_CMA_ES(population_size=16, solution=solution).cost_report()
+    assert report["quadratic_state_leaves"] == []
+    assert report["state_bytes"] < 64 * 64 * 4
+
+    report = SimpleGA(population_size=16, solution=solution).cost_report()
+    assert report["state_leaves"][".population"] == 16 * 64 * 4
+
+    # Population leaves are not quadratic when population_size == num_dims
+    report = SimpleGA(population_size=64, solution=solution).cost_report()
+    assert report["quadratic_state_leaves"] == []
+    with pytest.warns(UserWarning, match="Sep_CMA_ES"):
+        report = MA_ES(population_size=64, solution=solution).cost_report()
+    assert report["quadratic_state_leaves"] == [".M"]
+
+
+@pytest.mark.parametrize(
+    "algorithm_cls",
+    [
+        CMA_ES,
+        Open_ES,
+        PGPE,
+        CR_FM_NES,
+        NoiseReuseES,
+        ESMC,
+        # Rm_ES ranks the sorted shaped fitness, which centered ranks keep distinct
+        pytest.param(
+            partial(Rm_ES, fitness_shaping_fn=centered_rank_fitness_shaping_fn),
+            id="Rm_ES",
+        ),
+    ],
+)
+def test_masked_params(algorithm_cls, key, population_size, bbob_problem):
+    """Test that masked members do not change the update of the active members."""
+    solution = bbob_problem.sample(key)
+    algo = algorithm_cls(population_size=population_size, solution=solution)
+    algo_max = algorithm_cls(population_size=4 * population_size, solution=solution)
+    params = algo.default_params
+    params_max = algo_max.get_masked_params(population_size)
+    assert jax.tree.map(jnp.shape, params_max) == jax.tree.map(
+        jnp.shape, algo_max.get_masked_params(2 * population_size)
+    )
+
+    state_max = algo_max.init(key, solution, params_max)
+    population_max, state_max = algo_max.ask(key, state_max, params_max)
+    fitness_max, _, _ = bbob_problem.eval(key, population_max, bbob_problem.init(key))
+
+    # Take the active members, and the state of the active members, e.g. noise, or
+    # the leading entries of other leaves, e.g. elites
+    active = algo_max.get_active_mask(params_max)
+    assert jnp.sum(active) == population_size
+    idx = jnp.flatnonzero(active, size=population_size)
+
+    def take_active(x, x_max):
+        if jnp.shape(x) == jnp.shape(x_max):
+            return x_max
+        if jnp.shape(x_max)[0] == algo_max.population_size:
+            return x_max[idx]
+        return x_max[: jnp.shape(x)[0]]
+
+    state = jax.tree.map(take_active, algo.init(key, solution, params), state_max)
+
+    # Inactive members are garbage
+    population_max = jnp.where(active[:, None], population_max, 1e6)
+    fitness_max = jnp.where(active, fitness_max, -1e6)
+
+    state, _ = algo.tell(key, population_max[idx], fitness_max[idx], state, params)
+    state_max, _ = algo_max.tell(
+        key, population_max, fitness_max, state_max, params_max
+    )
+    assert jnp.allclose(state.mean, state_max.mean, atol=1e-5)
+    assert jnp.allclose(state.std, state_max.std, atol=1e-5)
+    assert state.best_fitness == state_max.best_fitness
+
+
+def test_masked_params_unsupported(key):
+    """Test that algorithms whose update cannot mask members reject masked params."""
+    algo = ARS(population_size=16, solution=jnp.zeros(2))
+    with pytest.raises(AssertionError):
+        algo.get_masked_params(8)
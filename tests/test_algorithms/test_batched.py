@@ -0,0 +1,50 @@
+"""Tests for the batched evolutionary algorithm wrapper."""
+
+import jax
+import jax.numpy as jnp
+from evosax.algorithms import CMA_ES, BatchedAlgorithm
+
+
+def test_batched_algorithm(key, num_generations, population_size, bbob_problem):
+    """Test batched init, ask, tell and run over instances."""
+    num_instances = 4
+
+    solution = bbob_problem.sample(key)
+    algo = BatchedAlgorithm(
+        CMA_ES(population_size=population_size, solution=solution), num_instances
+    )
+
+    # Stack params with one std_init per instance
+    std_init = jnp.array([0.1, 0.5, 1.0, 2.0])
+    params = algo.stack_params(std_init=std_init)
+    assert params.std_init.shape == (num_instances,)
+    assert params.weights.shape == (num_instances, population_size)
+
+    key, subkey = jax.random.split(key)
+    state = algo.init(subkey, algo.stack(solution), params)
+    assert jnp.allclose(state.std, std_init)
+
+    key, subkey = jax.random.split(key)
+    problem_state = algo.stack(bbob_problem.init(subkey))
+
+    # Ask
+    key, key_ask, key_eval, key_tell = jax.random.split(key, 4)
+    population, state = algo.ask(key_ask, state, params)
+    assert population.shape == (num_instances, population_size, solution.shape[0])
+
+    # Eval
+    fitness, problem_state, _ = jax.vmap(bbob_problem.eval, in_axes=(None, 0, 0))(
+        key_eval, population, problem_state
+    )
+
+    # Tell
+    state, metrics = algo.tell(key_tell, population, fitness, state, params)
+    assert metrics["best_fitness"].shape == (num_instances,)
+
+    # Run
+    key, subkey = jax.random.split(key)
+    state, _, metrics = algo.run(
+        subkey, state, params, bbob_problem, problem_state, num_generations
+    )
+    assert metrics["best_fitness"].shape == (num_instances, num_generations)
+    assert jnp.all(state.generation_counter == num_generations + 1)
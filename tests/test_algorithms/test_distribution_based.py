@@ -2,6 +2,7 @@
 
 import jax
 import jax.numpy as jnp
+import pytest
 from evosax.algorithms.distribution_based import distribution_based_algorithms
 
 
@@ -201,3 +202,220 @@ def test_base_api(
     metrics = algo.metrics_fn(subkey, population, fitness, state, params)
     assert "best_fitness" in metrics
     assert "best_solution" in metrics
+
+
+@pytest.mark.parametrize(
+    "algorithm_name", ["Open_ES", "PGPE", "SNES", "SimpleES", "ESMC"]
+)
+def test_tell_from_key(algorithm_name, key, population_size, bbob_problem):
+    """Test that tell from ask key matches tell from population."""
+    AlgorithmClass = distribution_based_algorithms[algorithm_name]
+
+    solution = bbob_problem.sample(key)
+    algo = AlgorithmClass(
+        population_size=population_size, solution=solution, noise_chunk_size=3
+    )
+    params = algo.default_params
+
+    key, subkey = jax.random.split(key)
+    state = algo.init(subkey, solution, params)
+
+    key, subkey = jax.random.split(key)
+    problem_state = bbob_problem.init(subkey)
+
+    key, key_ask, key_eval, key_tell = jax.random.split(key, 4)
+    population, state = algo.ask(key_ask, state, params)
+    fitness, problem_state, _ = bbob_problem.eval(key_eval, population, problem_state)
+
+    state_population, _ = algo.tell(key_tell, population, fitness, state, params)
+    state_key, metrics = algo.tell_from_key(key_tell, key_ask, fitness, state, params)
+
+    assert jnp.allclose(state_key.mean, state_population.mean, atol=1e-5)
+    assert jnp.allclose(state_key.std, state_population.std, atol=1e-5)
+    assert jnp.allclose(state_key.best_solution, state_population.best_solution)
+    assert metrics["best_fitness"] == state_population.best_fitness
+
+
+def test_tell_from_key_population_shaping(key, population_size, bbob_problem):
+    """Test that tell_from_key rejects fitness shaping that uses the population."""
+    from evosax.core.fitness_shaping import (
+        add_weight_decay,
+        centered_rank_fitness_shaping_fn,
+    )
+
+    solution = bbob_problem.sample(key)
+    algo = distribution_based_algorithms["Open_ES"](
+        population_size=population_size,
+        solution=solution,
+        fitness_shaping_fn=add_weight_decay(centered_rank_fitness_shaping_fn),
+        noise_chunk_size=3,
+    )
+    params = algo.default_params
+    state = algo.init(key, solution, params)
+    fitness = jnp.zeros((population_size,))
+    with pytest.raises(AssertionError, match="add_weight_decay"):
+        algo.tell_from_key(key, key, fitness, state, params)
+
+
+def test_learned_checkpoint_cache(tmp_path, key, population_size, bbob_problem):
+    """Test that learned algorithms share cached checkpoints."""
+    from evosax.algorithms import LearnedES
+    from evosax.learned_evolution.les_tools import load_checkpoint, save_checkpoint
+
+    solution = bbob_problem.sample(key)
+    algo_1 = LearnedES(population_size=population_size, solution=solution)
+    algo_2 = LearnedES(population_size=population_size, solution=solution)
+    assert jax.tree.all(
+        jax.tree.map(lambda x, y: x is y, algo_1.les_params, algo_2.les_params)
+    )
+
+    # Save and reload checkpoint
+    path = str(tmp_path / "les.npz")
+    save_checkpoint(path, algo_1.les_params)
+    algo_3 = LearnedES(
+        population_size=population_size, solution=solution, params_path=path
+    )
+    assert jax.tree.all(
+        jax.tree.map(jnp.array_equal, algo_3.les_params, algo_1.les_params)
+    )
+
+    # Arrays are shared, containers are copied, and paths are accepted
+    ckpt = load_checkpoint(tmp_path / "les.npz")
+    assert jax.tree.all(jax.tree.map(lambda x, y: x is y, ckpt, algo_3.les_params))
+    ckpt.clear()
+    assert load_checkpoint(path).keys() == algo_3.les_params.keys()
+
+
+@pytest.mark.parametrize("algorithm_name", ["CMA_ES", "SV_CMA_ES"])
+def test_lazy_eigen_decomposition(algorithm_name, key, population_size):
+    """Test that lazy eigen decomposition only updates B and D when due."""
+    from evosax.problems import BBOBProblem
+
+    AlgorithmClass = distribution_based_algorithms[algorithm_name]
+    problem = BBOBProblem(fn_name="sphere", num_dims=100, seed=0)
+    solution = problem.sample(key)
+    if algorithm_name == "SV_CMA_ES":
+        algo = AlgorithmClass(
+            population_size=population_size,
+            num_populations=2,
+            solution=solution,
+            lazy_eigen_decomposition=True,
+        )
+        means = jnp.stack([solution, solution])
+    else:
+        algo = AlgorithmClass(
+            population_size=population_size,
+            solution=solution,
+            lazy_eigen_decomposition=True,
+        )
+        means = solution
+    params = algo.default_params
+    assert not algo._eigen_decomposition_due(1, params)
+
+    state = algo.init(key, means, params)
+    problem_state = problem.init(key)
+    state, _, _ = algo.run(key, state, params, problem, problem_state, 1)
+
+    # B is cached until the next update
+    population, state_ask = algo.ask(key, state, params)
+    assert jnp.array_equal(state_ask.B, state.B)
+    assert jnp.all(jnp.isfinite(population))
+
+
+def test_cholesky_cma_es_factor(key, num_generations, population_size, bbob_problem):
+    """Test that Cholesky-CMA-ES factors the covariance matrix of CMA-ES."""
+    from evosax.algorithms import CMA_ES, Cholesky_CMA_ES
+
+    solution = bbob_problem.sample(key)
+    algo = Cholesky_CMA_ES(population_size=population_size, solution=solution)
+    params = algo.default_params
+    state = algo.init(key, solution, params)
+    problem_state = bbob_problem.init(key)
+
+    # One generation on the same population and fitness updates C = A A^T alike
+    cma_es = CMA_ES(population_size=population_size, solution=solution)
+    cma_es_params = cma_es.default_params
+    _, cma_es_state = cma_es.ask(
+        key, cma_es.init(key, solution, cma_es_params), cma_es_params
+    )
+    population, state_ask = algo.ask(key, state, params)
+    fitness = jnp.sum(population**2, axis=-1)
+    state_tell, _ = algo.tell(key, population, fitness, state_ask, params)
+    cma_es_state, _ = cma_es.tell(key, population, fitness, cma_es_state, cma_es_params)
+    assert jnp.allclose(state_tell.A @ state_tell.A.T, cma_es_state.C, atol=1e-5)
+
+    state, _, _ = algo.run(
+        key, state, params, bbob_problem, problem_state, num_generations
+    )
+    assert jnp.allclose(state.A @ state.A_inv, jnp.eye(algo.num_dims), atol=1e-4)
+
+
+def test_vkd_cma_es_principal_vector(key, population_size):
+    """Test that VkD-CMA-ES learns the elongated direction of a quadratic."""
+    from evosax.algorithms import VkD_CMA_ES
+
+    num_dims = 20
+    v = jnp.ones(num_dims) / jnp.sqrt(num_dims)
+
+    def fitness_fn(x):
+        a = x @ v
+        return 100 * jnp.sum((x - a[:, None] * v) ** 2, axis=-1) + a**2
+
+    solution = jnp.full((num_dims,), 3.0)
+    algo = VkD_CMA_ES(population_size=population_size, solution=solution)
+    params = algo.default_params
+    state = algo.init(key, solution, params)
+
+    def step(state, key):
+        key_ask, key_tell = jax.random.split(key)
+        population, state = algo.ask(key_ask, state, params)
+        state, _ = algo.tell(
+            key_tell, population, fitness_fn(population), state, params
+        )
+        alignment = jnp.abs(state.V[:, 0] @ v)
+        return state, (state.rank, jnp.where(state.rank > 0, alignment, 0.0))
+
+    state, (ranks, alignments) = jax.lax.scan(step, state, jax.random.split(key, 600))
+    assert state.V.shape == (num_dims, algo.max_rank)
+
+    # Rank grows from 0 to model the elongated direction
+    assert ranks[0] == 0
+    assert jnp.max(ranks) >= 1
+    assert jnp.max(alignments) > 0.9
+    assert jnp.all(state.eigenvalues[state.rank :] == 0.0)
+    assert state.best_fitness < 1e-1
+
+
+def test_block_cma_es(key, num_generations, population_size):
+    """Test that block CMA-ES stacks blocks by size and follows groups."""
+    from evosax.algorithms import Block_CMA_ES
+
+    solution = {"a": jnp.zeros(3), "b": jnp.zeros(3), "c": jnp.zeros((2, 2))}
+
+    algo = Block_CMA_ES(population_size=population_size, solution=solution)
+    params = algo.default_params
+    state = algo.init(key, solution, params)
+    assert [C.shape for C in state.C] == [(2, 3, 3), (1, 4, 4)]
+
+    def fitness_fn(x):
+        return sum(
+            jnp.sum(jnp.square(leaf - 1), axis=(1, 2)[: leaf.ndim - 1])
+            for leaf in jax.tree.leaves(x)
+        )
+
+    for _ in range(num_generations):
+        key, key_ask, key_tell = jax.random.split(key, 3)
+        population, state = algo.ask(key_ask, state, params)
+        state, _ = algo.tell(
+            key_tell, population, fitness_fn(population), state, params
+        )
+    assert jnp.all(jnp.isfinite(state.mean))
+
+    # Leaves a and c share a block
+    algo = Block_CMA_ES(
+        population_size=population_size,
+        solution=solution,
+        groups={"a": 0, "b": 1, "c": 0},
+    )
+    state = algo.init(key, solution, algo.default_params)
+    assert [C.shape for C in state.C] == [(1, 3, 3), (1, 7, 7)]
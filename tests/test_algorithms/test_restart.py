@@ -0,0 +1,86 @@
+"""Tests for restart evolutionary algorithms."""
+
+import jax.numpy as jnp
+import pytest
+from evosax.algorithms import CMA_ES, Open_ES, RestartAlgorithm
+from evosax.core.restart import cma_cond, spread_cond
+
+
+@pytest.mark.parametrize("strategy", ["ipop", "bipop"])
+def test_restart_algorithm(strategy, key, population_size, bbob_problem):
+    """Test that restarts change the population size within one compiled run."""
+    solution = bbob_problem.sample(key)
+    algo = RestartAlgorithm(
+        CMA_ES(population_size=population_size, solution=solution),
+        max_population_size=4 * population_size,
+        strategy=strategy,
+    )
+    assert algo.population_sizes == (8, 16, 32)
+
+    # Population-sized params are padded with zero weights
+    params = algo.default_params
+    weights = params.algorithm_params.weights[0]
+    assert jnp.allclose(
+        weights[:population_size],
+        CMA_ES(
+            population_size=population_size, solution=solution
+        ).default_params.weights,
+    )
+    assert jnp.all(weights[population_size:] == 0.0)
+
+    # Restart every 4 generations
+    params = params.replace(
+        restart_params=params.restart_params.replace(
+            min_num_gens=4, min_fitness_spread=jnp.inf
+        )
+    )
+    state = algo.init(key, solution, params)
+    problem_state = bbob_problem.init(key)
+    state, _, metrics = algo.run(key, state, params, bbob_problem, problem_state, 16)
+
+    assert jnp.all(metrics["restart_counter"] == jnp.arange(16) // 4)
+    assert metrics["num_evaluations"][-1] == jnp.sum(metrics["active_population_size"])
+    if strategy == "ipop":
+        assert jnp.all(
+            metrics["active_population_size"] == jnp.array([8, 16, 32, 32]).repeat(4)
+        )
+    assert state.best_fitness == jnp.min(metrics["best_fitness"])
+
+
+def test_restart_mean(key, population_size, bbob_problem):
+    """Test that restarts sample a new mean within bounds, or copy the last mean."""
+    solution = bbob_problem.sample(key)
+    algo = RestartAlgorithm(
+        CMA_ES(population_size=population_size, solution=solution),
+        max_population_size=2 * population_size,
+    )
+    assert algo.restart_conds == (spread_cond, cma_cond)
+
+    params = algo.default_params
+    state = algo.init(key, solution, params)
+    state = state.replace(restart_state=state.restart_state.replace(restart_next=True))
+
+    for copy_mean in [False, True]:
+        restart_params = params.restart_params.replace(
+            copy_mean=copy_mean, mean_min=2.0, mean_max=3.0
+        )
+        _, new_state = algo.ask(
+            key, state, params.replace(restart_params=restart_params)
+        )
+        mean = new_state.algorithm_state.mean
+        assert new_state.restart_state.restart_counter == 1
+        if copy_mean:
+            assert jnp.allclose(mean, state.algorithm_state.mean)
+        else:
+            assert jnp.all((mean >= 2.0) & (mean <= 3.0))
+
+
+def test_bipop_std_schedule(key, population_size, bbob_problem):
+    """Test that BIPOP rejects algorithms that follow a std_schedule."""
+    solution = bbob_problem.sample(key)
+    with pytest.raises(AssertionError, match="std_schedule"):
+        RestartAlgorithm(
+            Open_ES(population_size=population_size, solution=solution),
+            max_population_size=2 * population_size,
+            strategy="bipop",
+        )
@@ -0,0 +1,120 @@
+"""Tests for steady-state evolutionary algorithms."""
+
+import jax
+import jax.numpy as jnp
+import pytest
+from evosax.algorithms import (
+    CMA_ES,
+    SNES,
+    DifferentialEvolution,
+    SteadyStateAlgorithm,
+)
+
+
+@pytest.mark.parametrize("algorithm_cls", [CMA_ES, SNES])
+@pytest.mark.parametrize("max_age", [None, 0])
+def test_steady_state_algorithm(
+    algorithm_cls, max_age, key, population_size, bbob_problem
+):
+    """Test that the algorithm is updated once enough results are evaluated."""
+    solution = bbob_problem.sample(key)
+    algo = SteadyStateAlgorithm(
+        algorithm_cls(population_size=population_size, solution=solution),
+        update_every=population_size // 2,
+        max_age=max_age,
+    )
+    params = algo.default_params
+
+    key, subkey = jax.random.split(key)
+    state = algo.init(subkey, solution, params)
+    problem_state = bbob_problem.init(key)
+
+    # Evaluate half of the candidates of each ask, the rest is late after the update
+    mask = jnp.arange(population_size) % 2 == 0
+    generation_counters = []
+    for _ in range(6):
+        key, key_ask, key_eval, key_tell = jax.random.split(key, 4)
+        population, state = algo.ask(key_ask, state, params)
+        generation = jnp.full((population_size,), algo.get_generation(state))
+        fitness, problem_state, _ = bbob_problem.eval(
+            key_eval, population, problem_state
+        )
+        state, metrics = algo.tell(
+            key_tell,
+            population,
+            jnp.where(mask, fitness, jnp.nan),
+            state,
+            params,
+            generation,
+        )
+        generation_counters.append(int(state.algorithm_state.generation_counter))
+
+        # Late candidates of the previous ask enter the window unless max_age is 0
+        state, _ = algo.tell(
+            key_tell,
+            population,
+            jnp.where(mask, jnp.nan, fitness),
+            state,
+            params,
+            generation,
+        )
+
+    if max_age is None:
+        assert generation_counters == [1, 3, 5, 7, 9, 11]
+    else:
+        assert generation_counters == [1, 2, 3, 4, 5, 6]
+    assert state.num_evaluated == 0
+    assert jnp.all(jnp.isfinite(state.algorithm_state.mean))
+
+
+@pytest.mark.parametrize("max_age", [None, 0])
+def test_steady_state_update(max_age, key, population_size, bbob_problem):
+    """Test that the update equals the algorithm update on the kept candidates."""
+    solution = bbob_problem.sample(key)
+    num_fresh = population_size // 2
+    algo = SteadyStateAlgorithm(
+        CMA_ES(population_size=population_size, solution=solution),
+        update_every=num_fresh,
+        max_age=max_age,
+    )
+    params = algo.default_params
+    state = algo.init(key, solution, params)
+
+    # Candidates asked from an earlier distribution are kept unless max_age is 0
+    key, key_ask, key_tell = jax.random.split(key, 3)
+    population, state = algo.ask(key_ask, state, params)
+    generation = jnp.arange(population_size) % 2 + algo.get_generation(state) - 1
+    fitness = jnp.sum(population**2, axis=-1)
+    new_state, _ = algo.tell(key_tell, population, fitness, state, params, generation)
+
+    idx = slice(None) if max_age is None else slice(1, None, 2)
+    es = CMA_ES(population_size=population[idx].shape[0], solution=solution)
+    es_params = es.default_params
+    es_state = es.init(key, solution, es_params)
+    es_state, _ = es.tell(key_tell, population[idx], fitness[idx], es_state, es_params)
+
+    assert new_state.algorithm_state.generation_counter == 1
+    assert jnp.allclose(new_state.algorithm_state.mean, es_state.mean, atol=1e-5)
+    assert jnp.allclose(new_state.algorithm_state.std, es_state.std, atol=1e-5)
+    assert jnp.allclose(new_state.algorithm_state.C, es_state.C, atol=1e-5)
+
+
+def test_differential_evolution_partial_tell(key, population_size, bbob_problem):
+    """Test that DE only replaces members with evaluated candidates."""
+    solution = bbob_problem.sample(key)
+    algo = DifferentialEvolution(population_size=population_size, solution=solution)
+    params = algo.default_params
+
+    key, subkey = jax.random.split(key)
+    population = jax.random.normal(subkey, (population_size, solution.shape[0]))
+    fitness = jnp.sum(population**2, axis=-1)
+    state = algo.init(key, population, fitness, params)
+
+    key, key_ask, key_tell = jax.random.split(key, 3)
+    trials, state = algo.ask(key_ask, state, params)
+    trial_fitness = jnp.full((population_size,), -jnp.inf).at[1::2].set(jnp.nan)
+    state, _ = algo.tell(key_tell, trials, trial_fitness, state, params)
+
+    assert jnp.allclose(state.population[::2], trials[::2])
+    assert jnp.allclose(state.population[1::2], population[1::2])
+    assert state.best_fitness == -jnp.inf
@@ -0,0 +1,76 @@
+"""Tests for asynchronous incremental checkpointing."""
+
+import gc
+import os
+import weakref
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+from evosax.algorithms import CMA_ES
+from evosax.core.checkpoint import Checkpointer
+
+
+def test_checkpointer(tmp_path, key, population_size, bbob_problem):
+    """Test that checkpoints restore states and only write changed leaves."""
+    solution = bbob_problem.sample(key)
+    es = CMA_ES(population_size=population_size, solution=solution)
+    params = es.default_params
+    state = es.init(key, solution, params)
+    problem_state = bbob_problem.init(key)
+
+    checkpointer = Checkpointer(tmp_path)
+    checkpointer.save(0, {"state": state, "params": params, "key": key})
+
+    state, _, _ = es.run(
+        key, state, params, bbob_problem, problem_state, num_generations=4
+    )
+    checkpointer.save(4, {"state": state, "params": params, "key": key})
+    checkpointer.close()
+
+    # Params, key and std_init did not change, so they point to the first checkpoint
+    num_leaves = len(jax.tree.leaves((state, params, key)))
+    num_unchanged_leaves = len(jax.tree.leaves(params)) + 2
+    assert len(os.listdir(tmp_path / "step_0")) == num_leaves
+    assert len(os.listdir(tmp_path / "step_4")) == num_leaves - num_unchanged_leaves
+
+    checkpointer = Checkpointer(tmp_path)
+    assert checkpointer.latest_step() == 4
+
+    target = jax.eval_shape(
+        lambda: {"state": es.init(key, solution, params), "params": params, "key": key}
+    )
+    restored = checkpointer.restore(target)
+    assert jnp.allclose(restored["state"].C, state.C)
+    assert restored["state"].generation_counter == 4
+    assert jnp.all(jax.random.key_data(restored["key"]) == jax.random.key_data(key))
+    assert jax.tree.structure(restored) == jax.tree.structure(target)
+
+    restored = checkpointer.restore(target, step=0)
+    assert restored["state"].generation_counter == 0
+
+
+def test_checkpointer_changed_leaves(tmp_path):
+    """Test that changes preserving sums and permutations of a leaf are written."""
+    checkpointer = Checkpointer(tmp_path)
+    x = jnp.zeros(65522)
+    leaves = [x.at[0].set(1.0), x.at[65521].set(1.0), x.at[65521].set(1.0)]
+    for step, leaf in enumerate(leaves):
+        checkpointer.save(step, {"x": leaf, "y": np.arange(3)})
+    checkpointer.close()
+
+    assert len(os.listdir(tmp_path / "step_1")) == 1
+    assert len(os.listdir(tmp_path / "step_2")) == 0
+    target = {"x": x, "y": np.arange(3)}
+    for step, leaf in enumerate(leaves):
+        assert jnp.all(checkpointer.restore(target, step=step)["x"] == leaf)
+
+    # Leaves of the previous checkpoint are not kept alive
+    leaf = jnp.ones(8)
+    checkpointer = Checkpointer(tmp_path / "ref")
+    checkpointer.save(0, {"x": leaf})
+    checkpointer.close()
+    leaf_ref = weakref.ref(leaf)
+    del leaf
+    gc.collect()
+    assert leaf_ref() is None
@@ -0,0 +1,50 @@
+"""Tests for ahead-of-time compilation utilities."""
+
+import subprocess
+import sys
+
+import jax
+from evosax.algorithms import CMA_ES
+from evosax.core.compilation import compile_algorithm
+
+
+def test_compile_algorithm(key, num_generations, population_size, bbob_problem):
+    """Test that compiled executables run the ask-eval-tell loop."""
+    solution = bbob_problem.sample(key)
+    algo = CMA_ES(population_size=population_size, solution=solution)
+    params = algo.default_params
+
+    compiled = compile_algorithm(
+        algo, bbob_problem, key, (solution,), params, num_generations=num_generations
+    )
+
+    key, key_init, key_problem, key_ask, key_eval, key_tell = jax.random.split(key, 6)
+    state = compiled.init(key_init, solution, params)
+    problem_state = bbob_problem.init(key_problem)
+
+    population, state = compiled.ask(key_ask, state, params)
+    fitness, problem_state, _ = compiled.eval(key_eval, population, problem_state)
+    state, metrics = compiled.tell(key_tell, population, fitness, state, params)
+    assert state.generation_counter == 1
+
+    state, _, metrics = compiled.run(key, state, params, problem_state)
+    assert metrics["best_fitness"].shape == (num_generations,)
+
+
+def test_enable_compilation_cache(tmp_path):
+    """Test that compiled executables are written to the cache directory."""
+    code = f"""
+import jax
+from evosax.algorithms import CMA_ES
+from evosax.core.compilation import compile_algorithm, enable_compilation_cache
+from evosax.problems import BBOBProblem
+
+enable_compilation_cache({str(tmp_path)!r})
+problem = BBOBProblem(fn_name="sphere", num_dims=2)
+key = jax.random.key(0)
+solution = problem.sample(key)
+algo = CMA_ES(population_size=8, solution=solution)
+compile_algorithm(algo, problem, key, (solution,), algo.default_params)
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+    assert any(tmp_path.iterdir())
@@ -11,6 +11,7 @@ from evosax.core.fitness_shaping import (
     standardize_fitness_shaping_fn,
     weights_fitness_shaping_fn,
 )
+from evosax.core.ordering import fitness_order
 
 
 def test_normalize():
@@ -115,6 +116,13 @@ def test_centered_rank_fitness_shaping_fn():
     expected = jnp.array([0.5, -0.5, 0.0])
     assert jnp.allclose(result, expected)
 
+    # A single active member is finite, masked members are zero
+    order = fitness_order(fitness.at[1:].set(jnp.nan), num_active=1)
+    result = centered_rank_fitness_shaping_fn(
+        population, fitness, state, params, order=order
+    )
+    assert jnp.allclose(result, jnp.array([-0.5, 0.0, 0.0]))
+
 
 def test_weights_fitness_shaping_fn():
     """Test the weights fitness shaping function."""
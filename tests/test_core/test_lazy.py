@@ -0,0 +1,30 @@
+"""Tests for lazy loading of algorithms and problems."""
+
+import subprocess
+import sys
+
+
+def test_lazy_import():
+    """Test that importing packages does not import algorithms or matplotlib."""
+    code = """
+import sys
+import evosax.algorithms
+import evosax.problems
+
+assert "matplotlib" not in sys.modules
+assert "evosax.algorithms.distribution_based.evotf_es" not in sys.modules
+assert "evosax.problems.bbob.bbob" not in sys.modules
+
+from evosax.algorithms import Open_ES, algorithms
+
+assert "evosax.algorithms.distribution_based.cma_es" not in sys.modules
+assert "CMA_ES" in algorithms and len(algorithms) == 39
+assert algorithms["Open_ES"] is Open_ES
+assert algorithms["LGA"].__name__ == "LearnedGA"
+assert "CMA_ES" in dir(evosax.algorithms)
+
+from evosax.problems import BBOBProblem
+
+assert "matplotlib" not in sys.modules
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
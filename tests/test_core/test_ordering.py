@@ -0,0 +1,72 @@
+"""Tests for the shared fitness ordering."""
+
+import jax
+import jax.numpy as jnp
+import pytest
+from evosax.algorithms import (
+    CR_FM_NES,
+    ESMC,
+    Open_ES,
+    iAMaLGaM_Full,
+    iAMaLGaM_Univariate,
+)
+from evosax.core.fitness_shaping import (
+    add_weight_decay,
+    centered_rank_fitness_shaping_fn,
+)
+from evosax.core.ordering import accepts_order, fitness_order
+
+
+def test_fitness_order():
+    """Test argsort, ranks and best index, with NaN ranked last."""
+    fitness = jnp.array([3.0, jnp.nan, 1.0, 2.0])
+    order = fitness_order(fitness)
+    assert jnp.all(order.argsort == jnp.array([2, 3, 0, 1]))
+    assert jnp.all(order.ranks == jnp.array([2, 3, 0, 1]))
+    assert order.best_idx == 2
+
+
+def test_fitness_order_ties():
+    """Test that ties share their mean rank, as in rankdata."""
+    fitness = jnp.array([1.0, 1.0, 1.0, 1.0, 0.0, 0.0])
+    order = fitness_order(fitness)
+    assert jnp.allclose(order.ranks, jax.scipy.stats.rankdata(fitness) - 1.0)
+
+    shaped = centered_rank_fitness_shaping_fn(None, fitness, None, None, order=order)
+    assert jnp.allclose(shaped, jnp.array([0.2, 0.2, 0.2, 0.2, -0.4, -0.4]))
+
+
+def test_flat_fitness(key, population_size):
+    """Test that Open_ES does not move its mean on a flat landscape."""
+    solution = jnp.zeros(8)
+    es = Open_ES(population_size=population_size, solution=solution)
+    params = es.default_params
+    state = es.init(key, solution, params)
+    population, state = es.ask(key, state, params)
+    fitness = jnp.ones(population_size)
+
+    state, _ = es.tell(key, population, fitness, state, params)
+    assert jnp.allclose(state.mean, solution)
+
+
+def test_accepts_order():
+    """Test that order is only passed to functions that take it."""
+    assert accepts_order(centered_rank_fitness_shaping_fn)
+    assert not accepts_order(add_weight_decay(centered_rank_fitness_shaping_fn))
+
+
+@pytest.mark.parametrize(
+    "algorithm_cls, num_sorts",
+    [(CR_FM_NES, 1), (iAMaLGaM_Full, 1), (iAMaLGaM_Univariate, 1), (ESMC, 0)],
+)
+def test_tell_sorts_once(algorithm_cls, num_sorts, key, population_size, bbob_problem):
+    """Test that tell sorts at most once, and only if a stage needs the order."""
+    solution = bbob_problem.sample(key)
+    es = algorithm_cls(population_size=population_size, solution=solution)
+    params = es.default_params
+    state = es.init(key, solution, params)
+    population, state = es.ask(key, state, params)
+    fitness = jnp.arange(population_size, dtype=jnp.float32)
+
+    tell = jax.jit(es.tell).lower(key, population, fitness, state, params).compile()
+    assert tell.as_text().count(" sort(") == num_sorts
@@ -0,0 +1,41 @@
+"""Tests for per-stage timing and profiler annotations."""
+
+import re
+
+import jax
+from evosax.algorithms import CMA_ES
+from evosax.core.profiling import StageTimer
+
+
+def test_stage_timer(key, population_size, bbob_problem):
+    """Test timed generations and named scopes of the stages."""
+    solution = bbob_problem.sample(key)
+    es = CMA_ES(population_size=population_size, solution=solution)
+    params = es.default_params
+    state = es.init(key, solution, params)
+    problem_state = bbob_problem.init(key)
+
+    timer = StageTimer(trace_annotations=True)
+    for _ in range(3):
+        key, subkey = jax.random.split(key)
+        state, problem_state, _ = timer.step(
+            es, bbob_problem, subkey, state, params, problem_state
+        )
+    assert state.generation_counter == 3
+
+    summary = timer.summary()
+    assert set(summary) == {"ask", "eval", "tell"}
+    assert all(s["count"] == 2 for s in summary.values())
+    assert abs(sum(s["fraction"] for s in summary.values()) - 1.0) < 1e-6
+    assert "tell" in timer.report()
+
+    # Stages are annotated with named scopes in the lowered program
+    hlo = (
+        type(es)
+        .run.lower(es, key, state, params, bbob_problem, problem_state, 2)
+        .as_text(debug_info=True)
+    )
+    # Scopes name the locations of their ops, e.g. "ask/dot_general", possibly
+    # nested under the scope of the enclosing jit
+    for scope in ["ask", "eval", "metrics", "shape", "tell"]:
+        assert re.search(rf'loc\("([^"]*/)?{scope}/', hlo)
@@ -0,0 +1,60 @@
+"""Tests for population sharding across devices."""
+
+import os
+import subprocess
+import sys
+
+
+def test_population_sharding():
+    """Test that sharded runs shard the population and match unsharded runs."""
+    code = """
+import jax
+import jax.numpy as jnp
+from evosax.algorithms import CMA_ES, SV_Open_ES, Open_ES
+from evosax.core.sharding import get_population_sharding
+from evosax.problems import BBOBProblem
+
+assert jax.device_count() == 4
+
+problem = BBOBProblem(fn_name="sphere", num_dims=4)
+key = jax.random.key(0)
+solution = problem.sample(key)
+
+for AlgorithmClass in [CMA_ES, Open_ES]:
+    means = []
+    for sharding in [None, get_population_sharding()]:
+        algo = AlgorithmClass(
+            population_size=16, solution=solution, population_sharding=sharding
+        )
+        params = algo.default_params
+        state = algo.init(key, solution, params)
+
+        population, _ = algo.ask(key, state, params)
+        if sharding is not None:
+            assert population.sharding.is_equivalent_to(sharding, population.ndim)
+
+        state, _, _ = algo.run(key, state, params, problem, problem.init(key), 8)
+        means.append(state.mean)
+
+    assert jnp.allclose(means[0], means[1], atol=1e-4)
+
+# Stein variational ES with 2 populations of 8 members
+results = []
+for sharding in [None, get_population_sharding()]:
+    algo = SV_Open_ES(
+        population_size=8,
+        num_populations=2,
+        solution=solution,
+        population_sharding=sharding,
+    )
+    params = algo.default_params
+    means = jnp.stack([solution, solution + 1.0])
+    state = algo.init(key, means, params)
+    state, _, _ = algo.run(key, state, params, problem, problem.init(key), 8)
+    results.append((state.mean, state.best_solution))
+
+assert jnp.allclose(results[0][0], results[1][0], atol=1e-4)
+assert jnp.allclose(results[0][1], results[1][1], atol=1e-4)
+"""
+    env = os.environ | {"XLA_FLAGS": "--xla_force_host_platform_device_count=4"}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
@@ -0,0 +1,102 @@
+"""Tests for termination criteria."""
+
+import jax
+import jax.numpy as jnp
+import pytest
+from evosax.algorithms import CMA_ES
+from evosax.core.restart import IPOPRestartParams, cma_cond
+from evosax.core.termination import (
+    TerminationParams,
+    check_termination,
+    configure_termination_fn,
+)
+
+
+def test_fitness_history(key, population_size, num_dims, bbob_problem):
+    """Test that criteria on the fitness history wait for the history to be full."""
+    solution = bbob_problem.sample(key)
+
+    # History of TolFun, 10 + ceil(30 * num_dims / population_size) generations
+    window = 10 + -(-30 * num_dims // population_size)
+    es = CMA_ES(
+        population_size=population_size,
+        solution=solution,
+        fitness_history_size=window,
+    )
+    params = es.default_params
+    state = es.init(key, solution, params)
+
+    fitness = jnp.ones(population_size).at[1].set(2.0)
+    for generation in range(window + 2):
+        population, state = es.ask(key, state, params)
+        state, _ = es.tell(key, population, fitness, state, params)
+        done = check_termination(
+            population, fitness, state, params, TerminationParams()
+        )
+        assert done["tol_fun_hist_cond"] == (generation >= window - 1)
+        assert done["stagnation_cond"] == (generation >= window - 1)
+        assert not done["tol_fun_cond"]
+
+        # Range of the generation is 0, only the history gates TolFun
+        done = check_termination(
+            population, jnp.ones(population_size), state, params, TerminationParams()
+        )
+        assert done["tol_fun_cond"] == (generation >= window - 1)
+
+    assert jnp.all(state.best_fitness_history == 1.0)
+    assert jnp.all(state.median_fitness_history == 1.0)
+
+    # TolFun requires a history of the full window
+    es = CMA_ES(
+        population_size=population_size,
+        solution=solution,
+        fitness_history_size=window - 1,
+    )
+    state = es.init(key, solution, params)
+    with pytest.raises(AssertionError, match="fitness_history_size"):
+        check_termination(population, fitness, state, params, TerminationParams())
+
+
+def test_tol_up_sigma(key, population_size, bbob_problem):
+    """Test that TolUpSigma compares the growth of std with the scale of C."""
+    solution = bbob_problem.sample(key)
+    es = CMA_ES(population_size=population_size, solution=solution)
+    params = es.default_params
+    state = es.init(key, solution, params)
+    population, _ = es.ask(key, state, params)
+    fitness = jnp.ones(population_size)
+    termination_params = TerminationParams(tol_up_sigma=10.0)
+
+    # std grew 100 times, C has a principal scale of 2 or 20
+    state = state.replace(std=100 * state.std_init, D=jnp.full_like(state.D, 2.0))
+    done = check_termination(population, fitness, state, params, termination_params)
+    assert done["tol_up_sigma_cond"]
+
+    state = state.replace(D=jnp.full_like(state.D, 20.0))
+    done = check_termination(population, fitness, state, params, termination_params)
+    assert not done["tol_up_sigma_cond"]
+
+
+def test_run_until_termination(key, bbob_problem):
+    """Test that termination gates run_until without eigen decomposition."""
+    solution = bbob_problem.sample(key)
+    es = CMA_ES(population_size=8, solution=solution, fitness_history_size=20)
+    params = es.default_params
+    state = es.init(key, solution, params)
+    problem_state = bbob_problem.init(key)
+
+    termination_fn = configure_termination_fn()
+    state, problem_state, _ = es.run_until(
+        key, state, params, bbob_problem, problem_state, 10_000, termination_fn
+    )
+    assert state.generation_counter < 10_000
+
+    population, _ = es.ask(key, state, params)
+    fitness, _, _ = bbob_problem.eval(key, population, problem_state)
+    assert termination_fn(population, fitness, state, params)
+    jaxpr = jax.make_jaxpr(termination_fn)(population, fitness, state, params)
+    assert "eigh" not in str(jaxpr)
+
+    # The restart condition of CMA-ES uses the same criteria
+    state = state.replace(std=1e8)
+    assert cma_cond(population, fitness, state, params, None, IPOPRestartParams())
@@ -0,0 +1,71 @@
+"""Tests for host problems."""
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+import pytest
+from evosax.problems import HostProblem
+
+
+def sphere(solution):
+    """Plain NumPy sphere objective."""
+    return float(np.sum(solution["x"] ** 2) + np.sum(solution["y"] ** 2))
+
+
+def test_host_problem_sample():
+    """Test host problem solution sampling."""
+    solution = {"x": jnp.zeros((3,)), "y": jnp.zeros((2, 2))}
+    problem = HostProblem(sphere, solution, x_range=(-1.0, 1.0))
+    assert problem.num_dims == 7
+
+    sample = problem.sample(jax.random.key(0))
+    assert sample["y"].shape == (2, 2)
+    assert jnp.all(jnp.abs(sample["x"]) <= 1.0)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_host_problem_eval(executor):
+    """Test host problem evaluation keeps the order of the population."""
+    key = jax.random.key(0)
+    solution = {"x": jnp.zeros((3,)), "y": jnp.zeros((2, 2))}
+    problem = HostProblem(sphere, solution, executor=executor, num_workers=2)
+
+    population_size = 7
+    population = jax.vmap(problem.sample)(jax.random.split(key, population_size))
+
+    state = problem.init(key)
+    fitness, state, _ = problem.eval(key, population, state)
+    problem.close()
+
+    expected = jnp.sum(population["x"] ** 2, axis=-1) + jnp.sum(
+        population["y"] ** 2, axis=(-2, -1)
+    )
+    assert fitness.shape == (population_size,)
+    assert jnp.allclose(fitness, expected, rtol=1e-5)
+    assert state.counter == 1
+
+
+def test_host_problem_close():
+    """Test that close keeps user executors and later evals recreate owned pools."""
+    import concurrent.futures
+
+    key = jax.random.key(0)
+    solution = {"x": jnp.zeros((3,)), "y": jnp.zeros((2, 2))}
+    population = jax.vmap(HostProblem(sphere, solution).sample)(
+        jax.random.split(key, 4)
+    )
+
+    with concurrent.futures.ThreadPoolExecutor(2) as user_executor:
+        for executor in ["thread", user_executor]:
+            problem = HostProblem(sphere, solution, executor=executor, num_workers=2)
+            state = problem.init(key)
+            fitness, state, _ = problem.eval(key, population, state)
+            problem.close()
+
+            # Eval after close
+            fitness_after_close, _, _ = problem.eval(key, population, state)
+            problem.close()
+            assert jnp.allclose(fitness, fitness_after_close)
+
+        # User executor is still running
+        assert user_executor.submit(sum, [1, 2]).result() == 3